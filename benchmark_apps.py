@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Scaling Benchmark for the App Generator
+
+Fabricates source folders of any size in the layout generate_app expects
+({dataset}_with_pagerank_{method}_bpe_{N}) and times each generator stage,
+so regressions show up as numbers instead of impressions. Stage timings
+come from the BuildResult returned by generate_app.
+
+Usage:
+    from benchmark_apps import make_synthetic_source, run_benchmark
+
+    # Create a 200-topic source folder
+    make_synthetic_source("/tmp/bench", topic_count=200, docs_per_topic=50)
+
+    # Time all stages for several model sizes
+    run_benchmark(topic_counts=(10, 50, 200))
+
+CLI Usage:
+    uv run python benchmark_apps.py
+    uv run python benchmark_apps.py --topics 50 200 500 --docs 100 --json results.json
+"""
+
+import io
+import csv
+import json
+import time
+import zlib
+import struct
+import random
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+import generate_apps as ga
+
+
+# Abstract-like filler used to build synthetic document texts
+FILLER_WORDS = (
+    "patients study results methods background conclusion analysis risk heart failure "
+    "nutrition diet cohort association mortality clinical trial outcomes data years "
+    "imaging score index model effect treatment group significant higher lower"
+).split()
+
+
+def write_png(path: Path, width: int, height: int, seed: int = 0, noise: float = 0.25):
+    """
+    Write an RGB PNG without any imaging library.
+
+    Each row holds random bytes over its first `noise` fraction and a flat
+    colour elsewhere, which gives file sizes in the range of real plots.
+
+    Args:
+        path: Output file
+        width: Image width in pixels
+        height: Image height in pixels
+        seed: Random seed for the pixel data
+        noise: Fraction of each row filled with random pixels (0-1)
+    """
+    rng = random.Random(seed)
+    noisy = int(width * noise) * 3
+    flat = bytes([240, 244, 248]) * (width - noisy // 3)
+
+    raw = bytearray()
+    for _ in range(height):
+        raw.append(0)  # filter type: none
+        raw += rng.randbytes(noisy)
+        raw += flat
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(bytes(raw), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def make_violin_html(topic_count: int, samples_per_topic: int, rng: random.Random) -> str:
+    """Build a violin page with the same structure as create_interactive_violin.py output."""
+    topics = {}
+    for topic in range(1, topic_count + 1):
+        center = rng.uniform(2005, 2022)
+        years = sorted(
+            min(2025.75, max(2000.0, round(rng.gauss(center, 4) * 4) / 4))
+            for _ in range(samples_per_topic)
+        )
+        topics[str(topic)] = {
+            "periods": [f"{int(y)}Q{int((y % 1) * 4) + 1}" for y in years],
+            "years": years,
+            "quarters": [f"Q{int((y % 1) * 4) + 1}" for y in years],
+        }
+    data = {
+        "topics": topics,
+        "metadata": {"min_year": 2000, "max_year": 2025, "total_periods": 104,
+                     "total_topics": topic_count, "data_source": "quarterly_csv"},
+    }
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Topic Distribution by Year - Interactive Violin Plot</title>
+    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+</head>
+<body>
+    <div id="controls"><div id="topic-checkboxes"></div>
+    <span id="total-topics"></span><span id="selected-count"></span></div>
+    <div id="violin-plot"></div>
+    <script>
+        // ===== EMBEDDED DATA =====
+        const VIOLIN_DATA = {json.dumps(data, indent=2)};
+        // ===== END EMBEDDED DATA =====
+    </script>
+    <script>
+        function initializeControls() {{
+            if (typeof VIOLIN_DATA === 'undefined') return;
+            document.getElementById('total-topics').textContent = Object.keys(VIOLIN_DATA.topics).length;
+        }}
+
+        // Initialize when page loads
+        window.onload = function() {{
+            initializeControls();
+        }};
+    </script>
+</body>
+</html>
+'''
+
+
+def make_synthetic_source(dest_dir: str, dataset: str = "synthetic", method: str = "nmtf",
+                          topic_count: int = 50, docs_per_topic: int = 20,
+                          words_per_topic: int = 30, vocabulary_size: int = None,
+                          doc_words: int = 250, periods: int = 104,
+                          samples_per_topic: int = 500, image_size: tuple = (1600, 1200),
+                          wordcloud_size: tuple = (600, 400), seed: int = 0) -> Path:
+    """
+    Fabricate a valid source folder for generate_app.
+
+    Produces every artifact a real model run leaves behind: relevance words with
+    gensim coherence, top docs, the quarterly CSV, the overview/temporal PNGs,
+    one wordcloud PNG per topic, the interactive violin page and the md topic
+    descriptions.
+
+    Args:
+        dest_dir: Directory in which the source folder is created
+        dataset: Dataset part of the folder name
+        method: 'nmtf' or 'pnmf'
+        topic_count: Number of topics
+        docs_per_topic: Top documents per topic
+        words_per_topic: Relevance words per topic
+        vocabulary_size: Shared vocabulary size (default: 10 words per topic),
+            smaller values make topics overlap more
+        doc_words: Words per synthetic abstract
+        periods: Number of quarters in the temporal CSV
+        samples_per_topic: Documents per topic in the violin plot
+        image_size: (width, height) of the overview/temporal PNGs
+        wordcloud_size: (width, height) of the wordcloud PNGs
+        seed: Random seed
+
+    Returns:
+        Path to the created source folder
+    """
+    rng = random.Random(seed)
+    prefix = f"{dataset}_with_pagerank_{method}_bpe_{topic_count}"
+    folder = Path(dest_dir) / prefix
+    (folder / "wordclouds").mkdir(parents=True, exist_ok=True)
+
+    vocabulary = [f"term{i:05d}" for i in range(vocabulary_size or topic_count * 10)]
+
+    # Relevance words and coherence scores
+    relevance = {}
+    for topic in range(1, topic_count + 1):
+        words = rng.sample(vocabulary, min(words_per_topic, len(vocabulary)))
+        scores = sorted((rng.uniform(0.01, 1.0) for _ in words), reverse=True)
+        relevance[f"topic_{topic:02d}"] = dict(zip(words, scores))
+    c_v = {key: rng.uniform(0.4, 0.95) for key in relevance}
+    u_mass = {key: rng.uniform(-4.0, -1.0) for key in relevance}
+    coherence = {
+        "relevance": relevance,
+        "gensim": {
+            "c_v_average": sum(c_v.values()) / topic_count,
+            "c_v_per_topic": c_v,
+            "u_mass_average": sum(u_mass.values()) / topic_count,
+            "u_mass_per_topic": u_mass,
+        },
+    }
+    (folder / f"{prefix}_relevance_top_words.json").write_text(json.dumps(coherence))
+
+    # Top documents ("text:score" strings)
+    top_docs = {}
+    doc_id = 0
+    for topic in range(1, topic_count + 1):
+        topic_words = list(relevance[f"topic_{topic:02d}"])
+        docs = {}
+        for _ in range(docs_per_topic):
+            doc_id += 1
+            words = [rng.choice(topic_words if rng.random() < 0.2 else FILLER_WORDS) for _ in range(doc_words)]
+            docs[str(doc_id)] = f"BACKGROUND: {' '.join(words)}.:{rng.uniform(0.01, 0.1)}"
+        top_docs[f"Topic {topic}"] = docs
+    (folder / f"{prefix}_top_docs.json").write_text(json.dumps(top_docs))
+
+    # Quarterly temporal distribution
+    with open(folder / f"{prefix}_temporal_topic_dist_quarter.csv", 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["period"] + [f"Topic {t}" for t in range(1, topic_count + 1)])
+        for i in range(periods):
+            period = f"{2000 + i // 4}Q{i % 4 + 1}"
+            writer.writerow([period] + [repr(rng.uniform(0, 5)) for _ in range(topic_count)])
+
+    # Overview and temporal images
+    width, height = image_size
+    for i, name in enumerate(["document_dist", "temporal_topic_dist_quarter_line",
+                              "temporal_topic_dist_quarter_stacked_area", "topic_distribution_by_year",
+                              "tsne_visualization", "umap_visualization"]):
+        write_png(folder / f"{prefix}_{name}.png", width, height, seed=seed + i)
+
+    # Wordclouds
+    wc_width, wc_height = wordcloud_size
+    for topic in range(1, topic_count + 1):
+        write_png(folder / "wordclouds" / f"Topic {topic:02d}.png", wc_width, wc_height, seed=seed + 100 + topic)
+
+    # Violin plot
+    (folder / f"{prefix}_violin_interactive.html").write_text(
+        make_violin_html(topic_count, samples_per_topic, rng)
+    )
+
+    # Topic descriptions
+    lines = [f"{t}. **Topic {t:02d}:** Synthetic label {' '.join(list(relevance[f'topic_{t:02d}'])[:3])}"
+             for t in range(1, topic_count + 1)]
+    (folder / f"{dataset}_{method}_{topic_count}.md").write_text('\n'.join(lines) + '\n')
+
+    return folder
+
+
+def directory_bytes(path: Path) -> dict:
+    """
+    Sum file sizes in a generated app by category.
+
+    Returns:
+        Dict with 'total' plus one entry per category (html, js, css, json, images, other)
+    """
+    categories = {".html": "html", ".js": "js", ".css": "css", ".json": "json",
+                  ".png": "images", ".webp": "images", ".avif": "images", ".svg": "images"}
+    sizes = {"total": 0}
+    for file in path.rglob("*"):
+        if file.is_file() and not file.is_symlink() and file.name != ga.MANIFEST_NAME:
+            size = file.stat().st_size
+            category = categories.get(file.suffix, "other")
+            sizes[category] = sizes.get(category, 0) + size
+            sizes["total"] += size
+    return sizes
+
+
+def timed(fn, *args, **kwargs) -> tuple:
+    """Call fn and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_source(source: Path, output_dir: Path, **options) -> dict:
+    """
+    Time the generator stages for one source folder.
+
+    The full build runs cold (empty output directory) and warm (rerun over the
+    unchanged source, which the build manifest should make nearly free); the
+    per-stage numbers come from the BuildResult that generate_app returns.
+
+    Args:
+        source: Source folder (see make_synthetic_source)
+        output_dir: Where to generate the app
+        **options: Keyword arguments forwarded to generate_app
+
+    Returns:
+        Dict with 'stages' (cold seconds per stage), 'warm_stages', 'build'
+        (cold/warm seconds), 'io' (cold build counters) and 'bytes'
+        (directory_bytes of the generated app)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold = ga.generate_app(str(source), output_dir=str(output_dir), **options)
+        warm = ga.generate_app(str(source), output_dir=str(output_dir), **options)
+
+    return {
+        "topic_count": ga.parse_folder_name(source.name)["topic_count"],
+        "stages": {stage["name"]: stage["duration"] for stage in cold.stages},
+        "warm_stages": {stage["name"]: stage["duration"] for stage in warm.stages},
+        "build": {"cold": cold.wall_time, "warm": warm.wall_time},
+        "io": cold.totals,
+        "bytes": directory_bytes(output_dir),
+    }
+
+
+def run_benchmark(topic_counts: tuple = (10, 50, 200), docs_per_topic: int = 20,
+                  workdir: str = None, **options) -> list:
+    """
+    Benchmark the generator over several synthetic model sizes.
+
+    Args:
+        topic_counts: Model sizes to fabricate and build
+        docs_per_topic: Top documents per topic
+        workdir: Directory for sources and outputs (a temporary one if not given)
+        **options: Keyword arguments forwarded to generate_app
+
+    Returns:
+        List of per-size results (see benchmark_source)
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(workdir or tmp)
+        for topic_count in topic_counts:
+            source, made = timed(make_synthetic_source, root / "sources",
+                                 topic_count=topic_count, docs_per_topic=docs_per_topic)
+            result = benchmark_source(source, root / "apps" / source.name, **options)
+            result["fabricate"] = made
+            results.append(result)
+            print_result(result)
+    return results
+
+
+def print_result(result: dict):
+    """Print one benchmark result as a small table."""
+    print(f"\n{'='*60}")
+    print(f"{result['topic_count']} topics")
+    print('='*60)
+    print(f"  {'stage':<20} {'cold':>10}    {'warm':>10}")
+    for stage, seconds in result["stages"].items():
+        warm = result["warm_stages"].get(stage, 0.0)
+        print(f"  {stage:<20} {seconds * 1000:>10.1f} ms {warm * 1000:>10.1f} ms")
+    print(f"  {'build':<20} {result['build']['cold'] * 1000:>10.1f} ms {result['build']['warm'] * 1000:>10.1f} ms")
+    print("  Cold build I/O:")
+    for counter, value in result["io"].items():
+        print(f"    {counter:<18} {value:>12,}")
+    print("  Output bytes:")
+    for category, size in sorted(result["bytes"].items()):
+        print(f"    {category:<18} {size:>12,}")
+
+
+def main(argv: list = None):
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Benchmark the topic app generator on synthetic data")
+    parser.add_argument("--topics", type=int, nargs="+", default=[10, 50, 200],
+                        help="Topic counts to benchmark (default: 10 50 200)")
+    parser.add_argument("--docs", type=int, default=20,
+                        help="Top documents per topic (default: 20)")
+    parser.add_argument("--workdir", help="Keep sources and outputs in this directory")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(tuple(args.topics), args.docs, args.workdir)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -18,22 +18,228 @@ Usage:
     # Generate all apps from to_generate_from folder
     generate_all_apps()
 
+    # Build several apps concurrently in a process pool
+    generate_all_apps(workers=4)
+
+    # Rebuild everything, ignoring the incremental build manifest
+    generate_app("to_generate_from/source_folder", force=True)
+
+    # Hardlink images/data into the app instead of copying them
+    generate_app("to_generate_from/source_folder", asset_mode="hardlink")
+
+    # Also emit resized WebP/AVIF variants of every image (needs Pillow)
+    generate_app("to_generate_from/source_folder", optimize_images=True)
+
+    # Write .gz/.br siblings of every text output for static servers
+    generate_app("to_generate_from/source_folder", precompress=True)
+
+    # Ship the violin plot samples as per-value counts instead of raw samples
+    generate_app("to_generate_from/source_folder", violin_summary=True)
+
+    # Cache the app in the browser for instant repeat and offline visits
+    generate_app("to_generate_from/source_folder", service_worker=True)
+
+    # Lay out SVG wordclouds from the relevance scores instead of copying PNGs
+    generate_app("to_generate_from/source_folder", wordcloud_format="svg")
+
+    # Keep the generated HTML/CSS/JS readable (minified by default)
+    generate_app("to_generate_from/source_folder", minify=False)
+
+    # Share content-hashed CSS/JS across all apps from a site-level assets/ directory
+    generate_all_apps(shared_assets="assets")
+
+    # Serve Chart.js/ECharts/plotly.js from local copies instead of CDNs (offline)
+    generate_all_apps(shared_assets="assets", vendor_dir="vendor")
+
+    # generate_app returns a BuildResult, not the output path as a str:
+    # use result.path (or str(result), os.fspath(result)) where a path is needed
+    result = generate_app("to_generate_from/source_folder")
+    output_dir = str(result)
+
+    # Inspect per-stage timings and write a trace for chrome://tracing / Perfetto
+    print(result.path, result.wall_time, result.stages)
+    generate_all_apps(trace_path="build-trace.json")
+
+    # Rebuild only the affected app whenever a source file changes
+    watch_apps(interval=1.0)
+
 CLI Usage:
     uv run python generate_apps.py
+    uv run python generate_apps.py --workers 4
+    uv run python generate_apps.py --force
+    uv run python generate_apps.py --asset-mode reflink
+    uv run python generate_apps.py --optimize-images
+    uv run python generate_apps.py --precompress
+    uv run python generate_apps.py --violin-summary
+    uv run python generate_apps.py --trace build-trace.json
+    uv run python generate_apps.py --shared-assets
+    uv run python generate_apps.py --shared-assets --vendor-dir vendor
+    uv run python generate_apps.py --watch
+    uv run python generate_apps.py --debug
+    uv run python generate_apps.py --service-worker
+    uv run python generate_apps.py --no-wordcloud-atlas
+    uv run python generate_apps.py --wordclouds svg
 """
 
 import os
 import re
+import io
 import json
 import shutil
 import csv
+import gzip
+import errno
+import hashlib
+import time
+import argparse
+import math
+import contextlib
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote, unquote
+from html import escape as html_escape
+
+try:
+    from PIL import Image, features as pil_features
+except ImportError:  # Pillow is only needed for optimize_images
+    Image = None
+
+try:
+    import brotli
+except ImportError:  # brotli is only needed for .br files when precompressing
+    brotli = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for cross-model topic alignment
+    np = None
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # optional, match_topics falls back to its own Hungarian solver
+    linear_sum_assignment = None
 
 
 # Base directory
 BASE_DIR = Path(__file__).parent
 
+# Recorded in every build manifest; a different version forces a full rebuild
+GENERATOR_VERSION = "2.0"
+
+# Per-app build manifest, written into each output directory
+MANIFEST_NAME = ".build_manifest.json"
+
+# How source assets (images, data files, violin plot) are placed in an app
+ASSET_MODES = ("copy", "hardlink", "reflink", "symlink")
+
+# Linux ioctl request for cloning a file's extents (btrfs, xfs, bcachefs, ...)
+FICLONE = 0x40049409
+
+# Outputs that get .gz/.br siblings when precompressing
+TEXT_EXTENSIONS = {".html", ".css", ".js", ".json", ".md", ".svg", ".txt"}
+
+# Site-level directory (next to the apps) for content-hashed CSS/JS shared by all apps
+SHARED_ASSETS_DIR = BASE_DIR / "assets"
+
+# Record of the hashed files each app uses, kept in the shared asset directory
+SHARED_ASSETS_LEDGER = ".live.json"
+
+# Cache-Control for content-hashed files: their URL changes whenever their content does
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Stylesheet classes only used by the Topic Descriptions tab (pruned from apps
+# without a descriptions .md when minifying). The violin section has no
+# classes of its own: it reuses .graph-container/.open-fullscreen of the graph tab.
+DESCRIPTION_CSS_CLASSES = ("topic-label", "descriptions-list", "description-item",
+                           "description-num", "description-label")
+
+# Encoded image variants, shared by all apps and keyed by source content hash
+IMAGE_CACHE_DIR = BASE_DIR / ".cache" / "images"
+
+# Significant digits kept for the temporal topic weights
+TEMPORAL_PRECISION = 6
+
+# Single plotly.js build referenced by every violin page, so browsers cache it once
+PLOTLY_SRC = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+
+# Chart library builds loaded by index.html and topic-graph.html
+CHARTJS_SRC = "https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js"
+ECHARTS_SRC = "https://cdn.jsdelivr.net/npm/echarts@5.4.3/dist/echarts.min.js"
+
+# File expected in the vendor directory for each library URL when vendoring
+VENDOR_BUNDLES = {
+    CHARTJS_SRC: "chart.js-4.4.1.umd.min.js",
+    ECHARTS_SRC: "echarts-5.4.3.min.js",
+    PLOTLY_SRC: "plotly-2.27.0.min.js",
+}
+
+# Decimals kept for the violin plot sample values (years with quarter fractions)
+VIOLIN_PRECISION = 2
+
+# Words kept in the precomputed document preview shown on document cards
+DOCUMENT_PREVIEW_WORDS = 100
+
+# Top words per topic kept in summary.json (what the Overview and the cards show)
+SUMMARY_TOP_WORDS = 5
+
+# Target size of a document search index shard, so a query fetches a few KB
+SEARCH_SHARD_BYTES = 16 * 1024
+
+# Words too common to be worth indexing (they would match nearly every document)
+SEARCH_STOPWORDS = frozenset("""
+    a an and are as at be been but by can could did do does for from had has have
+    he her his i if in into is it its may me might more most my no not of on or our
+    she should so such than that the their them then there these they this those to
+    up us was we were what when where which while who will with would you your
+""".split())
+
+# Widths of the resized variants (never upscaled past the source width)
+IMAGE_VARIANT_WIDTHS = (640, 1280)
+WORDCLOUD_THUMB_WIDTHS = (300,)
+
+# Wordcloud sprite atlases for the topics grid: tile size in pixels (about twice
+# the card's display size), tiles per atlas row and tiles per atlas image
+WORDCLOUD_TILE_SIZE = (360, 240)
+WORDCLOUD_ATLAS_COLUMNS = 4
+WORDCLOUD_ATLAS_TILES = 24
+
+# Offsets of every topic's tile in the atlases (also embedded in app.js)
+WORDCLOUD_ATLAS_MAP = "data/wordcloud_atlas.json"
+
+# Where the wordclouds come from: 'png' copies the source PNGs, 'svg' lays them
+# out from the relevance scores, 'auto' uses the PNGs when the source has them
+WORDCLOUD_FORMATS = ("auto", "png", "svg")
+
+# Generated SVG wordclouds: canvas (same 3:2 shape as the source PNGs), words
+# per cloud, font size range in canvas pixels and the viridis-like palette
+WORDCLOUD_SVG_SIZE = (600, 400)
+WORDCLOUD_SVG_WORDS = 40
+WORDCLOUD_FONT_SIZES = (12, 64)
+WORDCLOUD_COLORS = ("#440154", "#46327e", "#365c8d", "#277f8e", "#1fa187", "#4ac16d", "#8bcc3f")
+
+# Bump when the layout changes, so cached SVGs are laid out again
+WORDCLOUD_LAYOUT_VERSION = 1
+
+# Cache of laid out SVG wordclouds, keyed by their words and scores
+WORDCLOUD_CACHE_DIR = BASE_DIR / ".cache" / "wordclouds"
+
+# Seconds a cached SVG wordcloud is kept after its last use
+WORDCLOUD_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Helvetica/Arial advance widths (1/1000 em) used to size the word boxes
+HELVETICA_WIDTHS = dict(
+    zip("abcdefghijklmnopqrstuvwxyz", (556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833,
+                                      556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500)),
+    **{digit: 556 for digit in "0123456789"}, **{"_": 556, " ": 278, "-": 333, "'": 191, ".": 278})
+
+# Encoder quality and MIME type per modern format, in order of preference
+IMAGE_FORMATS = {
+    "avif": {"quality": 55, "mime": "image/avif"},
+    "webp": {"quality": 80, "mime": "image/webp"},
+}
+
 
 def parse_folder_name(folder_name: str) -> dict:
     """
@@ -142,985 +348,3398 @@ def generate_output_dir_name(metadata: dict) -> str:
     return f"{dataset}-{method}-{topic_count}"
 
 
-# =============================================================================
-# CSS Content
-# =============================================================================
-CSS_CONTENT = '''\
-/* CSS Variables */
-:root {
-    --primary-color: #2563eb;
-    --primary-dark: #1d4ed8;
-    --secondary-color: #7c3aed;
-    --background: #f8fafc;
-    --card-bg: #ffffff;
-    --text-primary: #1e293b;
-    --text-secondary: #64748b;
-    --border-color: #e2e8f0;
-    --success-color: #10b981;
-    --warning-color: #f59e0b;
-    --shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-    --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-    --radius: 12px;
-    --radius-sm: 8px;
-}
+def generator_fingerprint() -> str:
+    """
+    Identify the generator code that produced a build.
 
-* { margin: 0; padding: 0; box-sizing: border-box; }
+    Combines GENERATOR_VERSION with a hash of this module's source so that
+    editing a template invalidates existing manifests even without a version bump.
 
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-    background: var(--background);
-    color: var(--text-primary);
-    line-height: 1.6;
-    min-height: 100vh;
-}
+    Returns:
+        Fingerprint string like '2.0+3f2a9c1b0d4e'
+    """
+    source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+    return f"{GENERATOR_VERSION}+{source_hash}"
 
-.header {
-    background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
-    color: white;
-    padding: 2rem;
-    text-align: center;
-}
 
-.header h1 { font-size: 2rem; font-weight: 700; margin-bottom: 0.5rem; }
-.header .subtitle { font-size: 1.1rem; opacity: 0.9; }
+def file_signature(path: Path) -> list:
+    """
+    Cheap change signature for a source file (no content read).
 
-.nav-tabs {
-    display: flex;
-    justify-content: center;
-    gap: 0.5rem;
-    padding: 1rem;
-    background: var(--card-bg);
-    border-bottom: 1px solid var(--border-color);
-    flex-wrap: wrap;
-    position: sticky;
-    top: 0;
-    z-index: 100;
-}
+    Args:
+        path: File to stat
 
-.nav-tab {
-    padding: 0.75rem 1.5rem;
-    border: none;
-    background: transparent;
-    color: var(--text-secondary);
-    font-size: 0.95rem;
-    font-weight: 500;
-    cursor: pointer;
-    border-radius: var(--radius-sm);
-    transition: all 0.2s ease;
-}
+    Returns:
+        [name, size, mtime_ns]
+    """
+    stat = path.stat()
+    return [path.name, stat.st_size, stat.st_mtime_ns]
 
-.nav-tab:hover { background: var(--background); color: var(--text-primary); }
-.nav-tab.active { background: var(--primary-color); color: white; }
 
-.main-content { max-width: 1400px; margin: 0 auto; padding: 2rem; }
+def _reflink(src: Path, dst: Path):
+    """Create dst as a copy-on-write clone of src (raises OSError if unsupported)."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
 
-.section { display: none; }
-.section.active { display: block; }
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
 
-.section-header { margin-bottom: 2rem; }
-.section-header h2 { font-size: 1.75rem; color: var(--text-primary); margin-bottom: 0.5rem; }
-.section-header p { color: var(--text-secondary); }
 
-.stats-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-    gap: 1.5rem;
-    margin-bottom: 2rem;
-}
+def compress_bytes(data: bytes, fmt: str) -> bytes:
+    """
+    Compress data for a precompressed sibling file.
 
-.stat-card {
-    background: var(--card-bg);
-    padding: 1.5rem;
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-    text-align: center;
-}
+    Args:
+        data: File content
+        fmt: 'gz' or 'br' (brotli must be installed for 'br')
 
-.stat-value { font-size: 2.5rem; font-weight: 700; color: var(--primary-color); margin-bottom: 0.5rem; }
-.stat-label { color: var(--text-secondary); font-size: 0.9rem; }
+    Returns:
+        Compressed bytes (gzip output is reproducible: no timestamp)
+    """
+    if fmt == "gz":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
 
-.charts-row { margin-bottom: 2rem; }
 
-.chart-container {
-    background: var(--card-bg);
-    padding: 1.5rem;
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-}
+def place_asset(src: Path, target: Path, mode: str = "copy") -> str:
+    """
+    Place a source asset at target using the requested mode.
 
-.chart-container h3 { margin-bottom: 1rem; color: var(--text-primary); }
-.chart-container canvas { width: 100% !important; height: 400px !important; }
+    hardlink and reflink share the source's data blocks, symlink points at the
+    source with a relative link (so a symlinked output only works next to the
+    source tree and cannot be deployed on its own). Whenever the mode is not possible (different
+    filesystem, no reflink support, no symlink permission) the file is copied.
+    The target is replaced atomically, so an existing link is never written through.
 
-.visualizations-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-    gap: 1.5rem;
-}
+    Args:
+        src: Source file
+        target: Destination path
+        mode: One of ASSET_MODES
 
-.viz-card {
-    background: var(--card-bg);
-    padding: 1.5rem;
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-}
+    Returns:
+        The mode actually used ('copy' after a fallback)
+    """
+    tmp = target.with_name(target.name + ".tmp")
+    if tmp.is_symlink() or tmp.exists():
+        tmp.unlink()
+
+    used = mode
+    try:
+        if mode == "hardlink":
+            os.link(src, tmp)
+        elif mode == "symlink":
+            os.symlink(os.path.relpath(src.resolve(), target.parent.resolve()), tmp)
+        elif mode == "reflink":
+            _reflink(src, tmp)
+        else:
+            used = "copy"
+    except OSError:
+        used = "copy"
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+
+    if used == "copy":
+        shutil.copy(src, tmp)
+    os.replace(tmp, target)
+    return used
+
+
+class BuildManifest:
+    """
+    Incremental build state for one generated app.
 
-.viz-card h3 { margin-bottom: 1rem; color: var(--text-primary); }
+    Every output written through the manifest is recorded together with a
+    signature of its inputs (source file size/mtime, or a hash of the generated
+    content). On the next run an output is only rewritten when that signature
+    changed, the output went missing or was modified, or the generator itself
+    changed. The manifest is stored as MANIFEST_NAME in the output directory.
+    """
 
-.viz-image {
-    width: 100%;
-    height: auto;
-    border-radius: var(--radius-sm);
-    cursor: pointer;
-    transition: transform 0.2s ease;
-}
+    def __init__(self, output_path: Path, force: bool = False, asset_mode: str = "copy"):
+        """
+        Args:
+            output_path: App output directory
+            force: Ignore any existing manifest and rewrite every output
+            asset_mode: How copy_file places source files (see ASSET_MODES)
+        """
+        if asset_mode not in ASSET_MODES:
+            raise ValueError(f"Unknown asset mode: {asset_mode} (expected one of {', '.join(ASSET_MODES)})")
+
+        self.output_path = output_path
+        self.asset_mode = asset_mode
+        self.fallbacks = 0
+        self.fingerprint = generator_fingerprint()
+        self.outputs = {}
+        self.previous = {}
+        self.groups = {}
+        self.previous_groups = {}
+        self.built = None
+        self.written = 0
+        self.skipped = 0
+        self.copied = 0
+        self.rewritten = set()
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+        manifest_file = output_path / MANIFEST_NAME
+        if not force and manifest_file.exists():
+            try:
+                stored = json.loads(manifest_file.read_text())
+            except (OSError, ValueError):
+                stored = {}
+            if stored.get("generator") == self.fingerprint:
+                self.previous = stored.get("outputs", {})
+                self.previous_groups = stored.get("groups", {})
+                self.built = stored.get("built")
+
+    def is_current(self, rel_path: str, signature) -> bool:
+        """
+        Check whether an output is up to date for the given input signature.
+
+        Args:
+            rel_path: Output path relative to the app directory
+            signature: JSON-serializable description of the output's inputs
+
+        Returns:
+            True if the output can be kept as is
+        """
+        entry = self.previous.get(rel_path)
+        if not entry or entry.get("inputs") != signature:
+            return False
+        try:
+            stat = (self.output_path / rel_path).stat()
+        except OSError:
+            return False
+        return [stat.st_size, stat.st_mtime_ns] == entry.get("output")
+
+    def _record(self, rel_path: str, signature, written: bool):
+        stat = (self.output_path / rel_path).stat()
+        self.outputs[rel_path] = {
+            "inputs": signature,
+            "output": [stat.st_size, stat.st_mtime_ns],
+        }
+        if written:
+            self.written += 1
+            self.rewritten.add(rel_path)
+        else:
+            self.skipped += 1
+
+    def _skip(self, rel_path: str) -> bool:
+        self.outputs[rel_path] = self.previous[rel_path]
+        self.skipped += 1
+        return False
+
+    def _write(self, rel_path: str, content):
+        target = self.output_path / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        self.bytes_written += len(data)
+
+    def _place(self, src: Path, rel_path: str, mode: str = None):
+        mode = mode or self.asset_mode
+        used = place_asset(src, self.output_path / rel_path, mode)
+        if used != mode:
+            self.fallbacks += 1
+        if used == "copy":
+            size = src.stat().st_size
+            self.bytes_read += size
+            self.bytes_written += size
+        self.copied += 1
+
+    def counters(self) -> dict:
+        """Snapshot of the I/O counters, for per-stage accounting."""
+        return {
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "files_written": self.written,
+            "files_copied": self.copied,
+            "files_skipped": self.skipped,
+        }
 
-.viz-image:hover { transform: scale(1.02); }
+    def write_text(self, rel_path: str, content: str) -> bool:
+        """
+        Write generated text if it differs from the last build.
+
+        Args:
+            rel_path: Output path relative to the app directory
+            content: File content
+
+        Returns:
+            True if the file was written, False if it was already current
+        """
+        signature = {"sha256": hashlib.sha256(content.encode()).hexdigest()}
+        if self.is_current(rel_path, signature):
+            return self._skip(rel_path)
+
+        self._write(rel_path, content)
+        self._record(rel_path, signature, written=True)
+        return True
+
+    def generate(self, rel_path: str, inputs: list, params: dict, render) -> bool:
+        """
+        Write an output derived from source files, rendering it only when needed.
+
+        Unlike write_text the content is not produced at all when the inputs
+        are unchanged, so the source files are never read.
+
+        Args:
+            rel_path: Output path relative to the app directory
+            inputs: Source file paths the output depends on
+            params: Other values the output depends on (topic count, method, ...)
+            render: Zero-argument callable returning the file content
+
+        Returns:
+            True if the file was written, False if it was already current
+        """
+        signature = {"files": [file_signature(p) for p in inputs], "params": params}
+        if self.is_current(rel_path, signature):
+            return self._skip(rel_path)
+
+        self.bytes_read += sum(size for _, size, _ in signature["files"])
+        self._write(rel_path, render())
+        self._record(rel_path, signature, written=True)
+        return True
+
+    def generate_group(self, name: str, inputs: list, params: dict, render) -> bool:
+        """
+        Write a set of outputs that are rendered together from the same inputs.
+
+        Used where one source file fans out into many outputs (e.g. per-topic
+        shards). The file list of the group is kept in the manifest, so the group
+        is skipped without rendering when all of its files are current, and files
+        the group no longer produces are removed.
+
+        Args:
+            name: Group name, unique within the app
+            inputs: Source file paths the outputs depend on
+            params: Other values the outputs depend on
+            render: Zero-argument callable returning {rel_path: content}, where
+                content is text or bytes
+
+        Returns:
+            True if the group was rewritten, False if it was already current
+        """
+        signature = {"files": [file_signature(p) for p in inputs], "params": params}
+        previous = self.previous_groups.get(name)
+        if (previous and previous.get("inputs") == signature
+                and all(self.is_current(rel, signature) for rel in previous["files"])):
+            for rel in previous["files"]:
+                self._skip(rel)
+            self.groups[name] = previous
+            return False
+
+        self.bytes_read += sum(size for _, size, _ in signature["files"])
+        contents = render()
+        for rel, content in contents.items():
+            self._write(rel, content)
+            self._record(rel, signature, written=True)
+
+        for rel in (previous or {}).get("files", []):
+            if rel not in contents:
+                for stale in (rel, f"{rel}.gz", f"{rel}.br"):
+                    (self.output_path / stale).unlink(missing_ok=True)
+
+        self.groups[name] = {"inputs": signature, "files": sorted(contents)}
+        return True
+
+    def derive_file(self, rel_path: str, inputs: list, params: dict, produce) -> bool:
+        """
+        Place a binary file derived from source files, producing it only when needed.
+
+        Args:
+            rel_path: Output path relative to the app directory
+            inputs: Source file paths the output depends on
+            params: Other values the output depends on (width, format, ...)
+            produce: Zero-argument callable returning the path of the derived
+                file (usually in a cache directory); always copied, whatever the
+                asset mode, so outputs never link into the cache
+
+        Returns:
+            True if the file was placed, False if it was already current
+        """
+        signature = {"files": [file_signature(p) for p in inputs], "params": params}
+        if self.is_current(rel_path, signature):
+            return self._skip(rel_path)
+
+        self._place(produce(), rel_path, "copy")
+        self._record(rel_path, signature, written=True)
+        return True
+
+    def copy_file(self, src: Path, rel_path: str) -> bool:
+        """
+        Place a source file into the app unless it is already current.
+
+        The file is copied, linked or cloned according to the manifest's asset mode.
+
+        Args:
+            src: Source file
+            rel_path: Destination path relative to the app directory
+
+        Returns:
+            True if the file was placed, False if it was already current
+        """
+        signature = {"files": [file_signature(src)], "mode": self.asset_mode}
+        if self.is_current(rel_path, signature):
+            return self._skip(rel_path)
+
+        self._place(src, rel_path)
+        self._record(rel_path, signature, written=True)
+        return True
+
+    def version(self) -> str:
+        """
+        Short hash identifying the outputs recorded so far.
+
+        It is derived from each output's input signature, so it changes
+        whenever any of those outputs changes and is stable across no-op rebuilds.
+        """
+        state = {rel: entry["inputs"] for rel, entry in self.outputs.items()}
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()[:12]
+
+    def discard(self, rel_path: str) -> bool:
+        """
+        Remove an output (and its precompressed siblings) the build no longer produces.
+
+        Args:
+            rel_path: Output path relative to the app directory
+
+        Returns:
+            True if a previously built output was removed
+        """
+        if rel_path not in self.previous:
+            return False
+        for stale in (rel_path, f"{rel_path}.gz", f"{rel_path}.br"):
+            (self.output_path / stale).unlink(missing_ok=True)
+        return True
+
+    def precompress(self, workers: int = None) -> int:
+        """
+        Write .gz and .br siblings for every text output recorded so far.
+
+        A sibling is only recompressed when its output changed since the last
+        build. Compression runs in a thread pool (zlib and brotli release the GIL).
+        .br files are skipped when the brotli package is not installed.
+
+        Args:
+            workers: Thread pool size (defaults to the CPU count)
+
+        Returns:
+            Number of compressed files written
+        """
+        formats = ["gz"] + (["br"] if brotli is not None else [])
+        jobs = []
+        for rel_path, entry in list(self.outputs.items()):
+            if Path(rel_path).suffix not in TEXT_EXTENSIONS:
+                continue
+            for fmt in formats:
+                sibling = f"{rel_path}.{fmt}"
+                signature = {"source": entry["output"], "format": fmt}
+                if self.is_current(sibling, signature):
+                    self._skip(sibling)
+                else:
+                    jobs.append((rel_path, sibling, fmt, signature))
+
+        def compress(job):
+            rel_path, sibling, fmt, _ = job
+            data = (self.output_path / rel_path).read_bytes()
+            packed = compress_bytes(data, fmt)
+            target = self.output_path / sibling
+            tmp = target.with_name(target.name + ".tmp")
+            tmp.write_bytes(packed)
+            os.replace(tmp, target)
+            return len(data), len(packed)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sizes = list(executor.map(compress, jobs))
+
+        for (_, sibling, _, signature), (read, written) in zip(jobs, sizes):
+            self.bytes_read += read
+            self.bytes_written += written
+            self._record(sibling, signature, written=True)
+        return len(jobs)
+
+    def discard_stale_siblings(self) -> int:
+        """
+        Remove .gz/.br siblings that no longer match their output.
+
+        Siblings recorded in this build (by precompress) are current. Any other
+        sibling of an output rewritten in this build, or recorded by the last
+        build, is stale: servers with gzip_static/brotli_static would serve it
+        instead of the new content. Without precompress every recorded
+        sibling is removed.
+
+        Returns:
+            Number of sibling files removed
+        """
+        candidates = {rel for rel in self.previous if rel.endswith((".gz", ".br"))}
+        candidates.update(f"{rel}.{fmt}" for rel in self.rewritten
+                          if not rel.endswith((".gz", ".br")) for fmt in ("gz", "br"))
+        removed = 0
+        for rel in candidates - self.outputs.keys():
+            try:
+                (self.output_path / rel).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def save(self):
+        """
+        Write the manifest to the output directory.
+
+        The build timestamp is only renewed when an output was written or
+        removed, so a no-op rebuild keeps the date of the last real change.
+        """
+        if self.rewritten or self.outputs.keys() != self.previous.keys() or not self.built:
+            self.built = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        manifest = {
+            "generator": self.fingerprint,
+            "generator_version": GENERATOR_VERSION,
+            "built": self.built,
+            "outputs": dict(sorted(self.outputs.items())),
+            "groups": self.groups,
+        }
+        (self.output_path / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
 
-.topics-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-    gap: 1.5rem;
-}
 
-.topic-card {
-    background: var(--card-bg);
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-    overflow: hidden;
-    cursor: pointer;
-    transition: all 0.2s ease;
-}
+STAGE_COUNTERS = ("bytes_read", "bytes_written", "files_written", "files_copied", "files_skipped")
 
-.topic-card:hover { transform: translateY(-4px); box-shadow: var(--shadow-lg); }
 
-.topic-card-header {
-    padding: 1rem;
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    border-bottom: 1px solid var(--border-color);
-}
+def format_bytes(size: int) -> str:
+    """Human-readable byte count like '1.4 MB'."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
 
-.topic-number { font-weight: 700; color: var(--primary-color); }
 
-.coherence-badge {
-    background: var(--success-color);
-    color: white;
-    padding: 0.25rem 0.75rem;
-    border-radius: 20px;
-    font-size: 0.8rem;
-    font-weight: 600;
-}
+class BuildResult:
+    """
+    Outcome of one generate_app call: the app path plus per-stage measurements.
 
-.coherence-badge.low { background: var(--warning-color); }
+    Behaves like the output path for existing callers (str() and os.fspath()
+    return it). Each stage records its wall time and the I/O counters of the
+    build manifest accumulated while it ran (bytes read/written, files
+    written, copied and skipped).
+    """
 
-.topic-wordcloud { width: 100%; height: 180px; object-fit: contain; background: #f1f5f9; }
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Source folder name of the app
+        """
+        self.name = name
+        self.path = None
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.wall_time = 0.0
+        self.stages = []
+        self.catalog = None
+        self.shared_assets = []
+        self._clock = time.perf_counter()
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __repr__(self) -> str:
+        return f"BuildResult({self.path!r}, {self.wall_time:.3f}s)"
+
+    @contextlib.contextmanager
+    def stage(self, name: str, manifest: "BuildManifest" = None):
+        """
+        Time a build stage and attribute manifest I/O to it.
+
+        Args:
+            name: Stage name
+            manifest: Build manifest whose counters are diffed across the stage
+
+        Yields:
+            The stage record, so a stage can add I/O done outside the manifest
+        """
+        before = manifest.counters() if manifest else None
+        record = {"name": name, "start": time.perf_counter() - self._clock, "duration": 0.0}
+        record.update(dict.fromkeys(STAGE_COUNTERS, 0))
+        try:
+            yield record
+        finally:
+            record["duration"] = time.perf_counter() - self._clock - record["start"]
+            if manifest:
+                for key, value in manifest.counters().items():
+                    record[key] += value - before[key]
+            self.stages.append(record)
+
+    def finish(self):
+        """Record the total wall time of the build."""
+        self.wall_time = time.perf_counter() - self._clock
+
+    @property
+    def totals(self) -> dict:
+        """Counters summed over all stages."""
+        return {key: sum(stage[key] for stage in self.stages) for key in STAGE_COUNTERS}
+
+    def summary(self) -> str:
+        """One-line summary like '0.42s, 12 written, 30 skipped, 1.3 MB written'."""
+        totals = self.totals
+        return (f"{self.wall_time:.2f}s, {totals['files_written']} written, "
+                f"{totals['files_skipped']} skipped, {format_bytes(totals['bytes_written'])} written")
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form of the result."""
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "wall_time": self.wall_time,
+            "totals": self.totals,
+            "stages": self.stages,
+        }
 
-.topic-words { padding: 1rem; }
-.topic-words-list { display: flex; flex-wrap: wrap; gap: 0.5rem; }
+    def trace_events(self, tid: int) -> list:
+        """
+        Chrome trace events for the build: one complete event per stage.
+
+        Args:
+            tid: Track the app is drawn on
+
+        Returns:
+            List of trace-event dicts (timestamps in microseconds since the epoch)
+        """
+        origin = self.started * 1e6
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": self.name}},
+            {"name": self.name, "cat": "app", "ph": "X", "pid": 1, "tid": tid,
+             "ts": origin, "dur": self.wall_time * 1e6, "args": {"path": str(self.path), "pid": self.pid}},
+        ]
+        for stage in self.stages:
+            events.append({
+                "name": stage["name"], "cat": "stage", "ph": "X", "pid": 1, "tid": tid,
+                "ts": origin + stage["start"] * 1e6, "dur": stage["duration"] * 1e6,
+                "args": {key: stage[key] for key in STAGE_COUNTERS},
+            })
+        return events
 
-.word-tag {
-    background: var(--background);
-    padding: 0.25rem 0.5rem;
-    border-radius: 4px;
-    font-size: 0.85rem;
-    color: var(--text-secondary);
-}
 
-.graph-container {
-    background: var(--card-bg);
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-    overflow: hidden;
-}
+def write_trace(results: list, trace_path: str):
+    """
+    Write build results as a Chrome trace-event file.
 
-.graph-container iframe { width: 100%; height: 700px; border: none; }
+    The file can be opened in chrome://tracing or https://ui.perfetto.dev;
+    every app gets its own track with one span per stage.
 
-.open-fullscreen {
-    display: inline-block;
-    margin-top: 0.5rem;
-    color: var(--primary-color);
-    text-decoration: none;
-    font-weight: 500;
-}
+    Args:
+        results: BuildResult objects
+        trace_path: Output JSON file
+    """
+    events = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "generate_apps"}}]
+    for tid, result in enumerate(results, start=1):
+        events.extend(result.trace_events(tid))
+    Path(trace_path).write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
 
-.open-fullscreen:hover { text-decoration: underline; }
 
-.temporal-grid { display: grid; grid-template-columns: repeat(2, 1fr); gap: 1.5rem; }
+# =============================================================================
+# Shared Assets
+# =============================================================================
+def hashed_name(rel_path: str, content: str) -> str:
+    """
+    Content-hashed file name for a shared asset.
 
-.temporal-card {
-    background: var(--card-bg);
-    padding: 1.5rem;
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-}
+    Args:
+        rel_path: App-relative path of the asset, e.g. 'js/app.js'
+        content: Asset content
 
-.temporal-card.full-width { grid-column: 1 / -1; }
-.temporal-card h3 { margin-bottom: 1rem; color: var(--text-primary); }
+    Returns:
+        Name like 'app.3f2a9c1b0d4e.js'
+    """
+    path = Path(rel_path)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{path.stem}.{digest}{path.suffix}"
 
-.temporal-image {
-    width: 100%;
-    height: auto;
-    border-radius: var(--radius-sm);
-    cursor: pointer;
-    transition: transform 0.2s ease;
-}
 
-.temporal-image:hover { transform: scale(1.02); }
+def write_shared_asset(shared_dir: Path, rel_path: str, content: str, precompress: bool = False) -> tuple:
+    """
+    Write an asset once into the site-level shared directory under its hashed name.
 
-.documents-controls { margin-bottom: 1.5rem; display: flex; align-items: center; gap: 1rem; }
-.documents-controls label { font-weight: 500; }
+    A file that already exists under its hashed name has the same content, so
+    it is left alone; this also makes concurrent builds of several apps safe.
 
-.documents-controls select {
-    padding: 0.75rem 1rem;
-    border: 1px solid var(--border-color);
-    border-radius: var(--radius-sm);
-    font-size: 1rem;
-    min-width: 300px;
-    cursor: pointer;
-}
+    Args:
+        shared_dir: Shared asset directory
+        rel_path: App-relative path of the asset, e.g. 'css/styles.css'
+        content: Asset content
+        precompress: Also write .gz (and .br, if brotli is installed) siblings
 
-.documents-list { display: flex; flex-direction: column; gap: 1rem; }
+    Returns:
+        Tuple of (hashed file name, bytes written)
+    """
+    name = hashed_name(rel_path, content)
+    data = content.encode("utf-8")
+    files = {name: lambda: data}
+    if precompress:
+        for fmt in ["gz"] + (["br"] if brotli is not None else []):
+            files[f"{name}.{fmt}"] = lambda fmt=fmt: compress_bytes(data, fmt)
+
+    written = 0
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    for file_name, produce in files.items():
+        target = shared_dir / file_name
+        if target.exists():
+            continue
+        payload = produce()
+        tmp = target.with_name(f"{file_name}.{os.getpid()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, target)
+        written += len(payload)
+    return name, written
 
-.document-card {
-    background: var(--card-bg);
-    padding: 1.5rem;
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-}
 
-.document-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem; }
-.document-id { font-weight: 600; color: var(--text-secondary); }
+def prune_shared_assets(shared_dir: Path, results: list) -> int:
+    """
+    Delete the hashed files in the shared directory that no app uses any more.
 
-.document-score {
-    background: var(--primary-color);
-    color: white;
-    padding: 0.25rem 0.75rem;
-    border-radius: 20px;
-    font-size: 0.85rem;
-}
+    SHARED_ASSETS_LEDGER in shared_dir records the hashed names of every app
+    ({app path: [names]}). The entries of the apps built in this run are
+    replaced, entries of apps that no longer exist are dropped, and hashed
+    files (with their .gz/.br siblings) outside the union are deleted. Without
+    a ledger the apps next to shared_dir are scanned for references first, so
+    apps not built in this run keep their files.
 
-.document-text {
-    color: var(--text-primary);
-    line-height: 1.7;
-    max-height: 150px;
-    overflow: hidden;
-    position: relative;
-}
+    Args:
+        shared_dir: Shared asset directory
+        results: BuildResult objects of the apps built in this run
 
-.document-text::after {
-    content: '';
-    position: absolute;
-    bottom: 0;
-    left: 0;
-    right: 0;
-    height: 40px;
-    background: linear-gradient(transparent, var(--card-bg));
-}
+    Returns:
+        Number of files deleted
+    """
+    site_dir = shared_dir.parent
+    ledger_file = shared_dir / SHARED_ASSETS_LEDGER
+    hashed = re.compile(r'\.[0-9a-f]{12}\.(css|js)(\.gz|\.br)?$')
+    files = [path for path in shared_dir.iterdir() if hashed.search(path.name)] if shared_dir.exists() else []
+
+    def app_key(path):
+        return Path(os.path.relpath(path, site_dir)).as_posix()
+
+    try:
+        ledger = json.loads(ledger_file.read_text())
+    except (OSError, ValueError):
+        ledger = {}
+        names = {path.name for path in files if not path.name.endswith((".gz", ".br"))}
+        for app_dir in site_dir.iterdir():
+            pages = [*app_dir.glob("*.html"), app_dir / "sw.js"] if app_dir.is_dir() else []
+            text = "".join(page.read_text(encoding="utf-8", errors="replace") for page in pages if page.is_file())
+            used = sorted(name for name in names if name in text)
+            if used:
+                ledger[app_key(app_dir)] = used
+
+    for result in results:
+        ledger[app_key(result.path)] = result.shared_assets
+    ledger = {app: names for app, names in sorted(ledger.items())
+              if names and (site_dir / app / "index.html").exists()}
+
+    live = {name for names in ledger.values() for name in names}
+    removed = 0
+    for path in files:
+        name = path.name[:-3] if path.name.endswith((".gz", ".br")) else path.name
+        if name not in live:
+            path.unlink(missing_ok=True)
+            removed += 1
+
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    ledger_file.write_text(json.dumps(ledger, indent=2))
+    return removed
+
+
+def check_vendor_dir(vendor_dir: Path, urls: list = None):
+    """
+    Make sure the vendor directory holds every library bundle the apps load.
 
-.document-text.expanded { max-height: none; }
-.document-text.expanded::after { display: none; }
+    Bundles are never downloaded during a build; download them once (e.g. on a
+    machine with network access) into vendor_dir under the names in VENDOR_BUNDLES.
 
-.expand-btn {
-    margin-top: 0.5rem;
-    background: none;
-    border: none;
-    color: var(--primary-color);
-    cursor: pointer;
-    font-weight: 500;
-}
+    Args:
+        vendor_dir: Directory with the library bundles
+        urls: Library URLs to check (defaults to all of VENDOR_BUNDLES)
 
-.modal {
-    display: none;
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: rgba(0, 0, 0, 0.5);
-    z-index: 1000;
-    align-items: center;
-    justify-content: center;
-    padding: 2rem;
-}
+    Raises:
+        FileNotFoundError: Listing each missing file and the URL to fetch it from
+    """
+    missing = [
+        f"  {vendor_dir / VENDOR_BUNDLES[url]}  (download from {url})"
+        for url in (urls or VENDOR_BUNDLES)
+        if not (vendor_dir / VENDOR_BUNDLES[url]).is_file()
+    ]
+    if missing:
+        raise FileNotFoundError("Missing vendored library bundles:\n" + "\n".join(missing))
 
-.modal.active { display: flex; }
 
-.modal-content {
-    background: var(--card-bg);
-    border-radius: var(--radius);
-    max-width: 900px;
-    width: 100%;
-    max-height: 90vh;
-    overflow-y: auto;
-    position: relative;
-}
+def write_cache_headers(shared_dir: Path):
+    """
+    Write static-host config marking the hashed shared assets as immutable.
 
-.modal-close {
-    position: absolute;
-    top: 1rem;
-    right: 1rem;
-    background: none;
-    border: none;
-    font-size: 2rem;
-    cursor: pointer;
-    color: var(--text-secondary);
-    line-height: 1;
-}
+    Adds a rule to the Netlify/Cloudflare Pages style `_headers` file in the
+    site root (the parent of shared_dir), keeping its other rules, and writes
+    an Apache `.htaccess` inside shared_dir.
+    Everything else keeps the host's default caching, so regenerated pages
+    are picked up as usual.
 
-.modal-close:hover { color: var(--text-primary); }
+    Args:
+        shared_dir: Shared asset directory
+    """
+    site_dir = shared_dir.parent
+    url = "/" + shared_dir.relative_to(site_dir).as_posix()
+
+    # Replace only our rule in _headers; other paths and their headers are kept
+    headers_file = site_dir / "_headers"
+    kept, in_rule = [], False
+    if headers_file.exists():
+        for line in headers_file.read_text().splitlines():
+            if line and not line[0].isspace():
+                in_rule = line.strip() == f"{url}/*"
+            if not in_rule:
+                kept.append(line)
+    while kept and not kept[-1].strip():
+        kept.pop()
+    rule = [f"{url}/*", f"  Cache-Control: {IMMUTABLE_CACHE_CONTROL}"]
+    headers_file.write_text("\n".join(kept + [""] * bool(kept) + rule) + "\n")
+    (shared_dir / ".htaccess").write_text(
+        "<IfModule mod_headers.c>\n"
+        "    <FilesMatch \"\\.[0-9a-f]{12}\\.(css|js)(\\.gz|\\.br)?$\">\n"
+        f"        Header set Cache-Control \"{IMMUTABLE_CACHE_CONTROL}\"\n"
+        "    </FilesMatch>\n"
+        "</IfModule>\n"
+    )
 
-.modal-header {
-    padding: 1.5rem;
-    border-bottom: 1px solid var(--border-color);
-    display: flex;
-    align-items: center;
-    gap: 1rem;
-}
 
-.modal-header h2 { font-size: 1.5rem; }
+# =============================================================================
+# Minification
+# =============================================================================
+def _css_rules(css: str) -> list:
+    """
+    Split CSS into top-level (prelude, body) pairs.
 
-.modal-body {
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 1.5rem;
-    padding: 1.5rem;
-}
+    body is the text between the rule's braces, or None for statements
+    like @import that end in a semicolon.
+    """
+    rules = []
+    i, n = 0, len(css)
+    while i < n:
+        start = i
+        while i < n and css[i] not in "{;":
+            if css[i] in "'\"":
+                i = css.index(css[i], i + 1)
+            i += 1
+        prelude = css[start:i].strip()
+        if i >= n:
+            break
+        if css[i] == ";":
+            rules.append((prelude, None))
+            i += 1
+            continue
+        depth, body_start = 0, i + 1
+        while i < n:
+            if css[i] in "'\"":
+                i = css.index(css[i], i + 1)
+            elif css[i] == "{":
+                depth += 1
+            elif css[i] == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        rules.append((prelude, css[body_start:i]))
+        i += 1
+    return rules
+
+
+def minify_css(css: str, unused_classes: tuple = ()) -> str:
+    """
+    Strip comments and whitespace from CSS and drop rules for absent classes.
 
-.modal-wordcloud img { width: 100%; border-radius: var(--radius-sm); }
-.modal-words h3 { margin-bottom: 1rem; }
+    Selectors that reference one of unused_classes are removed from their
+    rule; a rule (or @media block) left without selectors is dropped entirely.
 
-.words-table { width: 100%; border-collapse: collapse; }
+    Args:
+        css: Stylesheet text
+        unused_classes: Class names (without the dot) no element of the page uses
 
-.words-table th,
-.words-table td {
-    padding: 0.5rem;
-    text-align: left;
-    border-bottom: 1px solid var(--border-color);
-}
+    Returns:
+        Minified stylesheet
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    unused = re.compile(r'\.(?:' + '|'.join(map(re.escape, unused_classes)) + r')(?![\w-])') if unused_classes else None
 
-.words-table th { font-weight: 600; color: var(--text-secondary); font-size: 0.85rem; }
+    def squeeze(text, tight):
+        text = re.sub(r'\s+', ' ', text).strip()
+        return re.sub(r'\s*([' + tight + r'])\s*', r'\1', text)
 
-.lightbox {
-    display: none;
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: rgba(0, 0, 0, 0.9);
-    z-index: 2000;
-    align-items: center;
-    justify-content: center;
-    cursor: pointer;
-}
+    def render(rules):
+        out = []
+        for prelude, body in rules:
+            if body is None:
+                out.append(squeeze(prelude, ",") + ";")
+            elif prelude.startswith("@") and "{" in body:
+                inner = render(_css_rules(body))
+                if inner:
+                    out.append(squeeze(prelude, ",") + "{" + inner + "}")
+            else:
+                selectors = [squeeze(sel, ",>") for sel in prelude.split(",")]
+                if unused and not prelude.startswith("@"):
+                    selectors = [sel for sel in selectors if not unused.search(sel)]
+                if selectors:
+                    declarations = squeeze(body, ":;,").rstrip(";")
+                    out.append(",".join(selectors) + "{" + declarations + "}")
+        return "".join(out)
 
-.lightbox.active { display: flex; }
-.lightbox img { max-width: 95%; max-height: 95%; object-fit: contain; }
+    return render(_css_rules(css))
 
-.topic-label {
-    font-size: 0.8rem;
-    font-style: italic;
-    color: var(--text-secondary);
-    padding: 0.25rem 0.5rem;
-    margin-bottom: 0.5rem;
-    border-left: 3px solid var(--primary-color);
-    background: var(--background);
-    border-radius: 0 var(--radius-sm) var(--radius-sm) 0;
-    line-height: 1.4;
-}
 
-.descriptions-list {
-    display: flex;
-    flex-direction: column;
-    gap: 0.5rem;
-}
+# Keywords after which a slash starts a regular expression rather than a division
+_JS_REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete",
+                      "void", "throw", "case", "do", "else", "yield", "await"}
 
-.description-item {
-    display: flex;
-    align-items: center;
-    gap: 1rem;
-    padding: 1rem 1.25rem;
-    background: var(--card-bg);
-    border-radius: var(--radius-sm);
-    box-shadow: var(--shadow);
-    cursor: pointer;
-    transition: transform 0.15s ease, box-shadow 0.15s ease;
-    border-left: 4px solid var(--primary-color);
-}
 
-.description-item:hover {
-    transform: translateX(4px);
-    box-shadow: var(--shadow-lg);
-}
+def _js_word_char(c: str) -> bool:
+    return c.isalnum() or c in "_$"
 
-.description-num {
-    font-weight: 700;
-    color: var(--primary-color);
-    min-width: 80px;
-    font-size: 0.9rem;
-}
 
-.description-label {
-    color: var(--text-primary);
-    font-size: 0.95rem;
-}
+def minify_js(js: str) -> str:
+    """
+    Strip comments and redundant whitespace from JavaScript, conservatively.
 
-.footer {
-    text-align: center;
-    padding: 2rem;
-    color: var(--text-secondary);
-    border-top: 1px solid var(--border-color);
-    margin-top: 2rem;
-}
+    String, template and regex literals are copied verbatim (including
+    `${...}` substitutions, which are minified as code). Line breaks are kept
+    as single newlines so automatic semicolon insertion behaves exactly as in
+    the source; only indentation, blank lines, comments and spaces that do
+    not separate two tokens are removed.
 
-@media (max-width: 768px) {
-    .header h1 { font-size: 1.5rem; }
-    .nav-tabs { gap: 0.25rem; }
-    .nav-tab { padding: 0.5rem 1rem; font-size: 0.85rem; }
-    .main-content { padding: 1rem; }
-    .stats-grid { grid-template-columns: repeat(2, 1fr); }
-    .stat-value { font-size: 1.75rem; }
-    .visualizations-grid { grid-template-columns: 1fr; }
-    .temporal-grid { grid-template-columns: 1fr; }
-    .modal-body { grid-template-columns: 1fr; }
-    .documents-controls { flex-direction: column; align-items: flex-start; }
-    .documents-controls select { min-width: 100%; }
-    .graph-container iframe { height: 500px; }
-}
+    Args:
+        js: Script source
 
-.loading { text-align: center; padding: 2rem; color: var(--text-secondary); }
+    Returns:
+        Minified script
+    """
+    out = []
+    templates = []  # brace depth inside each open `${...}` substitution
+    pending = None  # whitespace skipped since the last token: None, " " or "\n"
+    last, last_word = "", ""
+    i, n = 0, len(js)
+
+    def emit(token, word=""):
+        nonlocal pending, last, last_word
+        if pending and out:
+            if pending == "\n":
+                out.append("\n")
+            else:
+                prev = out[-1][-1]
+                if ((_js_word_char(prev) and _js_word_char(token[0]))
+                        or prev + token[0] in ("++", "--", "//", "/*")):
+                    out.append(" ")
+        pending = None
+        out.append(token)
+        last, last_word = token[-1], word
+
+    def scan_template(i):
+        # Copy template text up to the closing backtick or the next `${`
+        start = i
+        while i < n:
+            if js[i] == "\\":
+                i += 2
+            elif js[i] == "`":
+                out.append(js[start:i + 1])
+                return i + 1
+            elif js.startswith("${", i):
+                out.append(js[start:i + 2])
+                templates.append(0)
+                return i + 2
+            else:
+                i += 1
+        raise ValueError("Unterminated template literal")
+
+    while i < n:
+        c = js[i]
+        if c.isspace():
+            j = i
+            while j < n and js[j].isspace():
+                j += 1
+            pending = "\n" if pending == "\n" or "\n" in js[i:j] else " "
+            i = j
+        elif js.startswith("//", i):
+            j = js.find("\n", i)
+            i = n if j < 0 else j
+            pending = pending or " "
+        elif js.startswith("/*", i):
+            j = js.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            pending = "\n" if pending == "\n" or "\n" in js[i:j] else (pending or " ")
+            i = j
+        elif c in "'\"":
+            j = i + 1
+            while j < n and js[j] != c:
+                j += 2 if js[j] == "\\" else 1
+            emit(js[i:j + 1])
+            i = j + 1
+        elif c == "`":
+            emit("`")
+            i = scan_template(i + 1)
+            last, last_word = "`", ""
+        elif c == "/" and (not last or last in "(,=:[!&|?{};+-*%<>~^" or last_word in _JS_REGEX_KEYWORDS) \
+                and not (len(out) > 1 and out[-1] == out[-2] and out[-1] in "+-"):
+            # Regular expression literal
+            j, in_class = i + 1, False
+            while j < n and js[j] != "\n":
+                if js[j] == "\\":
+                    j += 1
+                elif js[j] == "[":
+                    in_class = True
+                elif js[j] == "]":
+                    in_class = False
+                elif js[j] == "/" and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and _js_word_char(js[j]):
+                j += 1
+            emit(js[i:j])
+            last = "x"
+            i = j
+        elif _js_word_char(c):
+            j = i
+            while j < n and (_js_word_char(js[j]) or (js[j] == "." and js[j - 1].isdigit() and js[i].isdigit())):
+                j += 1
+            emit(js[i:j], js[i:j])
+            i = j
+        elif c == "}" and templates and templates[-1] == 0:
+            templates.pop()
+            emit("}")
+            i = scan_template(i + 1)
+            last, last_word = "`", ""
+        else:
+            if templates and c == "{":
+                templates[-1] += 1
+            elif templates and c == "}":
+                templates[-1] -= 1
+            emit(c)
+            i += 1
+
+    return "".join(out)
+
+
+def minify_html(html: str) -> str:
+    """
+    Minify an HTML page: inline scripts/styles, comments and indentation.
 
-.loading::after {
-    content: '';
-    display: inline-block;
-    width: 20px;
-    height: 20px;
-    border: 2px solid var(--border-color);
-    border-top-color: var(--primary-color);
-    border-radius: 50%;
-    animation: spin 0.8s linear infinite;
-    margin-left: 0.5rem;
-    vertical-align: middle;
-}
+    Whitespace runs that contain a line break collapse to a single newline,
+    which renders the same as the original run; whitespace within a line and
+    the contents of <pre> and <textarea> are left alone. Inline scripts are
+    only minified when they are JavaScript (no type, or a JavaScript type).
 
-@keyframes spin { to { transform: rotate(360deg); } }
-'''
+    Args:
+        html: Page source
+
+    Returns:
+        Minified page
+    """
+    parts = re.split(r'(<(script|style|pre|textarea)\b[^>]*>.*?</\2\s*>)', html, flags=re.S | re.I)
+    out = []
+    for index, part in enumerate(parts):
+        kind = index % 3
+        if kind == 2:
+            continue  # tag name captured by the inner group
+        if kind == 0:
+            part = re.sub(r'<!--(?!\[if).*?-->', '', part, flags=re.S)
+            out.append(re.sub(r'\s*\n\s*', '\n', part))
+            continue
+        match = re.match(r'(<(\w+)\b[^>]*>)(.*?)(</\2\s*>)$', part, flags=re.S)
+        open_tag, tag, body, close_tag = match.group(1), match.group(2).lower(), match.group(3), match.group(4)
+        script_type = re.search(r'\btype\s*=\s*["\']?([^"\'\s>]+)', open_tag)
+        if tag == "style":
+            body = minify_css(body)
+        elif tag == "script" and body.strip() and (
+                not script_type or script_type.group(1).lower() in ("text/javascript", "module", "application/javascript")):
+            body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+    return "".join(out)
+
+
+def minify_text(rel_path: str, content: str, unused_css_classes: tuple = ()) -> str:
+    """
+    Minify a generated text output according to its file type.
+
+    Args:
+        rel_path: Output path (its suffix selects the minifier)
+        content: File content
+        unused_css_classes: Passed to minify_css for stylesheets
+
+    Returns:
+        Minified content (unchanged for other file types)
+    """
+    suffix = Path(rel_path).suffix
+    if suffix == ".css":
+        return minify_css(content, unused_css_classes)
+    if suffix == ".js":
+        return minify_js(content)
+    if suffix == ".html":
+        return minify_html(content)
+    return content
 
 
 # =============================================================================
-# JavaScript Content - topics.js
+# Image Optimization
 # =============================================================================
-TOPICS_JS = '''\
-/**
- * Topic Data Handler
- */
+def available_image_formats() -> list:
+    """Modern image formats the installed Pillow can encode, best first."""
+    if Image is None:
+        return []
+    return [fmt for fmt in IMAGE_FORMATS if pil_features.check(fmt)]
 
-const TopicData = {
-    coherenceData: null,
-    diversityData: null,
-    topDocsData: null,
 
-    async loadAll() {
-        try {
-            const [coherence, topDocs] = await Promise.all([
-                this.loadJSON('data/coherence_scores.json'),
-                this.loadJSON('data/top_docs.json')
-            ]);
+def file_sha256(path: Path) -> str:
+    """Hash a file's contents in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-            this.coherenceData = coherence;
-            this.topDocsData = topDocs;
 
-            // Try to load diversity scores (may not exist)
-            try {
-                this.diversityData = await this.loadJSON('data/diversity_scores.json');
-            } catch (e) {
-                console.log('Diversity scores not available');
-                this.diversityData = null;
-            }
+def encode_image_variant(src: Path, digest: str, width: int, fmt: str) -> Path:
+    """
+    Resize and encode one image variant into the shared cache.
 
-            return true;
-        } catch (error) {
-            console.error('Error loading data:', error);
-            return false;
-        }
-    },
+    Args:
+        src: Source image
+        digest: sha256 of the source file (cache key)
+        width: Target width in pixels
+        fmt: Key of IMAGE_FORMATS
 
-    async loadJSON(path) {
-        const response = await fetch(path);
-        if (!response.ok) throw new Error(`Failed to load ${path}`);
-        return response.json();
-    },
+    Returns:
+        Path to the cached variant
+    """
+    quality = IMAGE_FORMATS[fmt]["quality"]
+    cache_file = IMAGE_CACHE_DIR / f"{digest[:20]}-{width}-q{quality}.{fmt}"
+    if cache_file.exists():
+        return cache_file
+
+    IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with Image.open(src) as im:
+        im = im.convert("RGBA" if "A" in im.getbands() or "transparency" in im.info else "RGB")
+        if im.width > width:
+            im = im.resize((width, max(1, round(im.height * width / im.width))), Image.LANCZOS)
+        tmp = cache_file.with_name(cache_file.name + f".{os.getpid()}.tmp")
+        im.save(tmp, fmt.upper(), quality=quality)
+    os.replace(tmp, cache_file)
+    return cache_file
+
+
+def optimize_image(manifest: BuildManifest, src: Path, rel_path: str, widths: tuple) -> list:
+    """
+    Produce resized modern-format variants of an image already placed in the app.
 
-    getTopicCount() {
-        // Try from relevance keys first
-        if (this.coherenceData?.relevance) {
-            return Object.keys(this.coherenceData.relevance).length;
-        }
-        // Fall back to gensim
-        if (this.coherenceData?.gensim?.c_v_per_topic) {
-            return Object.keys(this.coherenceData.gensim.c_v_per_topic).length;
-        }
-        return 0;
-    },
+    Variants are written next to the original as '{stem}-{width}.{format}'.
+    Encoding happens at most once per source content (see IMAGE_CACHE_DIR),
+    and not at all when the manifest says the variants are current.
 
-    getAverageCoherence() {
-        return this.coherenceData?.gensim?.c_v_average || 0;
-    },
+    Args:
+        manifest: Build manifest of the app
+        src: Source image
+        rel_path: Path of the full-size image in the app, e.g. 'images/tsne.png'
+        widths: Variant widths in pixels
 
-    getCoherenceScores() {
-        if (!this.coherenceData?.gensim?.c_v_per_topic) return [];
+    Returns:
+        List of dicts with 'src', 'width' and 'type', smallest first per format
+    """
+    stem = rel_path.rsplit('.', 1)[0]
+    signature = [file_signature(src)]
+
+    # The source width is recorded with the variants, so unchanged sources are not opened
+    source_width = next((
+        entry["inputs"]["params"]["source_width"]
+        for path, entry in manifest.previous.items()
+        if path.startswith(f"{stem}-") and entry.get("inputs", {}).get("files") == signature
+        and "source_width" in entry["inputs"].get("params", {})
+    ), None)
+    if source_width is None:
+        with Image.open(src) as im:
+            source_width = im.width
+    targets = sorted({min(w, source_width) for w in widths})
+
+    digest = []
+
+    def produce(width, fmt):
+        if not digest:
+            digest.append(file_sha256(src))
+        return encode_image_variant(src, digest[0], width, fmt)
+
+    variants = []
+    for fmt in available_image_formats():
+        for width in targets:
+            variant_path = f"{stem}-{width}.{fmt}"
+            manifest.derive_file(
+                variant_path,
+                inputs=[src],
+                params={"width": width, "format": fmt, "quality": IMAGE_FORMATS[fmt]["quality"],
+                        "source_width": source_width},
+                produce=lambda width=width, fmt=fmt: produce(width, fmt)
+            )
+            variants.append({"src": variant_path, "width": width, "type": IMAGE_FORMATS[fmt]["mime"]})
+    return variants
+
+
+def render_wordcloud_atlas(wordclouds: dict) -> dict:
+    """
+    Pack wordcloud thumbnails into sprite atlases for the topics grid.
 
-        return Object.entries(this.coherenceData.gensim.c_v_per_topic).map(([topic, score]) => {
-            // Handle both "Topic 1" and "topic_01" formats
-            let topicNum;
-            if (topic.startsWith('topic_')) {
-                topicNum = parseInt(topic.replace('topic_', ''));
-            } else {
-                topicNum = parseInt(topic.replace('Topic ', ''));
-            }
-            return {
-                topic: `Topic ${topicNum}`,
-                topicNum: topicNum,
-                score: score
-            };
-        }).sort((a, b) => a.topicNum - b.topicNum);
-    },
+    Each wordcloud is scaled down to fit a WORDCLOUD_TILE_SIZE tile (centered,
+    transparent margins). Tiles are laid out row by row, WORDCLOUD_ATLAS_COLUMNS
+    wide and WORDCLOUD_ATLAS_TILES per image, in topic order, so the first rows
+    of the grid need only the first atlas. Atlases are WebP when Pillow can
+    encode it, otherwise PNG.
 
-    getDiversityMetrics() {
-        if (!this.diversityData) return null;
+    Args:
+        wordclouds: Dict mapping topic number to the source wordcloud image
 
-        return {
-            proportionUnique: this.diversityData.proportion_unique_words,
-            avgJaccard: this.diversityData.average_jaccard_diversity,
-            overallScore: this.diversityData.diversity_summary?.overall_diversity_score,
-            uniqueWords: this.diversityData.diversity_summary?.total_unique_words
-        };
-    },
+    Returns:
+        Dict mapping output paths to contents: the atlas images (bytes) and
+        WORDCLOUD_ATLAS_MAP, {"tile": [w, h], "atlases": [{"src", "width",
+        "height"}, ...], "topics": {topic: [atlas, x, y]}}
+    """
+    fmt = "webp" if "webp" in available_image_formats() else "png"
+    tile_w, tile_h = WORDCLOUD_TILE_SIZE
+    topics = sorted(wordclouds)
+
+    files = {}
+    atlas_map = {"tile": [tile_w, tile_h], "atlases": [], "topics": {}}
+    for start in range(0, len(topics), WORDCLOUD_ATLAS_TILES):
+        batch = topics[start:start + WORDCLOUD_ATLAS_TILES]
+        columns = min(WORDCLOUD_ATLAS_COLUMNS, len(batch))
+        rows = -(-len(batch) // columns)
+        index = len(atlas_map["atlases"])
+
+        atlas = Image.new("RGBA", (columns * tile_w, rows * tile_h), (0, 0, 0, 0))
+        for i, num in enumerate(batch):
+            x, y = (i % columns) * tile_w, (i // columns) * tile_h
+            with Image.open(wordclouds[num]) as im:
+                im = im.convert("RGBA")
+                im.thumbnail((tile_w, tile_h), Image.LANCZOS)
+                atlas.paste(im, (x + (tile_w - im.width) // 2, y + (tile_h - im.height) // 2))
+            atlas_map["topics"][str(num)] = [index, x, y]
+
+        buffer = io.BytesIO()
+        if fmt == "webp":
+            atlas.save(buffer, "WEBP", quality=IMAGE_FORMATS["webp"]["quality"])
+        else:
+            atlas.save(buffer, "PNG", optimize=True)
+        rel_path = f"images/wordclouds/atlas-{index}.{fmt}"
+        files[rel_path] = buffer.getvalue()
+        atlas_map["atlases"].append({"src": rel_path, "width": atlas.width, "height": atlas.height})
+
+    files[WORDCLOUD_ATLAS_MAP] = json.dumps(atlas_map, separators=(',', ':'))
+    return files
+
+
+def wordcloud_layout(words: dict) -> list:
+    """
+    Lay out a wordcloud deterministically.
 
-    getTopWords(topicNum, limit = 30) {
-        const topicKey = `topic_${String(topicNum).padStart(2, '0')}`;
+    Font sizes grow linearly with exp(relevance) (the scores are log-scale)
+    between WORDCLOUD_FONT_SIZES. Words are placed largest first along an
+    elliptical spiral from the center at the first position where their box
+    fits inside the canvas without overlapping a placed word; about one word
+    in ten is set vertically. A word that fits nowhere is retried smaller and
+    dropped below the minimum size. Ties are broken by the word itself, so the
+    same words always give the same cloud.
 
-        if (!this.coherenceData?.relevance?.[topicKey]) return [];
+    Args:
+        words: {word: relevance score} of one topic
 
-        return Object.entries(this.coherenceData.relevance[topicKey])
-            .map(([word, score]) => ({
-                word: word.replace(/_/g, ' '),
-                score: score
-            }))
-            .slice(0, limit);
-    },
+    Returns:
+        List of (word, x, y, font_size, vertical) with (x, y) the box center
+    """
+    width, height = WORDCLOUD_SVG_SIZE
+    min_size, max_size = WORDCLOUD_FONT_SIZES
+    ranked = sorted(words.items(), key=lambda item: (-item[1], item[0]))[:WORDCLOUD_SVG_WORDS]
+    if not ranked:
+        return []
+
+    weights = [math.exp(score - ranked[0][1]) for _, score in ranked]
+    low = weights[-1]
+    placed, boxes = [], []
+    for i, ((word, _), weight) in enumerate(zip(ranked, weights)):
+        scale = (weight - low) / (1 - low) if low < 1 else 1.0
+        size = min_size + (max_size - min_size) * scale
+        vertical = i > 0 and int(hashlib.md5(word.encode()).hexdigest(), 16) % 10 == 0
+        # Start each word's spiral at a different angle so words spread around the center
+        start = i * 2.39996
+        while size >= min_size:
+            text_w = sum(HELVETICA_WIDTHS.get(ch, 667) for ch in word) / 1000 * size + 2
+            text_h = size * 1.05 + 2
+            box_w, box_h = (text_h, text_w) if vertical else (text_w, text_h)
+            position = None
+            # The box hit last is tested first: along the spiral it usually still overlaps
+            hit = None
+            t = 0.0
+            while box_w <= width and box_h <= height:
+                r = 2.0 * t
+                if r > height * 0.75:  # the spiral has passed the canvas corners
+                    break
+                x = width / 2 + r * math.cos(t + start) * width / height
+                y = height / 2 + r * math.sin(t + start)
+                t += 0.15 if r < 20 else 3.5 / r
+                left, top = x - box_w / 2, y - box_h / 2
+                if left < 0 or top < 0 or left + box_w > width or top + box_h > height:
+                    continue
+                right, bottom = left + box_w, top + box_h
+                if hit and not (left >= hit[2] or hit[0] >= right or top >= hit[3] or hit[1] >= bottom):
+                    continue
+                hit = next((box for box in boxes
+                            if not (left >= box[2] or box[0] >= right or top >= box[3] or box[1] >= bottom)), None)
+                if hit is None:
+                    position = (x, y)
+                    break
+            if position:
+                x, y = position
+                boxes.append((x - box_w / 2, y - box_h / 2, x + box_w / 2, y + box_h / 2))
+                placed.append((word, position[0], position[1], round(size, 1), vertical))
+                break
+            size *= 0.85
+    return placed
+
+
+def render_wordcloud_svg(words: dict) -> str:
+    """
+    Render one topic's wordcloud (see wordcloud_layout) as a compact SVG.
 
-    getTopDocuments(topicNum, limit = 10) {
-        const topicKey = `Topic ${topicNum}`;
+    Args:
+        words: {word: relevance score} of one topic
 
-        if (!this.topDocsData?.[topicKey]) return [];
+    Returns:
+        SVG document that scales with its container (viewBox only)
+    """
+    width, height = WORDCLOUD_SVG_SIZE
+    texts = []
+    for word, x, y, size, vertical in wordcloud_layout(words):
+        color = WORDCLOUD_COLORS[int(hashlib.md5(word.encode()).hexdigest(), 16) % len(WORDCLOUD_COLORS)]
+        size_attr = f"{size:g}"
+        if vertical:
+            # Rotated about the box center; the baseline sits about 0.35em below it
+            texts.append(f'<text x="{x:.0f}" y="{y + size * 0.35:.0f}" font-size="{size_attr}" fill="{color}" '
+                         f'transform="rotate(-90 {x:.0f} {y:.0f})">{html_escape(word)}</text>')
+        else:
+            texts.append(f'<text x="{x:.0f}" y="{y + size * 0.35:.0f}" font-size="{size_attr}" fill="{color}">'
+                         f'{html_escape(word)}</text>')
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+            f'font-family="Helvetica,Arial,sans-serif" text-anchor="middle">'
+            f'<rect width="{width}" height="{height}" fill="#fff"/>{"".join(texts)}</svg>')
+
+
+def render_wordcloud_svgs(relevance: dict, workers: int = None) -> dict:
+    """
+    Lay out the SVG wordclouds of all topics (see render_wordcloud_svg).
 
-        return Object.entries(this.topDocsData[topicKey])
-            .map(([docId, content]) => {
-                const parts = content.split(':');
-                const score = parseFloat(parts[parts.length - 1]) || 0;
-                const text = parts.slice(0, -1).join(':');
+    Every SVG is cached in WORDCLOUD_CACHE_DIR under a hash of its words, scores
+    and the layout settings, so only topics whose words changed are laid out
+    again. Those are spread over a process pool (the layout is pure Python).
+    Cache hits are touched, and entries unused for WORDCLOUD_CACHE_MAX_AGE
+    are deleted.
 
-                return { id: docId, text: text, score: score };
-            })
-            .sort((a, b) => b.score - a.score)
-            .slice(0, limit);
-    },
+    Args:
+        relevance: 'relevance' dict of the topic data ({topic: {word: score}})
+        workers: Process pool size (defaults to the CPU count; 1 lays out in-process)
 
-    getTopicSummaries() {
-        const coherenceScores = this.getCoherenceScores();
+    Returns:
+        Dict mapping 'images/wordclouds/Topic NN.svg' to SVG content
+    """
+    settings = [WORDCLOUD_LAYOUT_VERSION, WORDCLOUD_SVG_SIZE, WORDCLOUD_SVG_WORDS,
+                WORDCLOUD_FONT_SIZES, WORDCLOUD_COLORS]
+    files, pending = {}, []
+    for topic_key, words in relevance.items():
+        rel_path = f"images/wordclouds/Topic {topic_number(topic_key):02d}.svg"
+        key = hashlib.sha256(json.dumps([settings, sorted(words.items())]).encode()).hexdigest()[:20]
+        cache_file = WORDCLOUD_CACHE_DIR / f"{key}.svg"
+        if cache_file.exists():
+            files[rel_path] = cache_file.read_text(encoding="utf-8")
+            os.utime(cache_file)
+        else:
+            pending.append((rel_path, cache_file, words))
+
+    if pending:
+        if workers == 1 or len(pending) == 1:
+            svgs = [render_wordcloud_svg(words) for _, _, words in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                svgs = list(executor.map(render_wordcloud_svg, [words for _, _, words in pending]))
+
+        WORDCLOUD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for (rel_path, cache_file, _), svg in zip(pending, svgs):
+            tmp = cache_file.with_name(cache_file.name + f".{os.getpid()}.tmp")
+            tmp.write_text(svg, encoding="utf-8")
+            os.replace(tmp, cache_file)
+            files[rel_path] = svg
+
+    if WORDCLOUD_CACHE_DIR.exists():
+        expired = time.time() - WORDCLOUD_CACHE_MAX_AGE
+        for entry in os.scandir(WORDCLOUD_CACHE_DIR):
+            if entry.is_file() and entry.stat().st_mtime < expired:
+                Path(entry.path).unlink(missing_ok=True)
+    return dict(sorted(files.items()))
+
+
+def image_html(src: str, alt: str, css_class: str, variants: list = None, sizes: str = "100vw",
+               lazy: bool = False) -> str:
+    """
+    Build the markup for a lightbox-enabled image.
 
-        return coherenceScores.map(({ topic, topicNum, score }) => {
-            const topWords = this.getTopWords(topicNum, 5);
+    Without variants this is a plain <img>. With variants it becomes a <picture>
+    whose sources let the browser pick a small encoding for first paint, while
+    the <img> keeps the full-size original for the lightbox.
 
-            return {
-                topic: topic,
-                topicNum: topicNum,
-                coherence: score,
-                topWords: topWords,
-                wordcloudPath: `images/wordclouds/Topic ${String(topicNum).padStart(2, '0')}.png`
-            };
-        });
-    },
+    Args:
+        src: Full-size image path
+        alt: Alt text
+        css_class: Class of the <img>
+        variants: Output of optimize_image
+        sizes: 'sizes' attribute for the srcset
+        lazy: Emit data-src/data-srcset so nothing loads until the image's
+            section is first opened (see loadDeferredMedia in app.js)
 
-    generateTopicLabel(topicNum) {
-        const topWords = this.getTopWords(topicNum, 3);
-        if (topWords.length === 0) return `Topic ${topicNum}`;
-        return topWords.map(w => w.word).join(', ');
-    }
-};
+    Returns:
+        HTML string
+    """
+    src_attr = "data-src" if lazy else "src"
+    srcset_attr = "data-srcset" if lazy else "srcset"
 
-window.TopicData = TopicData;
-'''
+    img = f'<img {src_attr}="{src}" alt="{alt}" class="{css_class}" onclick="openLightbox(this)">'
+    if not variants:
+        return img
+
+    sources = []
+    for mime in dict.fromkeys(v["type"] for v in variants):
+        srcset = ', '.join(f'{quote(v["src"])} {v["width"]}w' for v in variants if v["type"] == mime)
+        sources.append(f'<source type="{mime}" {srcset_attr}="{srcset}" sizes="{sizes}">')
+    return f'<picture>{"".join(sources)}{img}</picture>'
 
 
 # =============================================================================
-# JavaScript Content - charts.js (dynamic for any topic count)
+# Data Preparation
 # =============================================================================
-def generate_charts_js(topic_count: int) -> str:
-    """Generate charts.js with dynamic color palette for any topic count."""
-    # Generate enough colors for any topic count
-    base_colors = [
-        '#2563eb', '#7c3aed', '#db2777', '#dc2626', '#ea580c',
-        '#d97706', '#ca8a04', '#65a30d', '#16a34a', '#059669',
-        '#0d9488', '#0891b2', '#0284c7', '#2563eb', '#4f46e5',
-        '#7c3aed', '#9333ea', '#c026d3', '#db2777', '#e11d48',
-        '#ef4444', '#f97316', '#eab308', '#84cc16', '#22c55e',
-        '#14b8a6', '#06b6d4', '#0ea5e9', '#3b82f6', '#6366f1',
-        '#8b5cf6', '#a855f7', '#d946ef', '#ec4899', '#f43f5e',
-        '#fb7185', '#fda4af', '#fecdd3', '#ffe4e6', '#fecaca',
-        '#fed7aa', '#fef08a', '#d9f99d', '#bbf7d0', '#99f6e4'
-    ]
+def topic_number(topic_key: str) -> int:
+    """Extract the topic number from keys like 'Topic 3' or 'topic_03'."""
+    return int(re.findall(r'\d+', topic_key)[-1])
 
-    # Extend colors if needed
-    while len(base_colors) < topic_count:
-        base_colors.extend(base_colors)
 
-    colors_json = json.dumps(base_colors[:max(topic_count, 25)])
+def parse_document(doc_id: str, content: str) -> dict:
+    """
+    Parse a top_docs entry of the form 'text:score'.
 
-    return f'''\
-/**
- * Chart.js Configurations
- */
+    Only the last colon separates the score, so colons inside the text are kept.
+    Entries without a numeric score keep their full text with a score of 0.
 
-const Charts = {{
-    coherenceChart: null,
+    Args:
+        doc_id: Document id
+        content: Raw 'text:score' string
 
-    colors: {colors_json},
+    Returns:
+        Dict with id, score, text and preview (first DOCUMENT_PREVIEW_WORDS words)
+    """
+    text, sep, score_str = content.rpartition(':')
+    try:
+        score = float(score_str) if sep else 0.0
+    except ValueError:
+        text, score = content, 0.0
+    if score != score:  # NaN
+        score = 0.0
 
-    init() {{
-        this.initCoherenceChart();
-    }},
+    return {
+        "id": doc_id,
+        "score": score,
+        "text": text,
+        "preview": ' '.join(text.split()[:DOCUMENT_PREVIEW_WORDS]),
+    }
 
-    initCoherenceChart() {{
-        const ctx = document.getElementById('coherence-chart');
-        if (!ctx) return;
 
-        const scores = TopicData.getCoherenceScores();
+def render_temporal_data(csv_path: Path) -> str:
+    """
+    Convert the quarterly topic distribution CSV into compact columnar JSON.
 
-        const data = {{
-            labels: scores.map(s => `Topic ${{s.topicNum}}`),
-            datasets: [{{
-                label: 'Coherence Score (C_V)',
-                data: scores.map(s => s.score),
-                backgroundColor: scores.map((_, i) => this.colors[i % this.colors.length]),
-                borderColor: scores.map((_, i) => this.colors[i % this.colors.length]),
-                borderWidth: 1,
-                borderRadius: 4,
-                barThickness: Math.max(8, Math.min(20, 500 / scores.length))
-            }}]
-        }};
+    Args:
+        csv_path: Path to {prefix}_temporal_topic_dist_quarter.csv
 
-        const averageCoherence = TopicData.getAverageCoherence();
+    Returns:
+        JSON string {"periods": [...], "series": {"Topic 1": [floats], ...}}
+        with values rounded to TEMPORAL_PRECISION significant digits
+    """
+    with open(csv_path, 'r') as f:
+        reader = csv.DictReader(f)
+        topics = [name for name in reader.fieldnames if name.startswith('Topic')]
+        periods = []
+        series = {topic: [] for topic in topics}
+        for row in reader:
+            periods.append(row['period'])
+            for topic in topics:
+                try:
+                    value = float(f"{float(row[topic]):.{TEMPORAL_PRECISION}g}")
+                except (TypeError, ValueError):
+                    value = 0
+                series[topic].append(value if value == value else 0)
 
-        const config = {{
-            type: 'bar',
-            data: data,
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: function(context) {{
-                                return `Coherence: ${{context.raw.toFixed(4)}}`;
-                            }},
-                            afterLabel: function(context) {{
-                                const topicNum = context.dataIndex + 1;
-                                const topWords = TopicData.getTopWords(topicNum, 3);
-                                return `Top words: ${{topWords.map(w => w.word).join(', ')}}`;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    x: {{
-                        grid: {{ display: false }},
-                        ticks: {{ maxRotation: 45, minRotation: 45 }}
-                    }},
-                    y: {{
-                        beginAtZero: false,
-                        min: 0.4,
-                        max: 1.0,
-                        grid: {{ color: '#e2e8f0' }},
-                        title: {{ display: true, text: 'Coherence Score (C_V)' }}
-                    }}
-                }},
-                onClick: (event, elements) => {{
-                    if (elements.length > 0) {{
-                        const index = elements[0].index;
-                        const topicNum = index + 1;
-                        showTopicModal(topicNum);
-                    }}
-                }}
-            }}
-        }};
+    return json.dumps({"periods": periods, "series": series}, separators=(',', ':'))
 
-        this.coherenceChart = new Chart(ctx, config);
-    }},
 
-    getTopicColor(topicNum) {{
-        return this.colors[(topicNum - 1) % this.colors.length];
-    }},
+def render_violin_plot(violin_src: Path, summary: bool = False, plotly_src: str = PLOTLY_SRC) -> dict:
+    """
+    Slim the interactive violin plot page.
 
-    destroy() {{
-        if (this.coherenceChart) {{
-            this.coherenceChart.destroy();
-            this.coherenceChart = null;
-        }}
-    }}
-}};
+    The source page inlines the whole figure data as `const VIOLIN_DATA = {...};`
+    with three parallel per-document arrays (periods, years, quarters) per topic,
+    of which the page only plots `years`. This moves the years into
+    data/violin.json (rounded to VIOLIN_PRECISION decimals, not indented), makes
+    the page fetch it before plotting, and points the plotly.js tag at plotly_src.
 
-window.Charts = Charts;
-'''
+    With summary=True each topic is stored as its distinct values plus counts.
+    The years are quarter-quantized, so this is lossless: the page expands the
+    counts back into samples and Plotly draws the same KDE and quartiles.
 
+    If the page does not have the expected structure it is kept unchanged.
 
-# =============================================================================
-# JavaScript Content - app.js
-# =============================================================================
-APP_JS = '''\
-/**
- * Main Application Logic
- */
+    Args:
+        violin_src: Path to the source *violin*interactive*.html
+        summary: Store value counts instead of raw samples
+        plotly_src: plotly.js URL (PLOTLY_SRC, or a vendored copy)
 
-let currentSection = 'overview';
-let currentTopic = 1;
+    Returns:
+        Dict mapping output paths to contents (violin-plot.html, data/violin.json)
+    """
+    html = violin_src.read_text(encoding="utf-8")
+
+    data_match = re.search(r'<script>\s*(?://[^\n]*\n\s*)*const VIOLIN_DATA = ', html)
+    onload_match = re.search(r'window\.onload\s*=\s*function\s*\(\)\s*\{\s*initializeControls\(\);\s*\};', html)
+    if not data_match or not onload_match:
+        return {"violin-plot.html": html}
+
+    try:
+        violin_data, data_end = json.JSONDecoder().raw_decode(html, data_match.end())
+        script_end = html.index('</script>', data_end) + len('</script>')
+        topics = violin_data["topics"]
+    except (ValueError, KeyError):
+        return {"violin-plot.html": html}
+
+    compact = {"topics": {}, "metadata": violin_data.get("metadata", {})}
+    for topic_id, topic in topics.items():
+        years = [round(year, VIOLIN_PRECISION) for year in topic.get("years", [])]
+        years = [int(year) if year == int(year) else year for year in years]
+        if summary:
+            counts = {}
+            for year in years:
+                counts[year] = counts.get(year, 0) + 1
+            values = sorted(counts)
+            compact["topics"][topic_id] = {"values": values, "counts": [counts[v] for v in values]}
+        else:
+            compact["topics"][topic_id] = {"years": years}
+
+    loader = '''<script>
+        // Figure data lives in data/violin.json and is fetched before plotting
+        let VIOLIN_DATA;
+
+        const violinDataReady = fetch('data/violin.json')
+            .then(response => {
+                if (!response.ok) throw new Error('Failed to load data/violin.json');
+                return response.json();
+            })
+            .then(data => {
+                Object.values(data.topics).forEach(topic => {
+                    if (topic.counts) {
+                        topic.years = topic.values.flatMap((value, i) => Array(topic.counts[i]).fill(value));
+                    }
+                });
+                VIOLIN_DATA = data;
+            })
+            .catch(error => console.error('Error loading violin data:', error));
+    </script>'''
+
+    slim = (
+        html[:data_match.start()]
+        + loader
+        + html[script_end:onload_match.start()]
+        + 'window.onload = async function() {\n            await violinDataReady;\n            initializeControls();\n        };'
+        + html[onload_match.end():]
+    )
+    slim = re.sub(r'<script src="https://cdn\.plot\.ly/plotly[^"]*"></script>',
+                  f'<script src="{plotly_src}" defer></script>', slim)
 
-async function init() {
-    showLoading(true);
+    return {
+        "violin-plot.html": slim,
+        "data/violin.json": json.dumps(compact, separators=(',', ':')),
+    }
 
-    const success = await TopicData.loadAll();
 
-    if (!success) {
-        showError('Failed to load data. Please refresh the page.');
-        return;
-    }
+def render_top_docs_shards(topdocs_src: Path) -> dict:
+    """
+    Split {prefix}_top_docs.json into one file per topic plus a small index.
 
-    initNavigation();
-    initOverview();
-    initTopicsGrid();
-    initDocumentsSection();
-    Charts.init();
-    showLoading(false);
-}
+    The browser fetches the index up front and a topic's shard only when that
+    topic is opened in the Documents tab. Each shard is a list of parsed
+    documents (see parse_document) sorted by score, highest first, so the page
+    does no string parsing or sorting.
 
-function showLoading(show) {
-    console.log(show ? 'Loading...' : 'Loaded');
-}
+    Args:
+        topdocs_src: Path to the source top_docs JSON
 
-function showError(message) {
-    const main = document.querySelector('.main-content');
-    main.innerHTML = `<div class="error-message" style="text-align: center; padding: 2rem; color: #dc2626;">${message}</div>`;
-}
+    Returns:
+        Dict mapping output paths (data/top_docs/...) to file contents
+    """
+    with open(topdocs_src, 'r') as f:
+        top_docs = json.load(f)
 
-function initNavigation() {
-    const tabs = document.querySelectorAll('.nav-tab');
-    tabs.forEach(tab => {
-        tab.addEventListener('click', () => {
-            const section = tab.dataset.section;
-            switchSection(section);
-        });
-    });
-}
+    files = {}
+    index = {"topics": {}}
+    for topic_key, docs in top_docs.items():
+        num = topic_number(topic_key)
+        rel_path = f"data/top_docs/topic_{num:02d}.json"
+        parsed = sorted((parse_document(doc_id, content) for doc_id, content in docs.items()),
+                        key=lambda doc: doc["score"], reverse=True)
+        files[rel_path] = json.dumps(parsed, ensure_ascii=False, separators=(',', ':'))
+        index["topics"][str(num)] = {"path": rel_path, "count": len(docs)}
 
-function switchSection(sectionId) {
-    document.querySelectorAll('.nav-tab').forEach(tab => {
-        tab.classList.toggle('active', tab.dataset.section === sectionId);
-    });
-    document.querySelectorAll('.section').forEach(section => {
-        section.classList.toggle('active', section.id === sectionId);
-    });
-    currentSection = sectionId;
-}
+    files["data/top_docs/index.json"] = json.dumps(index, separators=(',', ':'))
+    return files
 
-function initOverview() {
-    document.getElementById('total-topics').textContent = TopicData.getTopicCount();
-    document.getElementById('avg-coherence').textContent = TopicData.getAverageCoherence().toFixed(3);
 
-    const diversity = TopicData.getDiversityMetrics();
-    if (diversity && diversity.overallScore) {
-        document.getElementById('diversity-score').textContent = (diversity.overallScore * 100).toFixed(1) + '%';
-        document.getElementById('unique-words').textContent = diversity.uniqueWords?.toLocaleString() || '-';
-    } else {
-        document.getElementById('diversity-score').textContent = 'N/A';
-        document.getElementById('unique-words').textContent = 'N/A';
-    }
-}
+def render_summary(topic_data: dict, diversity_src: Optional[Path] = None,
+                   md_src: Optional[Path] = None) -> str:
+    """
+    Build data/summary.json, the small file the Overview and the topics grid render from.
 
-function initTopicsGrid() {
-    const grid = document.getElementById('topics-grid');
-    if (!grid) return;
+    The full coherence_scores.json (30+ relevance words per topic) and the
+    diversity scores are only needed for the topic modal and load in the
+    background. Per-topic values are arrays in topic order.
 
-    const summaries = TopicData.getTopicSummaries();
+    Args:
+        topic_data: Loaded topic data (see load_topic_data)
+        diversity_src: Optional {prefix}_diversity_scores.json
+        md_src: Optional topic descriptions .md
 
-    grid.innerHTML = summaries.map(topic => `
-        <div class="topic-card" onclick="showTopicModal(${topic.topicNum})" data-topic="${topic.topicNum}">
-            <div class="topic-card-header">
-                <span class="topic-number">Topic ${topic.topicNum}</span>
-                <span class="coherence-badge ${topic.coherence < 0.6 ? 'low' : ''}">${topic.coherence.toFixed(3)}</span>
-            </div>
-            <img
-                src="${topic.wordcloudPath}"
-                alt="Topic ${topic.topicNum} Wordcloud"
-                class="topic-wordcloud"
-                loading="lazy"
-            >
-            <div class="topic-words">
-                <div class="topic-words-list">
-                    ${topic.topWords.slice(0, 5).map(w => `<span class="word-tag">${w.word}</span>`).join('')}
-                </div>
-            </div>
-        </div>
-    `).join('');
-}
+    Returns:
+        JSON string with topic_count, topics (numbers), c_v and u_mass
+        ({"average", "per_topic"}), top_words ([[word, score], ...] per topic),
+        labels (top three words), diversity (or null) and descriptions
+        ({topic: label} from the .md, or null)
+    """
+    gensim = topic_data.get("gensim", {})
+    relevance = {topic_number(key): words for key, words in topic_data.get("relevance", {}).items()}
+    per_topic = {
+        metric: {topic_number(key): value for key, value in gensim.get(f"{metric}_per_topic", {}).items()}
+        for metric in ("c_v", "u_mass")
+    }
+    topics = sorted(per_topic["c_v"] or relevance)
 
-function initDocumentsSection() {
-    const select = document.getElementById('topic-select');
-    if (!select) return;
+    def metric_summary(metric):
+        average = gensim.get(f"{metric}_average")
+        return {
+            "average": round(average, 6) if average is not None else None,
+            "per_topic": [round(per_topic[metric][num], 6) if num in per_topic[metric] else None
+                          for num in topics],
+        }
 
-    const topicCount = TopicData.getTopicCount();
+    # Same order as getTopWords: the order of the relevance dict
+    top_words = [[[word, score] for word, score in list(relevance.get(num, {}).items())[:SUMMARY_TOP_WORDS]]
+                 for num in topics]
+
+    diversity = None
+    if diversity_src is not None:
+        with open(diversity_src, 'r') as f:
+            scores = json.load(f)
+        overall = scores.get("diversity_summary", {})
+        diversity = {
+            "proportion_unique": scores.get("proportion_unique_words"),
+            "avg_jaccard": scores.get("average_jaccard_diversity"),
+            "overall_score": overall.get("overall_diversity_score"),
+            "unique_words": overall.get("total_unique_words"),
+        }
 
-    select.innerHTML = '';
-    for (let i = 1; i <= topicCount; i++) {
-        const topWords = TopicData.getTopWords(i, 3);
-        const label = topWords.map(w => w.word).join(', ');
+    # Same pattern as loadTopicDescriptions in app.js
+    descriptions = None
+    if md_src is not None:
+        descriptions = {}
+        for line in md_src.read_text(encoding="utf-8").splitlines():
+            match = re.match(r'^\d+\.\s+\*\*Topic\s+(\d+):\*\*\s+(.+)', line)
+            if match:
+                descriptions[str(int(match.group(1)))] = match.group(2).strip()
+
+    return json.dumps({
+        "topic_count": len(relevance) or len(per_topic["c_v"]),
+        "topics": topics,
+        "c_v": metric_summary("c_v"),
+        "u_mass": metric_summary("u_mass"),
+        "top_words": top_words,
+        "labels": [', '.join(word.replace('_', ' ') for word, _ in words[:3]) or f"Topic {num}"
+                   for num, words in zip(topics, top_words)],
+        "diversity": diversity,
+        "descriptions": descriptions,
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_term_index(relevance: dict) -> str:
+    """
+    Build the reverse word-to-topic index used by the Topics tab term search.
 
-        const option = document.createElement('option');
-        option.value = i;
-        option.textContent = `Topic ${i}: ${label}`;
-        select.appendChild(option);
-    }
+    Args:
+        relevance: 'relevance' dict of the topic data ({topic: {word: score}})
 
-    select.addEventListener('change', () => {
-        loadDocuments(parseInt(select.value));
-    });
+    Returns:
+        JSON string {term: [[topic, rank, score], ...]} where rank is the
+        term's 1-based position in that topic's relevance list; each list is
+        sorted by rank, then by score (highest first)
+    """
+    index = {}
+    for topic_key, words in relevance.items():
+        num = topic_number(topic_key)
+        ranked = sorted(words.items(), key=lambda item: -item[1])
+        for rank, (word, score) in enumerate(ranked, 1):
+            # Words differing only in case share a key; a topic keeps its best rank
+            index.setdefault(word.lower(), {}).setdefault(num, [num, rank, score])
 
-    loadDocuments(1);
-}
+    terms = {}
+    for term, by_topic in sorted(index.items()):
+        terms[term] = sorted(by_topic.values(), key=lambda hit: (hit[1], -hit[2], hit[0]))
+    return json.dumps(terms, ensure_ascii=False, separators=(',', ':'))
 
-function loadDocuments(topicNum) {
-    const container = document.getElementById('documents-list');
-    if (!container) return;
 
-    const docs = TopicData.getTopDocuments(topicNum);
+def search_tokens(text: str) -> list:
+    """
+    Split text into lowercase ASCII search terms.
 
-    if (docs.length === 0) {
-        container.innerHTML = '<p class="no-docs">No documents available for this topic.</p>';
-        return;
-    }
+    Accents are stripped (every mark, Unicode category M, after NFKD) and
+    anything other than letters and digits separates terms; the Documents tab
+    tokenizes queries the same way (TopicData.tokenize, /\\p{M}/u).
+    """
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(ch for ch in text if not unicodedata.category(ch).startswith('M'))
+    return re.findall(r'[a-z0-9]+', text)
 
-    container.innerHTML = docs.map((doc, index) => `
-        <div class="document-card">
-            <div class="document-header">
-                <span class="document-id">#${index + 1} (ID: ${doc.id})</span>
-                <span class="document-score">Score: ${doc.score.toFixed(4)}</span>
-            </div>
-            <div class="document-text" id="doc-text-${index}">
-                ${formatDocumentText(doc.text)}
-            </div>
-            <button class="expand-btn" onclick="toggleDocumentExpand(${index})">Show more</button>
-        </div>
-    `).join('');
-}
 
-function formatDocumentText(text) {
-    return text.replace(/\\s+/g, ' ').trim().split(' ').slice(0, 100).join(' ');
-}
+def render_search_index(topdocs_src: Path) -> dict:
+    """
+    Build an inverted index over the top documents for the Documents tab search.
 
-function toggleDocumentExpand(index) {
-    const textEl = document.getElementById(`doc-text-${index}`);
-    const btn = textEl.nextElementSibling;
+    Documents get global ids in the order of the top_docs shards (topics by
+    number, documents by score), so a hit maps back to a topic shard and rank.
+    Each term's postings are those ids, sorted and delta-encoded. The sorted
+    terms are cut into shards of about SEARCH_SHARD_BYTES, and the index lists
+    the first term of each shard, so a query (or a prefix of a term) only
+    fetches the one or two shards whose range it falls into.
 
-    if (textEl.classList.contains('expanded')) {
-        textEl.classList.remove('expanded');
-        btn.textContent = 'Show more';
-    } else {
-        textEl.classList.add('expanded');
-        btn.textContent = 'Show less';
-    }
-}
+    Args:
+        topdocs_src: Path to the source top_docs JSON
 
-function showTopicModal(topicNum) {
-    const modal = document.getElementById('topic-modal');
-    if (!modal) return;
+    Returns:
+        Dict mapping output paths (data/search/...) to file contents
+    """
+    with open(topdocs_src, 'r') as f:
+        top_docs = json.load(f)
+
+    postings = {}
+    topics = []
+    doc_id = 0
+    for topic_key, docs in sorted(top_docs.items(), key=lambda item: topic_number(item[0])):
+        parsed = sorted((parse_document(key, content) for key, content in docs.items()),
+                        key=lambda doc: doc["score"], reverse=True)
+        topics.append([topic_number(topic_key), len(parsed)])
+        for doc in parsed:
+            for term in set(search_tokens(doc["text"])):
+                if len(term) > 1 and term not in SEARCH_STOPWORDS:
+                    postings.setdefault(term, []).append(doc_id)
+            doc_id += 1
+
+    # Cut the sorted term list into shards of about SEARCH_SHARD_BYTES; each
+    # shard holds a contiguous term range, so all terms sharing a prefix sit in
+    # one shard or a few neighbouring ones
+    files = {}
+    starts = []
+    shard, size = {}, 0
+    for term in sorted(postings):
+        ids = postings[term]
+        deltas = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+        entry = len(term) + len(json.dumps(deltas, separators=(',', ':'))) + 4
+        if shard and size + entry > SEARCH_SHARD_BYTES:
+            files[f"data/search/{len(starts) - 1:03d}.json"] = json.dumps(shard, separators=(',', ':'))
+            shard, size = {}, 0
+        if not shard:
+            starts.append(term)
+        shard[term] = deltas
+        size += entry
+    if shard:
+        files[f"data/search/{len(starts) - 1:03d}.json"] = json.dumps(shard, separators=(',', ':'))
+
+    files["data/search/index.json"] = json.dumps(
+        {"documents": doc_id, "topics": topics, "shards": starts, "stopwords": sorted(SEARCH_STOPWORDS)},
+        separators=(',', ':'))
+    return files
 
-    const topWords = TopicData.getTopWords(topicNum);
-    const coherenceScores = TopicData.getCoherenceScores();
-    const coherence = coherenceScores.find(s => s.topicNum === topicNum)?.score || 0;
 
-    document.getElementById('modal-title').textContent = `Topic ${topicNum}`;
-    document.getElementById('modal-coherence').textContent = `C_V: ${coherence.toFixed(3)}`;
-    document.getElementById('modal-coherence').className = `coherence-badge ${coherence < 0.6 ? 'low' : ''}`;
-    document.getElementById('modal-wordcloud-img').src = `images/wordclouds/Topic ${String(topicNum).padStart(2, '0')}.png`;
+# =============================================================================
+# CSS Content
+# =============================================================================
+CSS_CONTENT = '''\
+/* CSS Variables */
+:root {
+    --primary-color: #2563eb;
+    --primary-dark: #1d4ed8;
+    --secondary-color: #7c3aed;
+    --background: #f8fafc;
+    --card-bg: #ffffff;
+    --text-primary: #1e293b;
+    --text-secondary: #64748b;
+    --border-color: #e2e8f0;
+    --success-color: #10b981;
+    --warning-color: #f59e0b;
+    --shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+    --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
+    --radius: 12px;
+    --radius-sm: 8px;
+}
 
-    const tbody = document.querySelector('#modal-words-table tbody');
-    tbody.innerHTML = topWords.map(word => `
-        <tr>
-            <td>${word.word}</td>
-            <td>${word.score.toFixed(4)}</td>
-        </tr>
-    `).join('');
+* { margin: 0; padding: 0; box-sizing: border-box; }
 
-    modal.classList.add('active');
-    currentTopic = topicNum;
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    background: var(--background);
+    color: var(--text-primary);
+    line-height: 1.6;
+    min-height: 100vh;
 }
 
-function closeModal() {
-    const modal = document.getElementById('topic-modal');
-    if (modal) modal.classList.remove('active');
+.header {
+    background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+    color: white;
+    padding: 2rem;
+    text-align: center;
 }
 
-function openLightbox(img) {
-    const lightbox = document.getElementById('lightbox');
-    const lightboxImg = document.getElementById('lightbox-img');
+.header h1 { font-size: 2rem; font-weight: 700; margin-bottom: 0.5rem; }
+.header .subtitle { font-size: 1.1rem; opacity: 0.9; }
 
-    if (lightbox && lightboxImg) {
-        lightboxImg.src = img.src;
-        lightbox.classList.add('active');
-    }
+.nav-tabs {
+    display: flex;
+    justify-content: center;
+    gap: 0.5rem;
+    padding: 1rem;
+    background: var(--card-bg);
+    border-bottom: 1px solid var(--border-color);
+    flex-wrap: wrap;
+    position: sticky;
+    top: 0;
+    z-index: 100;
 }
 
-function closeLightbox() {
-    const lightbox = document.getElementById('lightbox');
-    if (lightbox) lightbox.classList.remove('active');
+.nav-tab {
+    padding: 0.75rem 1.5rem;
+    border: none;
+    background: transparent;
+    color: var(--text-secondary);
+    font-size: 0.95rem;
+    font-weight: 500;
+    cursor: pointer;
+    border-radius: var(--radius-sm);
+    transition: all 0.2s ease;
 }
 
-document.addEventListener('keydown', (e) => {
-    if (e.key === 'Escape') {
-        closeModal();
-        closeLightbox();
-    }
-});
+.nav-tab:hover { background: var(--background); color: var(--text-primary); }
+.nav-tab.active { background: var(--primary-color); color: white; }
 
-document.getElementById('topic-modal')?.addEventListener('click', (e) => {
-    if (e.target.classList.contains('modal')) closeModal();
-});
+.main-content { max-width: 1400px; margin: 0 auto; padding: 2rem; }
 
-document.addEventListener('DOMContentLoaded', init);
-'''
+.section { display: none; }
+.section.active { display: block; }
 
+.section-header { margin-bottom: 2rem; }
+.section-header h2 { font-size: 1.75rem; color: var(--text-primary); margin-bottom: 0.5rem; }
+.section-header p { color: var(--text-secondary); }
 
-# =============================================================================
-# JavaScript snippet for topic descriptions (injected when md file is present)
-# =============================================================================
-TOPIC_DESCRIPTIONS_JS = '''\
-async function loadTopicDescriptions(mdFileName) {
-    try {
-        const response = await fetch(mdFileName);
-        if (!response.ok) return;
-        const text = await response.text();
-        const lines = text.split('\\n');
-        lines.forEach(line => {
-            const match = line.match(/^\\d+\\.\\s+\\*\\*Topic\\s+(\\d+):\\*\\*\\s+(.+)/);
-            if (match) {
-                topicLabels[parseInt(match[1])] = match[2].trim();
-            }
-        });
-    } catch (e) {
-        // silently skip if md file can't be loaded
-    }
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1.5rem;
+    margin-bottom: 2rem;
+}
+
+.stat-card {
+    background: var(--card-bg);
+    padding: 1.5rem;
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+    text-align: center;
+}
+
+.stat-value { font-size: 2.5rem; font-weight: 700; color: var(--primary-color); margin-bottom: 0.5rem; }
+.stat-label { color: var(--text-secondary); font-size: 0.9rem; }
+
+.charts-row { margin-bottom: 2rem; }
+
+.chart-container {
+    background: var(--card-bg);
+    padding: 1.5rem;
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+}
+
+.chart-container h3 { margin-bottom: 1rem; color: var(--text-primary); }
+.chart-container canvas { width: 100% !important; height: 400px !important; }
+
+.visualizations-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
+    gap: 1.5rem;
+}
+
+.viz-card {
+    background: var(--card-bg);
+    padding: 1.5rem;
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+}
+
+.viz-card h3 { margin-bottom: 1rem; color: var(--text-primary); }
+
+.viz-image {
+    width: 100%;
+    height: auto;
+    border-radius: var(--radius-sm);
+    cursor: pointer;
+    transition: transform 0.2s ease;
+}
+
+.viz-image:hover { transform: scale(1.02); }
+
+.term-search { margin-bottom: 1.5rem; }
+
+.term-search input {
+    padding: 0.75rem 1rem;
+    border: 1px solid var(--border-color);
+    border-radius: var(--radius-sm);
+    font-size: 1rem;
+    width: 100%;
+    max-width: 480px;
+}
+
+.term-status { color: var(--text-secondary); margin: 0.75rem 0 0.5rem; }
+.term-hits, .term-suggestions { display: flex; flex-wrap: wrap; gap: 0.5rem; }
+.term-suggestions { margin-top: 0.75rem; }
+.term-suggestions .word-tag { border: none; cursor: pointer; }
+
+.term-hit {
+    background: var(--card-bg);
+    border: 1px solid var(--border-color);
+    border-radius: 20px;
+    padding: 0.35rem 0.9rem;
+    font-size: 0.9rem;
+    font-weight: 500;
+    color: var(--primary-color);
+    cursor: pointer;
+}
+
+.term-hit span { color: var(--text-secondary); font-weight: 400; }
+.term-hit:hover { border-color: var(--primary-color); }
+
+.topics-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+    gap: 1.5rem;
+}
+
+.topic-card {
+    background: var(--card-bg);
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+    overflow: hidden;
+    cursor: pointer;
+    transition: all 0.2s ease;
+}
+
+.topic-card:hover { transform: translateY(-4px); box-shadow: var(--shadow-lg); }
+
+.topic-card-header {
+    padding: 1rem;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    border-bottom: 1px solid var(--border-color);
+}
+
+.topic-number { font-weight: 700; color: var(--primary-color); }
+
+.coherence-badge {
+    background: var(--success-color);
+    color: white;
+    padding: 0.25rem 0.75rem;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: 600;
+}
+
+.coherence-badge.low { background: var(--warning-color); }
+
+.topic-wordcloud { width: 100%; height: 180px; object-fit: contain; background: #f1f5f9; }
+.topic-wordcloud-sprite { height: auto; background-repeat: no-repeat; }
+
+.topic-words { padding: 1rem; }
+.topic-words-list { display: flex; flex-wrap: wrap; gap: 0.5rem; }
+
+.word-tag {
+    background: var(--background);
+    padding: 0.25rem 0.5rem;
+    border-radius: 4px;
+    font-size: 0.85rem;
+    color: var(--text-secondary);
+}
+
+.graph-container {
+    background: var(--card-bg);
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+    overflow: hidden;
+}
+
+.graph-container iframe { width: 100%; height: 700px; border: none; }
+
+.open-fullscreen {
+    display: inline-block;
+    margin-top: 0.5rem;
+    color: var(--primary-color);
+    text-decoration: none;
+    font-weight: 500;
+}
+
+.open-fullscreen:hover { text-decoration: underline; }
+
+.temporal-grid { display: grid; grid-template-columns: repeat(2, 1fr); gap: 1.5rem; }
+
+.temporal-card {
+    background: var(--card-bg);
+    padding: 1.5rem;
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+}
+
+.temporal-card.full-width { grid-column: 1 / -1; }
+.temporal-card h3 { margin-bottom: 1rem; color: var(--text-primary); }
+
+.temporal-image {
+    width: 100%;
+    height: auto;
+    border-radius: var(--radius-sm);
+    cursor: pointer;
+    transition: transform 0.2s ease;
+}
+
+.temporal-image:hover { transform: scale(1.02); }
+
+.documents-controls { margin-bottom: 1.5rem; display: flex; align-items: center; gap: 1rem; }
+.documents-controls label { font-weight: 500; }
+
+.documents-controls select {
+    padding: 0.75rem 1rem;
+    border: 1px solid var(--border-color);
+    border-radius: var(--radius-sm);
+    font-size: 1rem;
+    min-width: 300px;
+    cursor: pointer;
+}
+
+.documents-controls input[type="search"] {
+    padding: 0.75rem 1rem;
+    border: 1px solid var(--border-color);
+    border-radius: var(--radius-sm);
+    font-size: 1rem;
+    flex: 1;
+    min-width: 200px;
+}
+
+.search-status { color: var(--text-secondary); margin: -0.75rem 0 1rem; min-height: 1.5em; }
+
+.documents-list { display: flex; flex-direction: column; gap: 1rem; }
+
+.document-card {
+    background: var(--card-bg);
+    padding: 1.5rem;
+    border-radius: var(--radius);
+    box-shadow: var(--shadow);
+}
+
+.document-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem; }
+.document-id { font-weight: 600; color: var(--text-secondary); }
+
+.document-score {
+    background: var(--primary-color);
+    color: white;
+    padding: 0.25rem 0.75rem;
+    border-radius: 20px;
+    font-size: 0.85rem;
+}
+
+.document-text {
+    color: var(--text-primary);
+    line-height: 1.7;
+    max-height: 150px;
+    overflow: hidden;
+    position: relative;
+}
+
+.document-text::after {
+    content: '';
+    position: absolute;
+    bottom: 0;
+    left: 0;
+    right: 0;
+    height: 40px;
+    background: linear-gradient(transparent, var(--card-bg));
+}
+
+.document-text.expanded { max-height: none; }
+.document-text.expanded::after { display: none; }
+
+.expand-btn {
+    margin-top: 0.5rem;
+    background: none;
+    border: none;
+    color: var(--primary-color);
+    cursor: pointer;
+    font-weight: 500;
+}
+
+.modal {
+    display: none;
+    position: fixed;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: rgba(0, 0, 0, 0.5);
+    z-index: 1000;
+    align-items: center;
+    justify-content: center;
+    padding: 2rem;
+}
+
+.modal.active { display: flex; }
+
+.modal-content {
+    background: var(--card-bg);
+    border-radius: var(--radius);
+    max-width: 900px;
+    width: 100%;
+    max-height: 90vh;
+    overflow-y: auto;
+    position: relative;
+}
+
+.modal-close {
+    position: absolute;
+    top: 1rem;
+    right: 1rem;
+    background: none;
+    border: none;
+    font-size: 2rem;
+    cursor: pointer;
+    color: var(--text-secondary);
+    line-height: 1;
+}
+
+.modal-close:hover { color: var(--text-primary); }
+
+.modal-header {
+    padding: 1.5rem;
+    border-bottom: 1px solid var(--border-color);
+    display: flex;
+    align-items: center;
+    gap: 1rem;
+}
+
+.modal-header h2 { font-size: 1.5rem; }
+
+.modal-body {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 1.5rem;
+    padding: 1.5rem;
+}
+
+.modal-wordcloud img { width: 100%; border-radius: var(--radius-sm); }
+.modal-words h3 { margin-bottom: 1rem; }
+
+.words-table { width: 100%; border-collapse: collapse; }
+
+.words-table th,
+.words-table td {
+    padding: 0.5rem;
+    text-align: left;
+    border-bottom: 1px solid var(--border-color);
+}
+
+.words-table th { font-weight: 600; color: var(--text-secondary); font-size: 0.85rem; }
+
+.lightbox {
+    display: none;
+    position: fixed;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: rgba(0, 0, 0, 0.9);
+    z-index: 2000;
+    align-items: center;
+    justify-content: center;
+    cursor: pointer;
+}
+
+.lightbox.active { display: flex; }
+.lightbox img { max-width: 95%; max-height: 95%; object-fit: contain; }
+
+.topic-label {
+    font-size: 0.8rem;
+    font-style: italic;
+    color: var(--text-secondary);
+    padding: 0.25rem 0.5rem;
+    margin-bottom: 0.5rem;
+    border-left: 3px solid var(--primary-color);
+    background: var(--background);
+    border-radius: 0 var(--radius-sm) var(--radius-sm) 0;
+    line-height: 1.4;
+}
+
+.descriptions-list {
+    display: flex;
+    flex-direction: column;
+    gap: 0.5rem;
+}
+
+.description-item {
+    display: flex;
+    align-items: center;
+    gap: 1rem;
+    padding: 1rem 1.25rem;
+    background: var(--card-bg);
+    border-radius: var(--radius-sm);
+    box-shadow: var(--shadow);
+    cursor: pointer;
+    transition: transform 0.15s ease, box-shadow 0.15s ease;
+    border-left: 4px solid var(--primary-color);
+}
+
+.description-item:hover {
+    transform: translateX(4px);
+    box-shadow: var(--shadow-lg);
+}
+
+.description-num {
+    font-weight: 700;
+    color: var(--primary-color);
+    min-width: 80px;
+    font-size: 0.9rem;
+}
+
+.description-label {
+    color: var(--text-primary);
+    font-size: 0.95rem;
+}
+
+.footer {
+    text-align: center;
+    padding: 2rem;
+    color: var(--text-secondary);
+    border-top: 1px solid var(--border-color);
+    margin-top: 2rem;
+}
+
+@media (max-width: 768px) {
+    .header h1 { font-size: 1.5rem; }
+    .nav-tabs { gap: 0.25rem; }
+    .nav-tab { padding: 0.5rem 1rem; font-size: 0.85rem; }
+    .main-content { padding: 1rem; }
+    .stats-grid { grid-template-columns: repeat(2, 1fr); }
+    .stat-value { font-size: 1.75rem; }
+    .visualizations-grid { grid-template-columns: 1fr; }
+    .temporal-grid { grid-template-columns: 1fr; }
+    .modal-body { grid-template-columns: 1fr; }
+    .documents-controls { flex-direction: column; align-items: flex-start; }
+    .documents-controls select, .documents-controls input[type="search"] { min-width: 100%; }
+    .graph-container iframe { height: 500px; }
+}
+
+.loading { text-align: center; padding: 2rem; color: var(--text-secondary); }
+
+.loading::after {
+    content: '';
+    display: inline-block;
+    width: 20px;
+    height: 20px;
+    border: 2px solid var(--border-color);
+    border-top-color: var(--primary-color);
+    border-radius: 50%;
+    animation: spin 0.8s linear infinite;
+    margin-left: 0.5rem;
+    vertical-align: middle;
+}
+
+@keyframes spin { to { transform: rotate(360deg); } }
+'''
+
+
+# =============================================================================
+# JavaScript Content - topics.js
+# =============================================================================
+TOPICS_JS = '''\
+/**
+ * Topic Data Handler
+ */
+
+const TopicData = {
+    summary: null,
+    coherenceScores: null,
+    detailsLoaded: null,
+    coherenceData: null,
+    diversityData: null,
+    topDocsIndex: null,
+    topDocsShards: {},
+    termIndex: null,
+    searchIndex: null,
+    searchShards: {},
+
+    async loadAll() {
+        // The small summary is enough for the first render; the full data loads in the background
+        this.detailsLoaded = this.loadDetails();
+        try {
+            this.summary = await this.loadJSON('data/summary.json');
+        } catch (error) {
+            console.log('Summary not available, waiting for the full data');
+            this.summary = null;
+        }
+        return this.summary ? true : this.detailsLoaded;
+    },
+
+    async loadDetails() {
+        try {
+            const [coherence, topDocsIndex] = await Promise.all([
+                this.loadJSON('data/coherence_scores.json'),
+                this.loadJSON('data/top_docs/index.json').catch(() => null)
+            ]);
+
+            this.coherenceData = coherence;
+            this.topDocsIndex = topDocsIndex;
+
+            // Try to load diversity scores (may not exist)
+            try {
+                this.diversityData = await this.loadJSON('data/diversity_scores.json');
+            } catch (e) {
+                console.log('Diversity scores not available');
+                this.diversityData = null;
+            }
+
+            return true;
+        } catch (error) {
+            console.error('Error loading data:', error);
+            return false;
+        }
+    },
+
+    async loadJSON(path) {
+        const response = await fetch(path);
+        if (!response.ok) throw new Error(`Failed to load ${path}`);
+        return response.json();
+    },
+
+    getTopicCount() {
+        if (this.summary) return this.summary.topic_count;
+
+        // Try from relevance keys first
+        if (this.coherenceData?.relevance) {
+            return Object.keys(this.coherenceData.relevance).length;
+        }
+        // Fall back to gensim
+        if (this.coherenceData?.gensim?.c_v_per_topic) {
+            return Object.keys(this.coherenceData.gensim.c_v_per_topic).length;
+        }
+        return 0;
+    },
+
+    getAverageCoherence() {
+        if (this.summary) return this.summary.c_v.average || 0;
+        return this.coherenceData?.gensim?.c_v_average || 0;
+    },
+
+    getCoherenceScores() {
+        // Built once: the chart, the cards and the modal all read it
+        if (this.coherenceScores) return this.coherenceScores;
+
+        if (this.summary) {
+            this.coherenceScores = this.summary.topics
+                .map((topicNum, i) => ({ topic: `Topic ${topicNum}`, topicNum, score: this.summary.c_v.per_topic[i] }))
+                .filter(entry => entry.score !== null);
+            return this.coherenceScores;
+        }
+
+        if (!this.coherenceData?.gensim?.c_v_per_topic) return [];
+
+        this.coherenceScores = Object.entries(this.coherenceData.gensim.c_v_per_topic).map(([topic, score]) => {
+            // Handle both "Topic 1" and "topic_01" formats
+            let topicNum;
+            if (topic.startsWith('topic_')) {
+                topicNum = parseInt(topic.replace('topic_', ''));
+            } else {
+                topicNum = parseInt(topic.replace('Topic ', ''));
+            }
+            return {
+                topic: `Topic ${topicNum}`,
+                topicNum: topicNum,
+                score: score
+            };
+        }).sort((a, b) => a.topicNum - b.topicNum);
+        return this.coherenceScores;
+    },
+
+    getDiversityMetrics() {
+        if (this.summary) {
+            const diversity = this.summary.diversity;
+            return diversity && {
+                proportionUnique: diversity.proportion_unique,
+                avgJaccard: diversity.avg_jaccard,
+                overallScore: diversity.overall_score,
+                uniqueWords: diversity.unique_words
+            };
+        }
+
+        if (!this.diversityData) return null;
+
+        return {
+            proportionUnique: this.diversityData.proportion_unique_words,
+            avgJaccard: this.diversityData.average_jaccard_diversity,
+            overallScore: this.diversityData.diversity_summary?.overall_diversity_score,
+            uniqueWords: this.diversityData.diversity_summary?.total_unique_words
+        };
+    },
+
+    getTopWords(topicNum, limit = 30) {
+        // The summary holds the first few words of every topic
+        const index = this.summary ? this.summary.topics.indexOf(topicNum) : -1;
+        const summaryWords = index === -1 ? null : this.summary.top_words[index];
+        if (summaryWords && (limit <= summaryWords.length || !this.coherenceData)) {
+            return summaryWords.slice(0, limit).map(([word, score]) => ({ word: word.replace(/_/g, ' '), score }));
+        }
+
+        const topicKey = `topic_${String(topicNum).padStart(2, '0')}`;
+
+        if (!this.coherenceData?.relevance?.[topicKey]) return [];
+
+        return Object.entries(this.coherenceData.relevance[topicKey])
+            .map(([word, score]) => ({
+                word: word.replace(/_/g, ' '),
+                score: score
+            }))
+            .slice(0, limit);
+    },
+
+    async loadTopDocsShard(topicNum) {
+        await this.detailsLoaded;
+        const entry = this.topDocsIndex?.topics?.[topicNum];
+        if (!entry) return null;
+
+        // Cache the request itself so concurrent callers share one fetch
+        if (!this.topDocsShards[topicNum]) {
+            this.topDocsShards[topicNum] = this.loadJSON(entry.path).catch(error => {
+                delete this.topDocsShards[topicNum];
+                throw error;
+            });
+        }
+        return this.topDocsShards[topicNum];
+    },
+
+    async getTopDocuments(topicNum, limit = 10) {
+        let shard;
+        try {
+            shard = await this.loadTopDocsShard(topicNum);
+        } catch (error) {
+            console.error('Error loading documents:', error);
+            return [];
+        }
+        if (!shard) return [];
+
+        // Shards are pre-parsed and sorted by score at build time
+        return shard.slice(0, limit);
+    },
+
+    loadTermIndex() {
+        if (!this.termIndex) {
+            this.termIndex = this.loadJSON('data/term_index.json').catch(error => {
+                this.termIndex = null;
+                throw error;
+            });
+        }
+        return this.termIndex;
+    },
+
+    // Topics containing a word, from the precomputed reverse index
+    async findTerm(query, suggestionLimit = 12) {
+        const index = await this.loadTermIndex();
+        const term = query.trim().toLowerCase().replace(/\\s+/g, '_');
+        if (!term) return { term, hits: [], suggestions: [] };
+
+        const hits = (index[term] || []).map(([topicNum, rank, score]) => ({ topicNum, rank, score }));
+
+        // Other vocabulary terms containing the query, those starting with it first
+        const suggestions = Object.keys(index)
+            .filter(key => key !== term && key.includes(term))
+            .sort((a, b) => b.startsWith(term) - a.startsWith(term) || a.length - b.length || a.localeCompare(b))
+            .slice(0, suggestionLimit);
+
+        return { term, hits, suggestions };
+    },
+
+    // Same terms as search_tokens() in the generator (every combining mark is dropped)
+    tokenize(text) {
+        return text.toLowerCase().normalize('NFKD').replace(/\\p{M}/gu, '').match(/[a-z0-9]+/g) || [];
+    },
+
+    loadSearchIndex() {
+        if (!this.searchIndex) {
+            this.searchIndex = this.loadJSON('data/search/index.json').then(index => {
+                index.stopwords = new Set(index.stopwords);
+                return index;
+            }).catch(error => {
+                this.searchIndex = null;
+                throw error;
+            });
+        }
+        return this.searchIndex;
+    },
+
+    loadSearchShard(shardNum) {
+        if (!this.searchShards[shardNum]) {
+            const path = `data/search/${String(shardNum).padStart(3, '0')}.json`;
+            this.searchShards[shardNum] = this.loadJSON(path).catch(error => {
+                delete this.searchShards[shardNum];
+                throw error;
+            });
+        }
+        return this.searchShards[shardNum];
+    },
+
+    // Ids of the documents containing any indexed term that starts with prefix
+    async findDocumentIds(index, prefix) {
+        // Shards hold sorted term ranges; only those overlapping the prefix are fetched
+        const starts = index.shards;
+        let first = 0;
+        while (first + 1 < starts.length && starts[first + 1] <= prefix) first++;
+        let last = first;
+        while (last + 1 < starts.length && starts[last + 1].startsWith(prefix)) last++;
+
+        const shards = [];
+        for (let i = first; i <= last; i++) shards.push(this.loadSearchShard(i));
+
+        const ids = new Set();
+        (await Promise.all(shards)).forEach(shard => {
+            for (const [term, deltas] of Object.entries(shard)) {
+                if (!term.startsWith(prefix)) continue;
+                let id = 0;
+                deltas.forEach(delta => ids.add(id += delta));
+            }
+        });
+        return ids;
+    },
+
+    async searchDocuments(query, limit = 50) {
+        const index = await this.loadSearchIndex();
+        const terms = [...new Set(this.tokenize(query))]
+            .filter(term => term.length > 1 && !index.stopwords.has(term));
+        if (terms.length === 0) return { terms, total: 0, results: [] };
+
+        // Every query term must match (as a prefix of a document term)
+        const sets = await Promise.all(terms.map(term => this.findDocumentIds(index, term)));
+        sets.sort((a, b) => a.size - b.size);
+        const matches = [...sets[0]].filter(id => sets.every(set => set.has(id)));
+
+        // Map global ids back to (topic, rank); most representative documents first
+        const offsets = [];
+        let offset = 0;
+        index.topics.forEach(([topicNum, count]) => {
+            offsets.push([offset, topicNum]);
+            offset += count;
+        });
+        const hits = matches.map(id => {
+            let i = offsets.length - 1;
+            while (offsets[i][0] > id) i--;
+            return { topicNum: offsets[i][1], rank: id - offsets[i][0] };
+        }).sort((a, b) => a.rank - b.rank || a.topicNum - b.topicNum);
+
+        // Only the topic shards of the shown hits are fetched
+        const results = await Promise.all(hits.slice(0, limit).map(async hit => {
+            const shard = await this.loadTopDocsShard(hit.topicNum);
+            return { ...hit, doc: shard?.[hit.rank] };
+        }));
+        return { terms, total: hits.length, results: results.filter(result => result.doc) };
+    },
+
+    getTopicSummaries() {
+        const coherenceScores = this.getCoherenceScores();
+
+        return coherenceScores.map(({ topic, topicNum, score }) => {
+            const topWords = this.getTopWords(topicNum, 5);
+
+            return {
+                topic: topic,
+                topicNum: topicNum,
+                coherence: score,
+                topWords: topWords,
+                wordcloudPath: this.getWordcloudPath(topicNum)
+            };
+        });
+    },
+
+    getWordcloudPath(topicNum) {
+        return `images/wordclouds/Topic ${String(topicNum).padStart(2, '0')}.png`;
+    },
+
+    generateTopicLabel(topicNum) {
+        const index = this.summary ? this.summary.topics.indexOf(topicNum) : -1;
+        if (index !== -1) return this.summary.labels[index];
+
+        const topWords = this.getTopWords(topicNum, 3);
+        if (topWords.length === 0) return `Topic ${topicNum}`;
+        return topWords.map(w => w.word).join(', ');
+    }
+};
+
+window.TopicData = TopicData;
+'''
+
+
+def generate_topics_js(wordcloud_format: str = "png") -> str:
+    """Generate topics.js; wordcloud_format is the extension of the wordcloud images ('png' or 'svg')."""
+    if wordcloud_format == "png":
+        return TOPICS_JS
+    return TOPICS_JS.replace(
+        "padStart(2, '0')}.png`;",
+        f"padStart(2, '0')}}.{wordcloud_format}`;"
+    )
+
+
+# =============================================================================
+# JavaScript Content - charts.js (dynamic for any topic count)
+# =============================================================================
+def generate_charts_js(topic_count: int) -> str:
+    """Generate charts.js with dynamic color palette for any topic count."""
+    # Generate enough colors for any topic count
+    base_colors = [
+        '#2563eb', '#7c3aed', '#db2777', '#dc2626', '#ea580c',
+        '#d97706', '#ca8a04', '#65a30d', '#16a34a', '#059669',
+        '#0d9488', '#0891b2', '#0284c7', '#2563eb', '#4f46e5',
+        '#7c3aed', '#9333ea', '#c026d3', '#db2777', '#e11d48',
+        '#ef4444', '#f97316', '#eab308', '#84cc16', '#22c55e',
+        '#14b8a6', '#06b6d4', '#0ea5e9', '#3b82f6', '#6366f1',
+        '#8b5cf6', '#a855f7', '#d946ef', '#ec4899', '#f43f5e',
+        '#fb7185', '#fda4af', '#fecdd3', '#ffe4e6', '#fecaca',
+        '#fed7aa', '#fef08a', '#d9f99d', '#bbf7d0', '#99f6e4'
+    ]
+
+    # Extend colors if needed
+    while len(base_colors) < topic_count:
+        base_colors.extend(base_colors)
+
+    colors_json = json.dumps(base_colors[:max(topic_count, 25)])
+
+    return f'''\
+/**
+ * Chart.js Configurations
+ */
+
+const Charts = {{
+    coherenceChart: null,
+
+    colors: {colors_json},
+
+    init() {{
+        this.initCoherenceChart();
+    }},
+
+    initCoherenceChart() {{
+        const ctx = document.getElementById('coherence-chart');
+        if (!ctx) return;
+
+        const scores = TopicData.getCoherenceScores();
+
+        const data = {{
+            labels: scores.map(s => `Topic ${{s.topicNum}}`),
+            datasets: [{{
+                label: 'Coherence Score (C_V)',
+                data: scores.map(s => s.score),
+                backgroundColor: scores.map((_, i) => this.colors[i % this.colors.length]),
+                borderColor: scores.map((_, i) => this.colors[i % this.colors.length]),
+                borderWidth: 1,
+                borderRadius: 4,
+                barThickness: Math.max(8, Math.min(20, 500 / scores.length))
+            }}]
+        }};
+
+        const averageCoherence = TopicData.getAverageCoherence();
+
+        const config = {{
+            type: 'bar',
+            data: data,
+            options: {{
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {{
+                    legend: {{ display: false }},
+                    tooltip: {{
+                        callbacks: {{
+                            label: function(context) {{
+                                return `Coherence: ${{context.raw.toFixed(4)}}`;
+                            }},
+                            afterLabel: function(context) {{
+                                const topicNum = context.dataIndex + 1;
+                                const topWords = TopicData.getTopWords(topicNum, 3);
+                                return `Top words: ${{topWords.map(w => w.word).join(', ')}}`;
+                            }}
+                        }}
+                    }}
+                }},
+                scales: {{
+                    x: {{
+                        grid: {{ display: false }},
+                        ticks: {{ maxRotation: 45, minRotation: 45 }}
+                    }},
+                    y: {{
+                        beginAtZero: false,
+                        min: 0.4,
+                        max: 1.0,
+                        grid: {{ color: '#e2e8f0' }},
+                        title: {{ display: true, text: 'Coherence Score (C_V)' }}
+                    }}
+                }},
+                onClick: (event, elements) => {{
+                    if (elements.length > 0) {{
+                        const index = elements[0].index;
+                        const topicNum = index + 1;
+                        showTopicModal(topicNum);
+                    }}
+                }}
+            }}
+        }};
+
+        this.coherenceChart = new Chart(ctx, config);
+    }},
+
+    getTopicColor(topicNum) {{
+        return this.colors[(topicNum - 1) % this.colors.length];
+    }},
+
+    destroy() {{
+        if (this.coherenceChart) {{
+            this.coherenceChart.destroy();
+            this.coherenceChart = null;
+        }}
+    }}
+}};
+
+window.Charts = Charts;
+'''
+
+
+# =============================================================================
+# JavaScript snippet - windowed list rendering (app.js and topic-graph.html)
+# =============================================================================
+VIRTUAL_LIST_JS = '''\
+/**
+ * Windowed rendering: only the items in or near the visible part of the
+ * scroller exist in the DOM. Works for single-column lists and CSS grids
+ * (one row of cards at a time); the rows above and below the window are
+ * replaced by two full-width spacer elements, so the scrollbar covers the full
+ * list and the container keeps its own padding.
+ */
+class VirtualList {
+    constructor(container, { count, renderItem, scroller = window, overscan = 2 }) {
+        this.container = container;
+        this.scroller = scroller;
+        this.overscan = overscan;
+        this.items = new Map();
+        this.before = this.spacer();
+        this.after = this.spacer();
+        this.frame = null;
+        this.schedule = this.schedule.bind(this);
+
+        scroller.addEventListener('scroll', this.schedule, { passive: true });
+        window.addEventListener('resize', this.schedule);
+
+        // Also fires when a hidden section or panel is shown and when a card changes height
+        this.observer = new ResizeObserver(this.schedule);
+        this.observer.observe(container);
+
+        this.reset(count, renderItem);
+    }
+
+    // Replace the whole list (renderItem returns an element or an HTML string)
+    reset(count, renderItem = this.renderItem) {
+        this.count = count;
+        this.renderItem = renderItem;
+        this.columns = 0;
+        this.rowHeights = [];
+        this.items.forEach(el => this.observer.unobserve(el));
+        this.items.clear();
+        this.container.replaceChildren();
+        this.render();
+    }
+
+    // Re-render the visible items, e.g. after the state they show changed
+    refresh() {
+        this.items.forEach(el => this.observer.unobserve(el));
+        this.items.clear();
+        this.render();
+    }
+
+    spacer() {
+        const el = document.createElement('div');
+        el.setAttribute('aria-hidden', 'true');
+        el.style.gridColumn = '1 / -1';
+        return el;
+    }
+
+    // A spacer stands in for rows that each end with a gap; it is followed
+    // (or preceded) by one gap itself, so it is one gap shorter
+    sizeSpacer(el, height) {
+        el.style.display = height > 0 ? '' : 'none';
+        el.style.height = Math.max(0, height - this.gap) + 'px';
+    }
+
+    schedule() {
+        if (this.frame !== null) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.render();
+        });
+    }
+
+    layout() {
+        const style = getComputedStyle(this.container);
+        const tracks = style.gridTemplateColumns;
+        const columns = tracks && tracks !== 'none' ? tracks.split(' ').length : 1;
+        if (columns !== this.columns) {
+            this.columns = columns;
+            this.rowHeights = [];
+        }
+        this.gap = parseFloat(style.rowGap) || 0;
+    }
+
+    measure() {
+        const heights = {};
+        this.items.forEach((el, index) => {
+            const row = Math.floor(index / this.columns);
+            heights[row] = Math.max(heights[row] || 0, el.offsetHeight);
+        });
+        Object.entries(heights).forEach(([row, height]) => this.rowHeights[row] = height);
+    }
+
+    // Top of every row relative to the first one (offsets[rows] is the full height plus one gap)
+    offsets() {
+        const rows = Math.ceil(this.count / this.columns);
+        const measured = this.rowHeights.filter(height => height > 0);
+        const estimate = measured.length ? measured.reduce((a, b) => a + b, 0) / measured.length : 120;
+        const offsets = [0];
+        for (let row = 0; row < rows; row++) {
+            offsets.push(offsets[row] + (this.rowHeights[row] || estimate) + this.gap);
+        }
+        return offsets;
+    }
+
+    // Visible range relative to the top of the container
+    viewport() {
+        const top = this.container.getBoundingClientRect().top;
+        if (this.scroller === window) return { top: -top, bottom: window.innerHeight - top };
+        const view = this.scroller.getBoundingClientRect();
+        return { top: view.top - top, bottom: view.top - top + this.scroller.clientHeight };
+    }
+
+    render() {
+        // Nothing can be measured while the container is hidden
+        if (!this.container.isConnected || this.container.clientWidth === 0) return;
+        if (this.count === 0) {
+            this.container.replaceChildren();
+            return;
+        }
+
+        this.layout();
+        this.measure();
+        const offsets = this.offsets();
+        const rows = offsets.length - 1;
+        const { top, bottom } = this.viewport();
+
+        let first = 0;
+        while (first < rows - 1 && offsets[first + 1] <= top) first++;
+        let last = first;
+        while (last < rows - 1 && offsets[last + 1] < bottom) last++;
+        first = Math.max(0, first - this.overscan);
+        last = Math.min(rows - 1, last + this.overscan);
+
+        const start = first * this.columns;
+        const end = Math.min(this.count, (last + 1) * this.columns);
+        const nodes = [];
+        for (let index = start; index < end; index++) {
+            let el = this.items.get(index);
+            if (!el) {
+                el = this.renderItem(index);
+                if (typeof el === 'string') {
+                    const template = document.createElement('template');
+                    template.innerHTML = el.trim();
+                    el = template.content.firstElementChild;
+                }
+                this.items.set(index, el);
+                this.observer.observe(el);
+            }
+            nodes.push(el);
+        }
+        this.items.forEach((el, index) => {
+            if (index < start || index >= end) {
+                this.observer.unobserve(el);
+                this.items.delete(index);
+            }
+        });
+
+        this.sizeSpacer(this.before, offsets[first]);
+        this.sizeSpacer(this.after, offsets[rows] - offsets[last + 1]);
+        nodes.unshift(this.before);
+        nodes.push(this.after);
+
+        // Moving existing nodes keeps their state (loaded images, focus)
+        const current = this.container.children;
+        if (current.length !== nodes.length || nodes.some((el, i) => current[i] !== el)) {
+            this.container.replaceChildren(...nodes);
+        }
+    }
+
+    scrollToIndex(index, behavior = 'smooth') {
+        this.render();
+        if (!this.columns) return;
+
+        const offset = this.offsets()[Math.floor(index / this.columns)];
+        const top = this.container.getBoundingClientRect().top + offset;
+        if (this.scroller === window) {
+            window.scrollTo({ top: window.scrollY + top, behavior });
+        } else {
+            const view = this.scroller.getBoundingClientRect().top;
+            this.scroller.scrollTo({ top: this.scroller.scrollTop + top - view, behavior });
+        }
+    }
+}
+'''
+
+
+# =============================================================================
+# JavaScript Content - app.js
+# =============================================================================
+APP_JS = '''\
+/**
+ * Main Application Logic
+ */
+
+let currentSection = 'overview';
+let currentTopic = 1;
+let currentDocumentsTopic = null;
+let documentSearchId = 0;
+
+// Windowed views (VirtualList) of the topic cards and document cards
+let topicSummaries = [];
+let topicsGridList = null;
+let documentsList = null;
+const expandedDocuments = new Set();
+
+// Sections other than Overview are built the first time they are opened
+const sectionInitializers = {
+    topics: () => initTopicsGrid(),
+    documents: () => initDocumentsSection()
+};
+const initializedSections = new Set();
+
+async function init() {
+    showLoading(true);
+
+    const success = await TopicData.loadAll();
+
+    if (!success) {
+        showError('Failed to load data. Please refresh the page.');
+        return;
+    }
+
+    initNavigation();
+    initOverview();
+    Charts.init();
+    activateSection(currentSection);
+    showLoading(false);
+}
+
+function showLoading(show) {
+    console.log(show ? 'Loading...' : 'Loaded');
+}
+
+function showError(message) {
+    const main = document.querySelector('.main-content');
+    main.innerHTML = `<div class="error-message" style="text-align: center; padding: 2rem; color: #dc2626;">${message}</div>`;
+}
+
+function initNavigation() {
+    const tabs = document.querySelectorAll('.nav-tab');
+    tabs.forEach(tab => {
+        tab.addEventListener('click', () => {
+            const section = tab.dataset.section;
+            switchSection(section);
+        });
+    });
+}
+
+function switchSection(sectionId) {
+    document.querySelectorAll('.nav-tab').forEach(tab => {
+        tab.classList.toggle('active', tab.dataset.section === sectionId);
+    });
+    document.querySelectorAll('.section').forEach(section => {
+        section.classList.toggle('active', section.id === sectionId);
+    });
+    currentSection = sectionId;
+    activateSection(sectionId);
+}
+
+function activateSection(sectionId) {
+    loadDeferredMedia(sectionId);
+
+    if (initializedSections.has(sectionId)) return;
+    initializedSections.add(sectionId);
+    sectionInitializers[sectionId]?.();
+}
+
+function loadDeferredMedia(sectionId) {
+    // Iframes and large images only start loading once their tab is opened
+    const section = document.getElementById(sectionId);
+    if (!section) return;
+
+    section.querySelectorAll('[data-srcset]').forEach(el => {
+        el.srcset = el.dataset.srcset;
+        el.removeAttribute('data-srcset');
+    });
+    section.querySelectorAll('[data-src]').forEach(el => {
+        el.src = el.dataset.src;
+        el.removeAttribute('data-src');
+    });
+}
+
+function initOverview() {
+    document.getElementById('total-topics').textContent = TopicData.getTopicCount();
+    document.getElementById('avg-coherence').textContent = TopicData.getAverageCoherence().toFixed(3);
+
+    const diversity = TopicData.getDiversityMetrics();
+    if (diversity && diversity.overallScore) {
+        document.getElementById('diversity-score').textContent = (diversity.overallScore * 100).toFixed(1) + '%';
+        document.getElementById('unique-words').textContent = diversity.uniqueWords?.toLocaleString() || '-';
+    } else {
+        document.getElementById('diversity-score').textContent = 'N/A';
+        document.getElementById('unique-words').textContent = 'N/A';
+    }
+}
+
+function initTopicsGrid() {
+    const grid = document.getElementById('topics-grid');
+    if (!grid) return;
+
+    initTermSearch();
+
+    topicSummaries = TopicData.getTopicSummaries();
+    topicsGridList = new VirtualList(grid, {
+        count: topicSummaries.length,
+        renderItem: index => renderTopicCard(topicSummaries[index])
+    });
+}
+
+function renderTopicCard(topic) {
+    return `
+        <div class="topic-card" onclick="showTopicModal(${topic.topicNum})" data-topic="${topic.topicNum}">
+            <div class="topic-card-header">
+                <span class="topic-number">Topic ${topic.topicNum}</span>
+                <span class="coherence-badge ${topic.coherence < 0.6 ? 'low' : ''}">${topic.coherence.toFixed(3)}</span>
+            </div>
+            <img
+                src="${topic.wordcloudPath}"
+                alt="Topic ${topic.topicNum} Wordcloud"
+                class="topic-wordcloud"
+                loading="lazy"
+            >
+            <div class="topic-words">
+                <div class="topic-words-list">
+                    ${topic.topWords.slice(0, 5).map(w => `<span class="word-tag">${w.word}</span>`).join('')}
+                </div>
+            </div>
+        </div>
+    `;
+}
+
+function initTermSearch() {
+    const input = document.getElementById('term-search');
+    if (!input) return;
+
+    let timer = null;
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => findTerm(input.value), 150);
+    });
+}
+
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+}
+
+async function findTerm(query) {
+    const container = document.getElementById('term-results');
+    if (!container) return;
+
+    if (!query.trim()) {
+        container.innerHTML = '';
+        return;
+    }
+
+    let found;
+    try {
+        found = await TopicData.findTerm(query);
+    } catch (error) {
+        console.error('Error loading term index:', error);
+        container.innerHTML = '<p class="term-status">Term lookup is not available for this model.</p>';
+        return;
+    }
+
+    // The input may have changed while the index was loading
+    if (document.getElementById('term-search').value !== query) return;
+
+    // The term comes straight from the input box
+    const word = escapeHtml(found.term.replace(/_/g, ' '));
+    const status = found.hits.length
+        ? `"${word}" is in ${found.hits.length} topic${found.hits.length === 1 ? '' : 's'}:`
+        : `"${word}" is not among the top words of any topic.`;
+
+    container.innerHTML = `
+        <p class="term-status">${status}</p>
+        <div class="term-hits">
+            ${found.hits.map(hit => `
+                <button class="term-hit" onclick="showTopicModal(${hit.topicNum})">
+                    Topic ${hit.topicNum} <span>#${hit.rank} · ${hit.score.toFixed(3)}</span>
+                </button>
+            `).join('')}
+        </div>
+        ${found.suggestions.length ? `
+        <div class="term-suggestions">
+            ${found.suggestions.map(term => `
+                <button class="word-tag" onclick="searchTerm(this.textContent)">${escapeHtml(term.replace(/_/g, ' '))}</button>
+            `).join('')}
+        </div>` : ''}
+    `;
+}
+
+function searchTerm(word) {
+    const input = document.getElementById('term-search');
+    if (!input) return;
+    input.value = word.trim();
+    findTerm(input.value);
+}
+
+function initDocumentsSection() {
+    const select = document.getElementById('topic-select');
+    if (!select) return;
+
+    const topicCount = TopicData.getTopicCount();
+
+    select.innerHTML = '';
+    for (let i = 1; i <= topicCount; i++) {
+        const topWords = TopicData.getTopWords(i, 3);
+        const label = topWords.map(w => w.word).join(', ');
+
+        const option = document.createElement('option');
+        option.value = i;
+        option.textContent = `Topic ${i}: ${label}`;
+        select.appendChild(option);
+    }
+
+    select.addEventListener('change', () => {
+        loadDocuments(parseInt(select.value));
+    });
+
+    initDocumentSearch();
+    loadDocuments(1);
+}
+
+function initDocumentSearch() {
+    const input = document.getElementById('documents-search');
+    if (!input) return;
+
+    let timer = null;
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => searchDocuments(input.value), 200);
+    });
+}
+
+async function searchDocuments(query) {
+    const status = document.getElementById('documents-search-status');
+    const select = document.getElementById('topic-select');
+    if (!status || !select) return;
+
+    // Newer input supersedes searches still waiting for shards
+    const searchId = ++documentSearchId;
+
+    if (!query.trim()) {
+        status.textContent = '';
+        select.disabled = false;
+        loadDocuments(parseInt(select.value));
+        return;
+    }
+
+    select.disabled = true;
+    currentDocumentsTopic = null;
+    showDocumentsMessage('<div class="loading">Searching</div>');
+
+    let found = null;
+    try {
+        found = await TopicData.searchDocuments(query);
+    } catch (error) {
+        console.error('Error searching documents:', error);
+    }
+    if (searchId !== documentSearchId) return;
+
+    if (!found) {
+        status.textContent = 'Search is not available for this model.';
+        showDocumentsMessage('');
+        return;
+    }
+
+    const shown = found.results.length;
+    status.textContent = found.total === 0
+        ? 'No matching documents.'
+        : `${found.total} matching document${found.total === 1 ? '' : 's'}` +
+          (found.total > shown ? `, showing the first ${shown}` : '');
+
+    showDocumentCards(found.results.map(({ topicNum, rank, doc }) => ({
+        doc,
+        heading: `Topic ${topicNum} · #${rank + 1} (ID: ${doc.id})`,
+        text: documentSnippet(doc.text, found.terms)
+    })));
+}
+
+function documentSnippet(text, terms) {
+    // A preview-sized window of words starting just before the first match
+    const words = text.split(/\\s+/);
+    const first = words.findIndex(word =>
+        TopicData.tokenize(word).some(token => terms.some(term => token.startsWith(term))));
+    const start = Math.max(0, first - 20);
+    return (start > 0 ? '… ' : '') + words.slice(start, start + 100).join(' ');
+}
+
+function showDocumentsMessage(html) {
+    const container = document.getElementById('documents-list');
+    if (!container) return;
+    if (documentsList) documentsList.reset(0);
+    container.innerHTML = html;
+}
+
+// cards: [{ doc, heading, text }], rendered as they scroll into view
+function showDocumentCards(cards) {
+    const container = document.getElementById('documents-list');
+    if (!container) return;
+
+    expandedDocuments.clear();
+    const renderItem = index => renderDocumentCard(cards[index].doc, index, cards[index].heading, cards[index].text);
+    if (documentsList) {
+        documentsList.reset(cards.length, renderItem);
+    } else {
+        documentsList = new VirtualList(container, { count: cards.length, renderItem });
+    }
+}
+
+function renderDocumentCard(doc, index, heading, text) {
+    const expanded = expandedDocuments.has(index);
+    return `
+        <div class="document-card">
+            <div class="document-header">
+                <span class="document-id">${heading}</span>
+                <span class="document-score">Score: ${doc.score.toFixed(4)}</span>
+            </div>
+            <div class="document-text${expanded ? ' expanded' : ''}" id="doc-text-${index}">
+                ${text}
+            </div>
+            <button class="expand-btn" onclick="toggleDocumentExpand(${index})">${expanded ? 'Show less' : 'Show more'}</button>
+        </div>
+    `;
+}
+
+async function loadDocuments(topicNum) {
+    currentDocumentsTopic = topicNum;
+    showDocumentsMessage('<div class="loading">Loading documents</div>');
+
+    const docs = await TopicData.getTopDocuments(topicNum);
+
+    // Another topic was selected while this shard was loading
+    if (currentDocumentsTopic !== topicNum) return;
+
+    if (docs.length === 0) {
+        showDocumentsMessage('<p class="no-docs">No documents available for this topic.</p>');
+        return;
+    }
+
+    showDocumentCards(docs.map((doc, index) => ({ doc, heading: `#${index + 1} (ID: ${doc.id})`, text: doc.preview })));
+}
+
+function toggleDocumentExpand(index) {
+    const textEl = document.getElementById(`doc-text-${index}`);
+    const btn = textEl.nextElementSibling;
+
+    // Remembered so the card keeps its state when it is rendered again after scrolling
+    if (expandedDocuments.has(index)) {
+        expandedDocuments.delete(index);
+        textEl.classList.remove('expanded');
+        btn.textContent = 'Show more';
+    } else {
+        expandedDocuments.add(index);
+        textEl.classList.add('expanded');
+        btn.textContent = 'Show less';
+    }
+}
+
+async function showTopicModal(topicNum) {
+    const modal = document.getElementById('topic-modal');
+    if (!modal) return;
+
+    // The modal lists all top words, which come with the full data
+    await TopicData.detailsLoaded;
+
+    const topWords = TopicData.getTopWords(topicNum);
+    const coherenceScores = TopicData.getCoherenceScores();
+    const coherence = coherenceScores.find(s => s.topicNum === topicNum)?.score || 0;
+
+    document.getElementById('modal-title').textContent = `Topic ${topicNum}`;
+    document.getElementById('modal-coherence').textContent = `C_V: ${coherence.toFixed(3)}`;
+    document.getElementById('modal-coherence').className = `coherence-badge ${coherence < 0.6 ? 'low' : ''}`;
+    document.getElementById('modal-wordcloud-img').src = TopicData.getWordcloudPath(topicNum);
+
+    const tbody = document.querySelector('#modal-words-table tbody');
+    tbody.innerHTML = topWords.map(word => `
+        <tr>
+            <td>${word.word}</td>
+            <td>${word.score.toFixed(4)}</td>
+        </tr>
+    `).join('');
+
+    modal.classList.add('active');
+    currentTopic = topicNum;
+}
+
+function closeModal() {
+    const modal = document.getElementById('topic-modal');
+    if (modal) modal.classList.remove('active');
+}
+
+function openLightbox(img) {
+    const lightbox = document.getElementById('lightbox');
+    const lightboxImg = document.getElementById('lightbox-img');
+
+    if (lightbox && lightboxImg) {
+        lightboxImg.src = img.src;
+        lightbox.classList.add('active');
+    }
+}
+
+function closeLightbox() {
+    const lightbox = document.getElementById('lightbox');
+    if (lightbox) lightbox.classList.remove('active');
+}
+
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape') {
+        closeModal();
+        closeLightbox();
+    }
+});
+
+document.getElementById('topic-modal')?.addEventListener('click', (e) => {
+    if (e.target.classList.contains('modal')) closeModal();
+});
+
+document.addEventListener('DOMContentLoaded', init);
+'''
+
+
+# =============================================================================
+# JavaScript snippet for wordcloud sprites (injected when atlases are built)
+# =============================================================================
+WORDCLOUD_ATLAS_JS = '''\
+// Thumbnail tiles of the wordclouds in a few sprite atlases (see render_wordcloud_atlas)
+const WORDCLOUD_ATLAS = __WORDCLOUD_ATLAS__;
+
+function wordcloudSprite(topic) {
+    const tile = WORDCLOUD_ATLAS.topics[topic.topicNum];
+    if (!tile) {
+        return `<img src="${topic.wordcloudPath}" alt="Topic ${topic.topicNum} Wordcloud" class="topic-wordcloud" loading="lazy">`;
+    }
+
+    // Scale the atlas so one tile spans the element, then shift it to the tile
+    const [atlasIndex, x, y] = tile;
+    const atlas = WORDCLOUD_ATLAS.atlases[atlasIndex];
+    const [width, height] = WORDCLOUD_ATLAS.tile;
+    const left = atlas.width > width ? x / (atlas.width - width) * 100 : 0;
+    const top = atlas.height > height ? y / (atlas.height - height) * 100 : 0;
+    const style = `background-image: url('${encodeURI(atlas.src)}'); ` +
+        `background-size: ${atlas.width / width * 100}% auto; ` +
+        `background-position: ${left}% ${top}%; aspect-ratio: ${width} / ${height}`;
+    return `<div class="topic-wordcloud topic-wordcloud-sprite" role="img" aria-label="Topic ${topic.topicNum} Wordcloud" style="${style}"></div>`;
+}
+
+'''
+
+WORDCLOUD_THUMBS_JS = '''\
+// Suffixes of the optimized wordcloud thumbnails per topic and MIME type (see optimize_image)
+const WORDCLOUD_THUMBS = __WORDCLOUD_THUMBS__;
+
+function wordcloudSources(topic) {
+    const suffixes = WORDCLOUD_THUMBS[topic.topicNum] || {};
+    return Object.entries(suffixes).map(([type, suffix]) =>
+        `<source type="${type}" srcset="${encodeURI(topic.wordcloudPath.replace(/\\.png$/, suffix))}">`
+    ).join('');
+}
+
+'''
+
+
+# =============================================================================
+# JavaScript snippet for topic descriptions (injected when md file is present)
+# =============================================================================
+TOPIC_DESCRIPTIONS_JS = '''\
+async function loadTopicDescriptions(mdFileName) {
+    // Parsed at build time into summary.json; the .md is only fetched without it
+    const descriptions = TopicData.summary?.descriptions;
+    if (descriptions) {
+        Object.entries(descriptions).forEach(([num, label]) => {
+            topicLabels[parseInt(num)] = label;
+        });
+    } else {
+        try {
+            const response = await fetch(mdFileName);
+            if (!response.ok) return;
+            const text = await response.text();
+            const lines = text.split('\\n');
+            lines.forEach(line => {
+                const match = line.match(/^\\d+\\.\\s+\\*\\*Topic\\s+(\\d+):\\*\\*\\s+(.+)/);
+                if (match) {
+                    topicLabels[parseInt(match[1])] = match[2].trim();
+                }
+            });
+        } catch (e) {
+            // silently skip if md file can't be loaded
+        }
+    }
 
     const container = document.getElementById('descriptions-list');
     if (!container) return;
@@ -1130,727 +3749,1860 @@ async function loadTopicDescriptions(mdFileName) {
             <span class="description-num">Topic ${String(num).padStart(2, '0')}</span>
             <span class="description-label">${label}</span>
         </div>
-    `).join('');
-}
+    `).join('');
+}
+
+function goToTopic(num) {
+    switchSection('topics');
+    // The grid is windowed, so the card may not exist yet: scroll to its row instead
+    const index = topicSummaries.findIndex(topic => topic.topicNum === num);
+    if (index !== -1) topicsGridList?.scrollToIndex(index);
+}
+
+'''
+
+
+def generate_app_js(md_filename=None, wordcloud_variants=None, wordcloud_atlas=None):
+    """
+    Generate app.js, optionally with topic descriptions support when md_filename is provided.
+
+    When wordcloud_atlas (the WORDCLOUD_ATLAS_MAP written by render_wordcloud_atlas)
+    is given, the topic cards draw their wordcloud from the sprite atlases.
+    Otherwise, when wordcloud_variants ({rel_path: optimize_image output} of the
+    wordclouds) is given, the topic cards load the small encodings through
+    <picture> sources.
+    """
+    js = VIRTUAL_LIST_JS + APP_JS
+    card_image = '            <img\n                src="${topic.wordcloudPath}"\n                alt="Topic ${topic.topicNum} Wordcloud"\n                class="topic-wordcloud"\n                loading="lazy"\n            >\n'
+
+    if wordcloud_atlas:
+        js = js.replace(card_image, '            ${wordcloudSprite(topic)}\n')
+        js = js.replace(
+            'function renderTopicCard(topic) {',
+            WORDCLOUD_ATLAS_JS.replace('__WORDCLOUD_ATLAS__', json.dumps(wordcloud_atlas, separators=(',', ':')))
+            + 'function renderTopicCard(topic) {'
+        )
+    elif wordcloud_variants:
+        # Thumbnail suffix per topic and format; wordclouds of different widths get different ones
+        thumbs = {}
+        for rel_path, variants in wordcloud_variants.items():
+            stem = rel_path.rsplit('.', 1)[0]
+            topic = topic_number(Path(rel_path).stem)
+            thumbs[topic] = {v["type"]: v["src"][len(stem):] for v in variants}
+        js = js.replace(
+            'function renderTopicCard(topic) {',
+            WORDCLOUD_THUMBS_JS.replace('__WORDCLOUD_THUMBS__', json.dumps(thumbs, separators=(',', ':')))
+            + 'function renderTopicCard(topic) {'
+        )
+        js = js.replace(
+            card_image,
+            '            <picture>${wordcloudSources(topic)}\n            <img\n                src="${topic.wordcloudPath}"\n                alt="Topic ${topic.topicNum} Wordcloud"\n                class="topic-wordcloud"\n                loading="lazy"\n            >\n            </picture>\n'
+        )
+
+    if not md_filename:
+        return js
+
+    # Add topicLabels variable declaration
+    js = js.replace(
+        'let currentTopic = 1;',
+        'let currentTopic = 1;\nlet topicLabels = {};'
+    )
+
+    # Add loadTopicDescriptions() call in init()
+    js = js.replace(
+        '    initNavigation();\n    initOverview();',
+        f"    await loadTopicDescriptions('{md_filename}');\n    initNavigation();\n    initOverview();"
+    )
+
+    # Insert loadTopicDescriptions + goToTopic functions before showError
+    js = js.replace(
+        'function showError(message) {',
+        TOPIC_DESCRIPTIONS_JS + 'function showError(message) {'
+    )
+
+    # Add topic label inside topic card (after the header div, before the wordcloud)
+    js = js.replace(
+        '${topic.coherence.toFixed(3)}</span>\n            </div>\n',
+        '${topic.coherence.toFixed(3)}</span>\n            </div>\n            ${topicLabels[topic.topicNum] ? `<div class="topic-label">${topicLabels[topic.topicNum]}</div>` : \'\'}\n'
+    )
+
+    return js
+
+
+# =============================================================================
+# JavaScript Content - sw.js (service worker, when enabled)
+# =============================================================================
+SERVICE_WORKER_JS = '''\
+/**
+ * Service worker: serves the dashboard from a per-build cache
+ * The cache name changes with every build, so a new deployment replaces it
+ */
+
+const CACHE_PREFIX = '__CACHE_PREFIX__';
+const CACHE_NAME = CACHE_PREFIX + '__CACHE_VERSION__';
+
+// App shell, fetched when the worker installs
+const PRECACHE_URLS = __PRECACHE_URLS__;
+
+// Everything else in the app (wordclouds, document and search shards, the
+// graph and violin pages and their data) is cached on first use
+const SCOPE = self.registration.scope;
+
+// Versioned library builds, cached on first use (CDN responses are opaque)
+const LIBRARY_URLS = new Set(__LIBRARY_URLS__.map(url => new URL(url, self.registration.scope).href));
+
+const PRECACHE = new Set(PRECACHE_URLS.map(url => new URL(url, self.registration.scope).href));
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(key => key.startsWith(CACHE_PREFIX) && key !== CACHE_NAME)
+                    .map(key => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    url.hash = '';
+    if (url.href === self.registration.scope) url.pathname += 'index.html';
+    const href = url.href;
+    const cacheable = PRECACHE.has(href) || LIBRARY_URLS.has(href) || href.startsWith(SCOPE);
+    if (!cacheable) return;
+
+    event.respondWith(
+        caches.open(CACHE_NAME).then(async cache => {
+            const cached = await cache.match(href, { ignoreSearch: PRECACHE.has(href) });
+            if (cached) return cached;
+
+            const response = await fetch(request);
+            if (response.ok || response.type === 'opaque') {
+                cache.put(request, response.clone());
+            }
+            return response;
+        })
+    );
+});
+'''
+
+# Registration snippet appended to index.html when the service worker is enabled
+SERVICE_WORKER_REGISTRATION = '''\
+    <script>
+        if ('serviceWorker' in navigator) {
+            window.addEventListener('load', () => navigator.serviceWorker.register('sw.js'));
+        }
+    </script>
+'''
+
+
+def generate_service_worker_js(app_name: str, version: str, precache_urls: list, library_urls: list) -> str:
+    """
+    Generate sw.js for one app.
+
+    Args:
+        app_name: App directory name (caches are per origin, so each app
+            prefixes its cache names and only deletes its own old caches)
+        version: Build version, e.g. a hash of the build manifest
+        precache_urls: App-relative URLs fetched at install (the app shell)
+        library_urls: Library URLs (CDN, or vendored copies) cached on first use
+
+    Returns:
+        Service worker source
+    """
+    return (SERVICE_WORKER_JS
+            .replace('__CACHE_PREFIX__', f'topic-app:{app_name}:')
+            .replace('__CACHE_VERSION__', version)
+            .replace('__PRECACHE_URLS__', json.dumps(precache_urls))
+            .replace('__LIBRARY_URLS__', json.dumps(library_urls)))
+
+
+def generate_index_html(method_upper: str, topic_count: int, dataset_title: str, has_violin_plot: bool = False, has_umap: bool = False, md_filename: str = None, image_variants: dict = None, asset_urls: dict = None, service_worker: bool = False) -> str:
+    """
+    Generate index.html content with dynamic topic count.
+
+    image_variants maps an image path (e.g. 'images/tsne.png') to its optimize_image
+    output; those images are emitted as <picture> elements with a srcset.
+    asset_urls maps the app's own CSS/JS paths (e.g. 'js/app.js') and library URLs
+    (e.g. CHARTJS_SRC) to the URL to reference instead, such as a content-hashed
+    file in the shared asset directory. With service_worker the page registers sw.js.
+    """
+    image_variants = image_variants or {}
+    asset_urls = asset_urls or {}
+    styles_url = asset_urls.get("css/styles.css", "css/styles.css")
+    topics_url = asset_urls.get("js/topics.js", "js/topics.js")
+    charts_url = asset_urls.get("js/charts.js", "js/charts.js")
+    app_url = asset_urls.get("js/app.js", "js/app.js")
+    chartjs_url = asset_urls.get(CHARTJS_SRC, CHARTJS_SRC)
+    sw_registration = SERVICE_WORKER_REGISTRATION if service_worker else ''
+    viz_sizes = "(max-width: 768px) 100vw, 50vw"
+
+    def viz_image(src, alt, css_class="viz-image", sizes=viz_sizes, lazy=False):
+        return image_html(src, alt, css_class, image_variants.get(src), sizes, lazy)
+
+    # Conditionally add violin plot tab
+    violin_tab = '<button class="nav-tab" data-section="violin">Interactive Violin Plot</button>' if has_violin_plot else ''
+
+    # Conditionally add topic descriptions tab
+    descriptions_tab = '<button class="nav-tab" data-section="descriptions">Topic Descriptions</button>' if md_filename else ''
+
+    # Conditionally add violin plot section
+    violin_section = '''
+        <section id="violin" class="section">
+            <div class="section-header">
+                <h2>Interactive Violin Plot</h2>
+                <p>Topic distribution by year - hover over violins for details</p>
+                <a href="violin-plot.html" target="_blank" class="open-fullscreen">Open in Full Screen</a>
+            </div>
+            <div class="graph-container">
+                <iframe data-src="violin-plot.html" id="violin-plot-iframe" title="Interactive Violin Plot"></iframe>
+            </div>
+        </section>
+''' if has_violin_plot else ''
+
+    # Conditionally add UMAP visualization card
+    umap_card = f'''
+                <div class="viz-card">
+                    <h3>UMAP Visualization</h3>
+                    {viz_image("images/umap.png", "UMAP Visualization")}
+                </div>
+''' if has_umap else ''
+
+    # Conditionally add topic descriptions section
+    descriptions_section = f'''
+        <section id="descriptions" class="section">
+            <div class="section-header">
+                <h2>Topic Descriptions</h2>
+                <p>Human-readable topic labels and descriptions</p>
+            </div>
+            <div class="descriptions-list" id="descriptions-list"></div>
+        </section>
+''' if md_filename else ''
+
+    return f'''\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{dataset_title} Topic Analysis - {method_upper}</title>
+    <script src="{chartjs_url}"></script>
+    <link rel="stylesheet" href="{styles_url}">
+</head>
+<body>
+    <header class="header">
+        <div class="header-content">
+            <h1>{dataset_title} Topic Analysis</h1>
+            <p class="subtitle">{method_upper}-based Topic Modeling Results ({topic_count} Topics)</p>
+        </div>
+    </header>
+
+    <nav class="nav-tabs">
+        <button class="nav-tab active" data-section="overview">Overview</button>
+        <button class="nav-tab" data-section="topics">Topic Explorer</button>
+        <button class="nav-tab" data-section="graph">Interactive Temporal Graph</button>
+        {violin_tab}
+        <button class="nav-tab" data-section="temporal">Temporal Trends</button>
+        <button class="nav-tab" data-section="documents">Top Documents</button>
+        {descriptions_tab}
+    </nav>
+
+    <main class="main-content">
+        <section id="overview" class="section active">
+            <div class="section-header">
+                <h2>Model Overview</h2>
+            </div>
+
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <div class="stat-value" id="total-topics">{topic_count}</div>
+                    <div class="stat-label">Topics</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value" id="avg-coherence">-</div>
+                    <div class="stat-label">Avg. Coherence (C_V)</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value" id="diversity-score">-</div>
+                    <div class="stat-label">Diversity Score</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value" id="unique-words">-</div>
+                    <div class="stat-label">Unique Words</div>
+                </div>
+            </div>
+
+            <div class="charts-row">
+                <div class="chart-container">
+                    <h3>Topic Coherence Scores (C_V)</h3>
+                    <canvas id="coherence-chart"></canvas>
+                </div>
+            </div>
+
+            <div class="visualizations-grid">
+                <div class="viz-card">
+                    <h3>t-SNE Visualization</h3>
+                    {viz_image("images/tsne.png", "t-SNE Visualization")}
+                </div>
+{umap_card}
+                <div class="viz-card">
+                    <h3>Document Distribution</h3>
+                    {viz_image("images/document_dist.png", "Document Distribution")}
+                </div>
+            </div>
+        </section>
+
+        <section id="topics" class="section">
+            <div class="section-header">
+                <h2>Topic Explorer</h2>
+                <p>Click on any topic card to see detailed information</p>
+            </div>
+            <div class="term-search">
+                <input type="search" id="term-search" placeholder="Find a word across topics..." aria-label="Find a word across topics">
+                <div id="term-results"></div>
+            </div>
+            <div class="topics-grid" id="topics-grid"></div>
+        </section>
+
+        <section id="graph" class="section">
+            <div class="section-header">
+                <h2>Interactive Topic Temporal Line Graph</h2>
+                <p>Interactive visualization of topic temporal changes</p>
+                <a href="topic-graph.html" target="_blank" class="open-fullscreen">Open in Full Screen</a>
+            </div>
+            <div class="graph-container">
+                <iframe data-src="topic-graph.html" id="topic-graph-iframe" title="Interactive Topic Temporal Line Graph"></iframe>
+            </div>
+        </section>
+{violin_section}
+        <section id="temporal" class="section">
+            <div class="section-header">
+                <h2>Temporal Trends</h2>
+                <p>Topic distribution over time</p>
+            </div>
+
+            <div class="temporal-grid">
+                <div class="temporal-card">
+                    <h3>Quarterly Trends (Line Chart)</h3>
+                    {viz_image("images/temporal_line.png", "Temporal Line Chart", "temporal-image", lazy=True)}
+                </div>
+                <div class="temporal-card">
+                    <h3>Quarterly Trends (Stacked Area)</h3>
+                    {viz_image("images/temporal_area.png", "Temporal Stacked Area Chart", "temporal-image", lazy=True)}
+                </div>
+                <div class="temporal-card full-width">
+                    <h3>Yearly Distribution</h3>
+                    {viz_image("images/yearly_dist.png", "Yearly Distribution", "temporal-image", "100vw", lazy=True)}
+                </div>
+            </div>
+        </section>
+
+        <section id="documents" class="section">
+            <div class="section-header">
+                <h2>Top Documents</h2>
+                <p>Representative documents for each topic</p>
+            </div>
+
+            <div class="documents-controls">
+                <label for="topic-select">Select Topic:</label>
+                <select id="topic-select"></select>
+                <input type="search" id="documents-search" placeholder="Search all documents..." aria-label="Search all documents">
+            </div>
+            <p class="search-status" id="documents-search-status"></p>
+
+            <div class="documents-list" id="documents-list"></div>
+        </section>
+{descriptions_section}    </main>
+
+    <div class="modal" id="topic-modal">
+        <div class="modal-content">
+            <button class="modal-close" onclick="closeModal()">&times;</button>
+            <div class="modal-header">
+                <h2 id="modal-title">Topic Details</h2>
+                <span class="coherence-badge" id="modal-coherence"></span>
+            </div>
+            <div class="modal-body">
+                <div class="modal-wordcloud">
+                    <img id="modal-wordcloud-img" src="" alt="Wordcloud">
+                </div>
+                <div class="modal-words">
+                    <h3>Top Words</h3>
+                    <table class="words-table" id="modal-words-table">
+                        <thead>
+                            <tr>
+                                <th>Word</th>
+                                <th>Relevance Score</th>
+                            </tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="lightbox" id="lightbox" onclick="closeLightbox()">
+        <img id="lightbox-img" src="" alt="Enlarged view">
+    </div>
+
+    <footer class="footer">
+        <p>Generated with {method_upper} Topic Modeling | {dataset_title} Research Analysis | {topic_count} Topics</p>
+    </footer>
+
+    <script src="{topics_url}"></script>
+    <script src="{charts_url}"></script>
+    <script src="{app_url}"></script>
+{sw_registration}</body>
+</html>
+'''
+
+
+def generate_topic_graph_html(method_upper: str, topic_count: int, data_path: str = "data/temporal_topics.json",
+                              echarts_src: str = ECHARTS_SRC) -> str:
+    """
+    Generate topic-graph.html content.
+
+    The quarterly series are loaded from data_path (written by render_temporal_data)
+    rather than inlined, so the data is cached separately from the page.
+    echarts_src is the ECharts URL (ECHARTS_SRC, or a vendored copy).
+    """
+    return f'''\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Topic Temporal Graph - {method_upper}</title>
+    <script src="{echarts_src}"></script>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #f8fafc;
+            min-height: 100vh;
+            color: #1e293b;
+        }}
+
+        .header {{
+            background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
+            color: white;
+            padding: 1rem 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+
+        .header h1 {{ font-size: 1.5rem; font-weight: 600; }}
+        .header p {{ opacity: 0.9; font-size: 0.9rem; }}
+
+        .controls {{
+            background: #ffffff;
+            padding: 1rem 2rem;
+            border-bottom: 1px solid #e2e8f0;
+            display: flex;
+            align-items: center;
+            gap: 1.5rem;
+            flex-wrap: wrap;
+        }}
+
+        .control-group {{
+            display: flex;
+            align-items: center;
+            gap: 0.5rem;
+        }}
+
+        .control-group label {{
+            font-weight: 500;
+            color: #64748b;
+            font-size: 0.9rem;
+        }}
+
+        .topic-dropdown {{
+            position: relative;
+        }}
+
+        .topic-dropdown-btn {{
+            padding: 0.5rem 1rem;
+            background: #f1f5f9;
+            border: 1px solid #e2e8f0;
+            border-radius: 8px;
+            color: #1e293b;
+            font-size: 0.9rem;
+            min-width: 200px;
+            cursor: pointer;
+            text-align: left;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            gap: 0.5rem;
+        }}
+
+        .topic-dropdown-btn:hover {{ background: #e2e8f0; }}
+
+        .topic-dropdown-panel {{
+            display: none;
+            position: absolute;
+            top: calc(100% + 4px);
+            left: 0;
+            background: white;
+            border: 1px solid #e2e8f0;
+            border-radius: 8px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+            z-index: 100;
+            max-height: 280px;
+            overflow-y: auto;
+            min-width: 220px;
+        }}
+
+        .topic-dropdown-panel.open {{ display: block; }}
+
+        .topic-checkbox-item {{
+            display: flex;
+            align-items: center;
+            gap: 0.5rem;
+            padding: 0.4rem 0.75rem;
+            cursor: pointer;
+            font-size: 0.875rem;
+            color: #1e293b;
+            user-select: none;
+        }}
+
+        .topic-checkbox-item:hover {{ background: #f1f5f9; }}
+
+        .topic-checkbox-item input[type="checkbox"] {{
+            cursor: pointer;
+            width: 14px;
+            height: 14px;
+        }}
+
+        .quick-btn {{
+            padding: 0.5rem 1rem;
+            background: #2563eb;
+            border: none;
+            border-radius: 6px;
+            color: #fff;
+            cursor: pointer;
+            font-size: 0.85rem;
+            font-weight: 500;
+            transition: all 0.2s;
+        }}
+
+        .quick-btn:hover {{ background: #1d4ed8; }}
+
+        .quick-btn.secondary {{
+            background: #f1f5f9;
+            color: #64748b;
+            border: 1px solid #e2e8f0;
+        }}
+
+        .quick-btn.secondary:hover {{
+            background: #e2e8f0;
+            color: #1e293b;
+        }}
+
+        .selected-topics {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 0.5rem;
+            flex: 1;
+        }}
+
+        .topic-tag {{
+            background: #e0e7ff;
+            color: #3730a3;
+            padding: 0.25rem 0.75rem;
+            border-radius: 20px;
+            font-size: 0.8rem;
+            display: flex;
+            align-items: center;
+            gap: 0.5rem;
+        }}
+
+        .topic-tag .remove {{
+            cursor: pointer;
+            opacity: 0.7;
+            font-weight: bold;
+        }}
+
+        .topic-tag .remove:hover {{ opacity: 1; }}
+
+        .chart-container {{
+            width: 100%;
+            height: calc(100vh - 140px);
+            padding: 1rem;
+        }}
+
+        #chart {{
+            width: 100%;
+            height: 100%;
+            background: #ffffff;
+            border-radius: 12px;
+            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+        }}
+
+        .no-selection {{
+            color: #64748b;
+            font-size: 0.85rem;
+        }}
+
+        @media (max-width: 768px) {{
+            .controls {{
+                flex-direction: column;
+                align-items: flex-start;
+            }}
+            .topic-dropdown-btn {{
+                width: 100%;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <div>
+            <h1>Topic Temporal Distribution</h1>
+            <p>{method_upper} Analysis - {topic_count} Topics</p>
+        </div>
+    </div>
+
+    <div class="controls">
+        <div class="control-group">
+            <label>Topics:</label>
+            <div class="topic-dropdown" id="topicDropdown">
+                <button class="topic-dropdown-btn" id="dropdownBtn" onclick="toggleDropdown()">
+                    <span id="dropdownLabel">All Topics</span>
+                    <span>▾</span>
+                </button>
+                <div class="topic-dropdown-panel" id="dropdownPanel">
+                    <div id="topicCheckboxList"></div>
+                </div>
+            </div>
+        </div>
+
+        <div class="control-group">
+            <button class="quick-btn" onclick="selectAll()">Select All</button>
+            <button class="quick-btn secondary" onclick="clearAll()">Clear All</button>
+        </div>
+
+        <div class="selected-topics" id="selectedTopics">
+        </div>
+    </div>
+
+    <div class="chart-container">
+        <div id="chart"></div>
+    </div>
+
+    <script>
+{VIRTUAL_LIST_JS}
+    // Columnar temporal data: {{ periods: [...], series: {{ "Topic 1": [...], ... }} }}
+    let temporalData = null;
+    let allTopics = [];
+
+    // Initialize
+    let selectedTopics = [];
+    let chart = null;
+    let topicCheckboxes = null;
+
+    // Color palette (extended for more topics)
+    const colors = [
+        '#2563eb', '#7c3aed', '#db2777', '#dc2626', '#ea580c',
+        '#d97706', '#ca8a04', '#65a30d', '#16a34a', '#059669',
+        '#0d9488', '#0891b2', '#0284c7', '#4f46e5', '#9333ea',
+        '#c026d3', '#e11d48', '#ef4444', '#f97316', '#eab308',
+        '#84cc16', '#22c55e', '#14b8a6', '#06b6d4', '#0ea5e9',
+        '#3b82f6', '#6366f1', '#8b5cf6', '#a855f7', '#d946ef',
+        '#ec4899', '#f43f5e', '#fb7185', '#f472b6', '#e879f9',
+        '#c084fc', '#a78bfa', '#818cf8', '#60a5fa', '#38bdf8',
+        '#22d3ee', '#2dd4bf', '#34d399', '#4ade80', '#a3e635'
+    ];
+
+    // Initialize the chart
+    document.addEventListener('DOMContentLoaded', async function() {{
+        chart = echarts.init(document.getElementById('chart'));
+
+        try {{
+            const response = await fetch('{data_path}');
+            if (!response.ok) throw new Error('Failed to load {data_path}');
+            temporalData = await response.json();
+        }} catch (error) {{
+            console.error('Error loading temporal data:', error);
+            chart.setOption({{ title: {{ text: 'Failed to load temporal data', left: 'center', top: 'center' }} }});
+            return;
+        }}
+        allTopics = Object.keys(temporalData.series);
+
+        // Select all topics by default
+        selectedTopics = [...allTopics];
+
+        // Only the checkboxes scrolled into view in the dropdown are created
+        topicCheckboxes = new VirtualList(document.getElementById('topicCheckboxList'), {{
+            count: allTopics.length,
+            scroller: document.getElementById('dropdownPanel'),
+            renderItem: index => renderTopicCheckbox(allTopics[index])
+        }});
+
+        updateDropdownLabel();
+        updateSelectedTopicTags();
+        updateChart();
+
+        window.addEventListener('resize', () => chart.resize());
+    }});
+
+    function renderTopicCheckbox(topic) {{
+        const item = document.createElement('label');
+        item.className = 'topic-checkbox-item';
+        const cb = document.createElement('input');
+        cb.type = 'checkbox';
+        cb.value = topic;
+        cb.checked = selectedTopics.includes(topic);
+        cb.addEventListener('change', function() {{
+            if (this.checked) {{
+                if (!selectedTopics.includes(topic)) selectedTopics.push(topic);
+            }} else {{
+                selectedTopics = selectedTopics.filter(t => t !== topic);
+            }}
+            updateDropdownLabel();
+            updateSelectedTopicTags();
+            updateChart();
+        }});
+        const span = document.createElement('span');
+        span.textContent = topic;
+        item.appendChild(cb);
+        item.appendChild(span);
+        return item;
+    }}
+
+    // Update the chart
+    function updateChart() {{
+        if (!chart || !temporalData) return;
+
+        const periods = temporalData.periods;
+
+        const series = selectedTopics.map((topic, index) => ({{
+            name: topic,
+            type: 'line',
+            data: temporalData.series[topic],
+            smooth: true,
+            lineStyle: {{ width: 2 }},
+            itemStyle: {{ color: colors[index % colors.length] }},
+            emphasis: {{
+                focus: 'series',
+                lineStyle: {{ width: 3 }}
+            }},
+            blur: {{
+                lineStyle: {{ opacity: 0.2 }},
+                itemStyle: {{ opacity: 0.2 }}
+            }}
+        }}));
+
+        const option = {{
+            title: {{
+                text: selectedTopics.length === 0 ? 'Select topics to display' : 'Topic Distribution Over Time',
+                left: 'center',
+                top: selectedTopics.length === 0 ? 'center' : 10,
+                textStyle: {{ color: '#1e293b' }}
+            }},
+            tooltip: {{
+                trigger: 'item',
+                backgroundColor: 'rgba(255, 255, 255, 0.95)',
+                borderColor: '#e2e8f0',
+                borderWidth: 1,
+                textStyle: {{ color: '#1e293b' }},
+                formatter: function(param) {{
+                    return `${{param.name}}<br/><span style="color:${{param.color}}">●</span> ${{param.seriesName}}: ${{parseFloat(param.value).toFixed(2)}}`;
+                }}
+            }},
+            legend: {{
+                data: selectedTopics,
+                top: 40,
+                type: 'scroll',
+                textStyle: {{ color: '#64748b' }}
+            }},
+            grid: {{
+                left: '3%',
+                right: '4%',
+                bottom: '3%',
+                top: selectedTopics.length === 0 ? '50%' : 100,
+                containLabel: true
+            }},
+            xAxis: {{
+                type: 'category',
+                data: periods,
+                axisLabel: {{ rotate: 45, color: '#64748b' }},
+                axisLine: {{ lineStyle: {{ color: '#e2e8f0' }} }},
+                splitLine: {{ lineStyle: {{ color: '#f1f5f9' }} }}
+            }},
+            yAxis: {{
+                type: 'value',
+                name: 'Topic Weight',
+                nameTextStyle: {{ color: '#64748b' }},
+                axisLabel: {{ color: '#64748b' }},
+                axisLine: {{ lineStyle: {{ color: '#e2e8f0' }} }},
+                splitLine: {{ lineStyle: {{ color: '#f1f5f9' }} }}
+            }},
+            series: series
+        }};
+
+        chart.setOption(option, true);
+    }}
+
+    // Update selected topic tags display
+    function updateSelectedTopicTags() {{
+        const container = document.getElementById('selectedTopics');
+        if (selectedTopics.length === 0) {{
+            container.innerHTML = '<span class="no-selection">No topics selected</span>';
+            return;
+        }}
+
+        container.innerHTML = selectedTopics.map(topic => `
+            <div class="topic-tag">
+                <span>${{topic}}</span>
+                <span class="remove" onclick="removeTopic('${{topic}}')">×</span>
+            </div>
+        `).join('');
+    }}
+
+    // Remove topic from selection
+    function removeTopic(topic) {{
+        selectedTopics = selectedTopics.filter(t => t !== topic);
+        topicCheckboxes?.refresh();
+        updateDropdownLabel();
+        updateSelectedTopicTags();
+        updateChart();
+    }}
+
+    // Dropdown toggle
+    function toggleDropdown() {{
+        document.getElementById('dropdownPanel').classList.toggle('open');
+    }}
+
+    // Close dropdown on outside click
+    document.addEventListener('click', function(e) {{
+        const dropdown = document.getElementById('topicDropdown');
+        if (dropdown && !dropdown.contains(e.target)) {{
+            document.getElementById('dropdownPanel').classList.remove('open');
+        }}
+    }});
 
-function goToTopic(num) {
-    switchSection('topics');
-    document.querySelector('[data-topic="' + num + '"]')?.scrollIntoView({behavior: 'smooth'});
-}
+    // Update dropdown button label
+    function updateDropdownLabel() {{
+        const label = document.getElementById('dropdownLabel');
+        if (selectedTopics.length === 0) {{
+            label.textContent = 'No topics selected';
+        }} else if (selectedTopics.length === allTopics.length) {{
+            label.textContent = 'All Topics';
+        }} else {{
+            label.textContent = selectedTopics.length + ' topic' + (selectedTopics.length > 1 ? 's' : '') + ' selected';
+        }}
+    }}
+
+    // Select all topics
+    function selectAll() {{
+        selectedTopics = [...allTopics];
+        topicCheckboxes?.refresh();
+        updateDropdownLabel();
+        updateSelectedTopicTags();
+        updateChart();
+    }}
 
+    // Clear all topics
+    function clearAll() {{
+        selectedTopics = [];
+        topicCheckboxes?.refresh();
+        updateDropdownLabel();
+        updateSelectedTopicTags();
+        updateChart();
+    }}
+    </script>
+</body>
+</html>
 '''
 
 
-def generate_app_js(md_filename=None):
-    """Generate app.js, optionally with topic descriptions support when md_filename is provided."""
-    if not md_filename:
-        return APP_JS
+# =============================================================================
+# Cross-Model Topic Alignment
+# =============================================================================
+# Site-level directory for the pages comparing models of the same dataset
+COMPARE_DIR_NAME = "compare"
 
-    js = APP_JS
+# Words shown per topic on the comparison page
+COMPARE_TOP_WORDS = 8
 
-    # Add topicLabels variable declaration
-    js = js.replace(
-        'let currentTopic = 1;',
-        'let currentTopic = 1;\nlet topicLabels = {};'
-    )
 
-    # Add loadTopicDescriptions() call in init()
-    js = js.replace(
-        '    initNavigation();\n    initOverview();\n    initTopicsGrid();',
-        f"    await loadTopicDescriptions('{md_filename}');\n    initNavigation();\n    initOverview();\n    initTopicsGrid();"
-    )
+def topic_similarity(relevance_a: dict, relevance_b: dict, metric: str = "cosine") -> tuple:
+    """
+    Topic-to-topic similarity between two models of the same dataset.
 
-    # Insert loadTopicDescriptions + goToTopic functions before showError
-    js = js.replace(
-        'function showError(message) {',
-        TOPIC_DESCRIPTIONS_JS + 'function showError(message) {'
-    )
+    Each topic becomes a vector over the union of both models' words, weighted
+    by exp(relevance) and normalized per topic (relevance scores are log-scale).
 
-    # Add topic label inside topic card (after the header div, before the wordcloud img)
-    js = js.replace(
-        '            </div>\n            <img\n                src="${topic.wordcloudPath}"',
-        '            </div>\n            ${topicLabels[topic.topicNum] ? `<div class="topic-label">${topicLabels[topic.topicNum]}</div>` : \'\'}\n            <img\n                src="${topic.wordcloudPath}"'
-    )
+    Args:
+        relevance_a: 'relevance' dict of the first model ({topic: {word: score}})
+        relevance_b: 'relevance' dict of the second model
+        metric: 'cosine' or 'jaccard' (weighted Jaccard, sum of minima over sum of maxima)
 
-    return js
+    Returns:
+        Tuple of (topic keys of A, topic keys of B, similarity matrix of shape (len(A), len(B)))
+    """
+    keys_a = sorted(relevance_a, key=topic_number)
+    keys_b = sorted(relevance_b, key=topic_number)
+    vocab = {}
+    for relevance in (relevance_a, relevance_b):
+        for words in relevance.values():
+            for word in words:
+                vocab.setdefault(word, len(vocab))
+
+    def matrix(relevance, keys):
+        rows, cols, scores = [], [], []
+        for row, key in enumerate(keys):
+            for word, score in relevance[key].items():
+                rows.append(row)
+                cols.append(vocab[word])
+                scores.append(score)
+        weights = np.zeros((len(keys), len(vocab)))
+        scores = np.asarray(scores, dtype=float)
+        rows = np.asarray(rows, dtype=int)
+        # Shift by the topic's best score before exp so large magnitudes cannot overflow
+        best = np.full(len(keys), -np.inf)
+        np.maximum.at(best, rows, scores)
+        weights[rows, cols] = np.exp(scores - best[rows])
+        return weights / weights.sum(axis=1, keepdims=True)
+
+    a, b = matrix(relevance_a, keys_a), matrix(relevance_b, keys_b)
+
+    if metric == "cosine":
+        a /= np.linalg.norm(a, axis=1, keepdims=True)
+        b /= np.linalg.norm(b, axis=1, keepdims=True)
+        return keys_a, keys_b, a @ b.T
+
+    if metric == "jaccard":
+        # Only words present in both topics contribute to the minima; each row
+        # sums to 1, so sum(max) = 2 - sum(min)
+        minima = np.zeros((len(keys_a), len(keys_b)))
+        shared = np.flatnonzero((a > 0).any(axis=0) & (b > 0).any(axis=0))
+        for col in shared:
+            rows_a = np.flatnonzero(a[:, col])
+            rows_b = np.flatnonzero(b[:, col])
+            minima[np.ix_(rows_a, rows_b)] += np.minimum.outer(a[rows_a, col], b[rows_b, col])
+        return keys_a, keys_b, minima / (2.0 - minima)
+
+    raise ValueError(f"Unknown similarity metric: {metric} (expected 'cosine' or 'jaccard')")
+
+
+def _hungarian(cost) -> tuple:
+    """
+    Minimum-cost assignment for a cost matrix with rows <= columns.
 
+    Shortest augmenting path version of the Hungarian algorithm, O(n^2 m),
+    with the per-column updates vectorized in NumPy.
 
-def generate_index_html(method_upper: str, topic_count: int, dataset_title: str, has_violin_plot: bool = False, has_umap: bool = False, md_filename: str = None) -> str:
-    """Generate index.html content with dynamic topic count."""
-    # Conditionally add violin plot tab
-    violin_tab = '<button class="nav-tab" data-section="violin">Interactive Violin Plot</button>' if has_violin_plot else ''
+    Returns:
+        Tuple of (row indices, assigned column indices)
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=int)  # owner[j]: 1-based row assigned to column j (0 = none)
+    way = np.zeros(m + 1, dtype=int)
+    padded = np.zeros((n + 1, m + 1))
+    padded[1:, 1:] = cost
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        j0 = 0
+        min_reduced = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used
+            free[0] = False
+            reduced = padded[i0] - u[i0] - v
+            better = free & (reduced < min_reduced)
+            min_reduced[better] = reduced[better]
+            way[better] = j0
+            candidates = np.where(free, min_reduced, np.inf)
+            j1 = int(np.argmin(candidates))
+            delta = candidates[j1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_reduced[free] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(owner[1:])
+    rows = owner[1:][cols] - 1
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+def match_topics(similarity) -> list:
+    """
+    One-to-one topic matching that maximizes the total similarity.
 
-    # Conditionally add topic descriptions tab
-    descriptions_tab = '<button class="nav-tab" data-section="descriptions">Topic Descriptions</button>' if md_filename else ''
+    Uses scipy's linear_sum_assignment when SciPy is installed, otherwise the
+    NumPy implementation in _hungarian. With different topic counts every topic
+    of the smaller model is matched and the rest of the larger one is not.
 
-    # Conditionally add violin plot section
-    violin_section = '''
-        <section id="violin" class="section">
-            <div class="section-header">
-                <h2>Interactive Violin Plot</h2>
-                <p>Topic distribution by year - hover over violins for details</p>
-                <a href="violin-plot.html" target="_blank" class="open-fullscreen">Open in Full Screen</a>
-            </div>
-            <div class="graph-container">
-                <iframe src="violin-plot.html" id="violin-plot-iframe" title="Interactive Violin Plot"></iframe>
-            </div>
-        </section>
-''' if has_violin_plot else ''
+    Args:
+        similarity: Matrix from topic_similarity
 
-    # Conditionally add UMAP visualization card
-    umap_card = '''
-                <div class="viz-card">
-                    <h3>UMAP Visualization</h3>
-                    <img src="images/umap.png" alt="UMAP Visualization" class="viz-image" onclick="openLightbox(this)">
-                </div>
-''' if has_umap else ''
+    Returns:
+        List of (row, column) index pairs
+    """
+    cost = similarity.max() - similarity
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    if linear_sum_assignment is not None:
+        rows, cols = linear_sum_assignment(cost)
+    else:
+        rows, cols = _hungarian(cost)
+    if transposed:
+        rows, cols = cols, rows
+    return sorted(zip(rows.tolist(), cols.tolist()))
 
-    # Conditionally add topic descriptions section
-    descriptions_section = f'''
-        <section id="descriptions" class="section">
-            <div class="section-header">
-                <h2>Topic Descriptions</h2>
-                <p>Human-readable topic labels and descriptions</p>
-            </div>
-            <div class="descriptions-list" id="descriptions-list"></div>
-        </section>
-''' if md_filename else ''
 
-    return f'''\
+COMPARISON_HTML = '''\
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{dataset_title} Topic Analysis - {method_upper}</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js"></script>
-    <link rel="stylesheet" href="css/styles.css">
+    <title>__TITLE__</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #f8fafc;
+            color: #1e293b;
+            padding: 2rem;
+        }
+        h1 { font-size: 1.5rem; margin-bottom: 0.25rem; }
+        h2 { font-size: 1.15rem; margin: 2rem 0 0.75rem; }
+        .summary { color: #64748b; margin-bottom: 1.5rem; }
+        .summary a { color: #2563eb; }
+        table { width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden; }
+        th, td { padding: 0.5rem 0.75rem; text-align: left; border-bottom: 1px solid #e2e8f0; font-size: 0.85rem; vertical-align: top; }
+        th { background: #f1f5f9; color: #64748b; font-weight: 600; }
+        .topic { font-weight: 600; white-space: nowrap; }
+        .words { color: #475569; }
+        .score { white-space: nowrap; font-variant-numeric: tabular-nums; }
+        .bar { display: inline-block; height: 0.5rem; background: #2563eb; border-radius: 4px; margin-right: 0.5rem; }
+    </style>
 </head>
 <body>
-    <header class="header">
-        <div class="header-content">
-            <h1>{dataset_title} Topic Analysis</h1>
-            <p class="subtitle">{method_upper}-based Topic Modeling Results ({topic_count} Topics)</p>
-        </div>
-    </header>
+    <h1>__TITLE__</h1>
+    <p class="summary">__SUMMARY__</p>
+    <table>
+        <thead><tr><th>__LABEL_A__</th><th>Top words</th><th>Similarity</th><th>__LABEL_B__</th><th>Top words</th></tr></thead>
+        <tbody>
+__ROWS__
+        </tbody>
+    </table>
+__UNMATCHED__
+</body>
+</html>
+'''
 
-    <nav class="nav-tabs">
-        <button class="nav-tab active" data-section="overview">Overview</button>
-        <button class="nav-tab" data-section="topics">Topic Explorer</button>
-        <button class="nav-tab" data-section="graph">Interactive Temporal Graph</button>
-        {violin_tab}
-        <button class="nav-tab" data-section="temporal">Temporal Trends</button>
-        <button class="nav-tab" data-section="documents">Top Documents</button>
-        {descriptions_tab}
-    </nav>
 
-    <main class="main-content">
-        <section id="overview" class="section active">
-            <div class="section-header">
-                <h2>Model Overview</h2>
-            </div>
+def render_comparison_html(app_a: dict, app_b: dict, relevance_a: dict, relevance_b: dict,
+                           keys_a: list, keys_b: list, similarity, matches: list, metric: str) -> str:
+    """
+    Render the comparison page of two models.
 
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value" id="total-topics">{topic_count}</div>
-                    <div class="stat-label">Topics</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="avg-coherence">-</div>
-                    <div class="stat-label">Avg. Coherence (C_V)</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="diversity-score">-</div>
-                    <div class="stat-label">Diversity Score</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="unique-words">-</div>
-                    <div class="stat-label">Unique Words</div>
-                </div>
-            </div>
+    Args:
+        app_a, app_b: Catalog entries of the two apps ('path', 'method', 'topic_count', 'dataset_title')
+        relevance_a, relevance_b: The models' relevance dicts
+        keys_a, keys_b, similarity: Output of topic_similarity
+        matches: Output of match_topics
+        metric: Similarity metric name
 
-            <div class="charts-row">
-                <div class="chart-container">
-                    <h3>Topic Coherence Scores (C_V)</h3>
-                    <canvas id="coherence-chart"></canvas>
-                </div>
-            </div>
+    Returns:
+        Page HTML
+    """
+    def label(app):
+        return f'{app["method"]}-{app["topic_count"]}'
+
+    def top_words(relevance, key):
+        words = sorted(relevance[key].items(), key=lambda item: -item[1])[:COMPARE_TOP_WORDS]
+        return html_escape(', '.join(word for word, _ in words))
+
+    def score_cell(score):
+        return f'<td class="score"><span class="bar" style="width:{max(score, 0) * 80:.0f}px"></span>{score:.3f}</td>'
+
+    rows = []
+    for i, j in sorted(matches, key=lambda pair: -similarity[pair]):
+        rows.append(
+            f'            <tr><td class="topic">Topic {topic_number(keys_a[i])}</td><td class="words">{top_words(relevance_a, keys_a[i])}</td>'
+            f'{score_cell(similarity[i, j])}'
+            f'<td class="topic">Topic {topic_number(keys_b[j])}</td><td class="words">{top_words(relevance_b, keys_b[j])}</td></tr>'
+        )
 
-            <div class="visualizations-grid">
-                <div class="viz-card">
-                    <h3>t-SNE Visualization</h3>
-                    <img src="images/tsne.png" alt="t-SNE Visualization" class="viz-image" onclick="openLightbox(this)">
-                </div>
-{umap_card}
-                <div class="viz-card">
-                    <h3>Document Distribution</h3>
-                    <img src="images/document_dist.png" alt="Document Distribution" class="viz-image" onclick="openLightbox(this)">
-                </div>
-            </div>
-        </section>
+    # Topics of the larger model left over by the one-to-one matching, with their closest topic
+    unmatched = ''
+    matched_a = {i for i, _ in matches}
+    matched_b = {j for _, j in matches}
+    left_a = [i for i in range(len(keys_a)) if i not in matched_a]
+    left_b = [j for j in range(len(keys_b)) if j not in matched_b]
+    if left_a or left_b:
+        extra = []
+        for i in left_a:
+            j = int(similarity[i].argmax())
+            extra.append((f'{label(app_a)} Topic {topic_number(keys_a[i])}', top_words(relevance_a, keys_a[i]),
+                          similarity[i, j], f'{label(app_b)} Topic {topic_number(keys_b[j])}'))
+        for j in left_b:
+            i = int(similarity[:, j].argmax())
+            extra.append((f'{label(app_b)} Topic {topic_number(keys_b[j])}', top_words(relevance_b, keys_b[j]),
+                          similarity[i, j], f'{label(app_a)} Topic {topic_number(keys_a[i])}'))
+        unmatched = (
+            '    <h2>Unmatched topics</h2>\n    <table>\n'
+            '        <thead><tr><th>Topic</th><th>Top words</th><th>Best similarity</th><th>Closest topic</th></tr></thead>\n'
+            '        <tbody>\n'
+            + '\n'.join(f'            <tr><td class="topic">{topic}</td><td class="words">{words}</td>{score_cell(score)}'
+                        f'<td class="topic">{closest}</td></tr>' for topic, words, score, closest in extra)
+            + '\n        </tbody>\n    </table>'
+        )
 
-        <section id="topics" class="section">
-            <div class="section-header">
-                <h2>Topic Explorer</h2>
-                <p>Click on any topic card to see detailed information</p>
-            </div>
-            <div class="topics-grid" id="topics-grid"></div>
-        </section>
+    scores = [similarity[pair] for pair in matches]
+    summary = (
+        f'<a href="../{quote(app_a["path"])}">{label(app_a)}</a> vs '
+        f'<a href="../{quote(app_b["path"])}">{label(app_b)}</a> &middot; '
+        f'{len(matches)} matched topics, mean {metric} similarity {np.mean(scores):.3f}, '
+        f'{sum(score >= 0.5 for score in scores)} pairs &ge; 0.5'
+    )
+    title = html_escape(f'{app_a["dataset_title"]}: {label(app_a)} vs {label(app_b)} topic alignment')
+    return (COMPARISON_HTML
+            .replace('__TITLE__', title)
+            .replace('__SUMMARY__', summary)
+            .replace('__LABEL_A__', label(app_a))
+            .replace('__LABEL_B__', label(app_b))
+            .replace('__ROWS__', '\n'.join(rows))
+            .replace('__UNMATCHED__', unmatched))
+
+
+def compare_models(results: list, site_dir: Path = BASE_DIR, metric: str = "cosine",
+                   force: bool = False, minify: bool = True) -> list:
+    """
+    Align the topics of every pair of apps built from the same dataset.
 
-        <section id="graph" class="section">
-            <div class="section-header">
-                <h2>Interactive Topic Temporal Line Graph</h2>
-                <p>Interactive visualization of topic temporal changes</p>
-                <a href="topic-graph.html" target="_blank" class="open-fullscreen">Open in Full Screen</a>
-            </div>
-            <div class="graph-container">
-                <iframe src="topic-graph.html" id="topic-graph-iframe" title="Interactive Topic Temporal Line Graph"></iframe>
-            </div>
-        </section>
-{violin_section}
-        <section id="temporal" class="section">
-            <div class="section-header">
-                <h2>Temporal Trends</h2>
-                <p>Topic distribution over time</p>
-            </div>
+    Writes one page per pair to compare/ in the site directory. A page is only
+    rebuilt when one of the two apps' coherence data changed since it was written.
+    Apps of the site catalog that were not built in this run are paired with
+    the built ones, so rebuilding one model refreshes its pages against the rest.
 
-            <div class="temporal-grid">
-                <div class="temporal-card">
-                    <h3>Quarterly Trends (Line Chart)</h3>
-                    <img src="images/temporal_line.png" alt="Temporal Line Chart" class="temporal-image" onclick="openLightbox(this)">
-                </div>
-                <div class="temporal-card">
-                    <h3>Quarterly Trends (Stacked Area)</h3>
-                    <img src="images/temporal_area.png" alt="Temporal Stacked Area Chart" class="temporal-image" onclick="openLightbox(this)">
-                </div>
-                <div class="temporal-card full-width">
-                    <h3>Yearly Distribution</h3>
-                    <img src="images/yearly_dist.png" alt="Yearly Distribution" class="temporal-image" onclick="openLightbox(this)">
-                </div>
-            </div>
-        </section>
+    Args:
+        results: BuildResult objects with catalog entries
+        site_dir: Site root (pages go to site_dir/compare/)
+        metric: Similarity metric for topic_similarity
+        force: Rebuild every page
+        minify: Minify the pages
 
-        <section id="documents" class="section">
-            <div class="section-header">
-                <h2>Top Documents</h2>
-                <p>Representative documents for each topic</p>
-            </div>
+    Returns:
+        List of comparison summaries: dataset, the two app paths, page path
+        and mean matched similarity
+    """
+    built = {}
+    for result in results:
+        if result.catalog:
+            path = Path(os.path.relpath(result.path, site_dir)).as_posix() + "/"
+            built[path] = {"path": path, **result.catalog}
+
+    datasets = {app["dataset"] for app in built.values()}
+    stored, _ = read_catalog(site_dir)
+    by_dataset = {}
+    for path, app in {**stored, **built}.items():
+        if app.get("dataset") in datasets:
+            by_dataset.setdefault(app["dataset"], []).append(app)
+
+    compare_dir = site_dir / COMPARE_DIR_NAME
+    comparisons = []
+    for dataset, apps in sorted(by_dataset.items()):
+        apps.sort(key=lambda app: (app["method"], app["topic_count"]))
+        for index, app_a in enumerate(apps):
+            for app_b in apps[index + 1:]:
+                if app_a["path"] not in built and app_b["path"] not in built:
+                    continue
+                data_a = site_dir / app_a["path"] / "data" / "coherence_scores.json"
+                data_b = site_dir / app_b["path"] / "data" / "coherence_scores.json"
+                if not data_a.exists() or not data_b.exists():
+                    continue
+                name = f'{app_a["path"].rstrip("/")}--{app_b["path"].rstrip("/")}.html'.replace("/", "_")
+                page = compare_dir / name
+                summary_file = page.with_suffix(".json")
+
+                if (not force and page.exists() and summary_file.exists()
+                        and page.stat().st_mtime_ns >= max(data_a.stat().st_mtime_ns, data_b.stat().st_mtime_ns)):
+                    comparisons.append(json.loads(summary_file.read_text()))
+                    continue
+
+                relevance_a = json.loads(data_a.read_text()).get("relevance")
+                relevance_b = json.loads(data_b.read_text()).get("relevance")
+                if not relevance_a or not relevance_b:
+                    continue
+
+                keys_a, keys_b, similarity = topic_similarity(relevance_a, relevance_b, metric)
+                matches = match_topics(similarity)
+                html = render_comparison_html(app_a, app_b, relevance_a, relevance_b,
+                                              keys_a, keys_b, similarity, matches, metric)
+                compare_dir.mkdir(parents=True, exist_ok=True)
+                page.write_text(minify_html(html) if minify else html)
+
+                summary = {
+                    "dataset": dataset,
+                    "a": app_a["path"],
+                    "b": app_b["path"],
+                    "page": f"{COMPARE_DIR_NAME}/{name}",
+                    "metric": metric,
+                    "mean_similarity": round(float(np.mean([similarity[pair] for pair in matches])), 4),
+                }
+                summary_file.write_text(json.dumps(summary))
+                comparisons.append(summary)
+                print(f"  Aligned {app_a['path']} with {app_b['path']} "
+                      f"(mean {metric} similarity {summary['mean_similarity']:.3f})")
+    return comparisons
 
-            <div class="documents-controls">
-                <label for="topic-select">Select Topic:</label>
-                <select id="topic-select"></select>
-            </div>
 
-            <div class="documents-list" id="documents-list"></div>
-        </section>
-{descriptions_section}    </main>
+# =============================================================================
+# Site Catalog
+# =============================================================================
+# Per-app summary written by generate_all_apps next to the apps
+CATALOG_NAME = "catalog.json"
 
-    <div class="modal" id="topic-modal">
-        <div class="modal-content">
-            <button class="modal-close" onclick="closeModal()">&times;</button>
-            <div class="modal-header">
-                <h2 id="modal-title">Topic Details</h2>
-                <span class="coherence-badge" id="modal-coherence"></span>
-            </div>
-            <div class="modal-body">
-                <div class="modal-wordcloud">
-                    <img id="modal-wordcloud-img" src="" alt="Wordcloud">
-                </div>
-                <div class="modal-words">
-                    <h3>Top Words</h3>
-                    <table class="words-table" id="modal-words-table">
-                        <thead>
-                            <tr>
-                                <th>Word</th>
-                                <th>Relevance Score</th>
-                            </tr>
-                        </thead>
-                        <tbody></tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
 
-    <div class="lightbox" id="lightbox" onclick="closeLightbox()">
-        <img id="lightbox-img" src="" alt="Enlarged view">
-    </div>
+def app_catalog_entry(output_path: Path, metadata: dict, topic_data: dict, critical: list) -> dict:
+    """
+    Summarize a generated app for the site catalog.
+
+    Args:
+        output_path: App output directory
+        metadata: Parsed folder metadata (dataset, method, topic_count)
+        topic_data: Loaded coherence/relevance data
+        critical: App-relative URLs the app needs for its first render
+
+    Returns:
+        Catalog entry dict (the site-relative 'path' is filled in by write_catalog)
+    """
+    gensim = topic_data.get("gensim", {})
+
+    diversity = None
+    diversity_file = output_path / "data" / "diversity_scores.json"
+    if diversity_file.exists():
+        diversity = json.loads(diversity_file.read_text()).get("diversity_summary", {}).get("overall_diversity_score")
+
+    # Number of top documents listed across topics (not the corpus size)
+    top_documents = None
+    shard_index = output_path / "data" / "top_docs" / "index.json"
+    top_docs_file = output_path / "data" / "top_docs.json"
+    if shard_index.exists():
+        top_documents = sum(shard["count"] for shard in json.loads(shard_index.read_text())["topics"].values())
+    elif top_docs_file.exists():
+        top_documents = sum(len(docs) for docs in json.loads(top_docs_file.read_text()).values())
+
+    # Size and last change of what the app serves (no manifest, no precompressed copies)
+    total_bytes, last_change = 0, 0
+    for root, _, names in os.walk(output_path):
+        for name in names:
+            if name == MANIFEST_NAME or name.endswith((".gz", ".br", ".tmp")):
+                continue
+            stat = os.stat(os.path.join(root, name))
+            total_bytes += stat.st_size
+            last_change = max(last_change, stat.st_mtime)
+
+    # Output mtimes are those of the sources for hardlinked or symlinked assets,
+    # so the manifest's build timestamp wins; apps built without one use the mtimes
+    built = time.strftime("%Y-%m-%d", time.gmtime(last_change))
+    try:
+        stored = json.loads((output_path / MANIFEST_NAME).read_text())
+        built = stored["built"][:10]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    return {
+        "dataset": metadata["dataset"],
+        "dataset_title": metadata["dataset"].replace('_', ' ').title(),
+        "method": metadata["method"].upper(),
+        "topic_count": metadata["topic_count"],
+        "c_v": gensim.get("c_v_average"),
+        "u_mass": gensim.get("u_mass_average"),
+        "diversity": diversity,
+        "top_documents": top_documents,
+        "built": built,
+        "bytes": total_bytes,
+        "critical": critical,
+    }
 
-    <footer class="footer">
-        <p>Generated with {method_upper} Topic Modeling | {dataset_title} Research Analysis | {topic_count} Topics</p>
-    </footer>
 
-    <script src="js/topics.js"></script>
-    <script src="js/charts.js"></script>
-    <script src="js/app.js"></script>
-</body>
-</html>
-'''
+def scan_apps(site_dir: Path = BASE_DIR) -> dict:
+    """
+    Catalog entries for the apps already in the site directory.
 
+    Seeds the catalog on its first write, so dashboards that are not rebuilt
+    in that run stay on the landing page. An app is a directory named like
+    generate_output_dir_name with an index.html and data/coherence_scores.json.
 
-def generate_topic_graph_html(csv_path: Path, method_upper: str, topic_count: int) -> str:
-    """Generate topic-graph.html content with embedded CSV data."""
-    # Read CSV data
-    csv_data = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            csv_data.append(row)
+    Args:
+        site_dir: Site root holding the apps
 
-    # Convert to JSON string
-    csv_json = json.dumps(csv_data, indent=2)
+    Returns:
+        {app path: entry}
+    """
+    entries = {}
+    for app_dir in sorted(site_dir.iterdir()):
+        match = re.match(r'^(.+)-(nmtf|pnmf)-(\d+)$', app_dir.name)
+        data_file = app_dir / "data" / "coherence_scores.json"
+        if not match or not (app_dir / "index.html").exists() or not data_file.exists():
+            continue
+        try:
+            topic_data = load_topic_data(data_file)
+        except (OSError, ValueError):
+            continue
+        metadata = {
+            "dataset": match.group(1).replace('-', '_'),
+            "method": match.group(2),
+            "topic_count": get_topic_count(topic_data) or int(match.group(3)),
+        }
+        critical = [url for url in ("index.html", "css/styles.css", "js/topics.js", "js/charts.js",
+                                    "js/app.js", "data/summary.json") if (app_dir / url).exists()]
+        path = app_dir.name + "/"
+        entries[path] = {"path": path, **app_catalog_entry(app_dir, metadata, topic_data, critical)}
+    return entries
 
-    return f'''\
+
+def linked_apps(index_file: Path) -> dict:
+    """
+    App directories a landing page links to, with their link text.
+
+    Only relative links to a directory count; external links and pages such
+    as compare/*.html are ignored.
+
+    Returns:
+        {app path: link text}, e.g. {'heart-failure-nmtf-34/': 'Heart Failure NMTF 34 Topics'}
+    """
+    if not index_file.exists():
+        return {}
+    links = {}
+    html = index_file.read_text(encoding="utf-8", errors="replace")
+    for href, text in re.findall(r'<a\s[^>]*?href="([^"/:?#]+/)"[^>]*>(.*?)</a>', html, flags=re.S):
+        text = re.sub(r'<div class="card-arrow">.*?</div>', '', text, flags=re.S)
+        text = " ".join(re.sub(r'<[^>]+>', ' ', text).split())
+        links.setdefault(unquote(href), text or href)
+    return links
+
+
+def read_catalog(site_dir: Path = BASE_DIR) -> tuple:
+    """
+    Load the entries of the site catalog whose app or page still exists.
+
+    Args:
+        site_dir: Site root holding catalog.json
+
+    Returns:
+        Tuple of ({app path: entry}, {comparison page: summary}); without a
+        catalog.json the entries come from scan_apps
+    """
+    catalog_file = site_dir / CATALOG_NAME
+    entries, pages = {}, {}
+    if not catalog_file.exists():
+        return scan_apps(site_dir), pages
+    try:
+        stored = json.loads(catalog_file.read_text())
+        for entry in stored.get("apps", []):
+            if (site_dir / entry["path"] / "index.html").exists():
+                entries[entry["path"]] = entry
+        for comparison in stored.get("comparisons", []):
+            if (site_dir / comparison["page"]).exists():
+                pages[comparison["page"]] = comparison
+    except (OSError, ValueError, KeyError):
+        entries, pages = {}, {}
+    return entries, pages
+
+
+def write_catalog(results: list, site_dir: Path = BASE_DIR, minify: bool = True, comparisons: list = None) -> list:
+    """
+    Merge build results into the site catalog and regenerate the root index.html.
+
+    Entries of apps (and comparison pages) that were not part of this run are
+    kept as long as they still exist, so building a subset of the sources does
+    not drop the rest. The first catalog is seeded from the apps already in
+    site_dir (see scan_apps). Links of the previous index.html to apps the
+    catalog does not cover (e.g. apps deployed separately) are carried over
+    as a static "Other dashboards" list.
+
+    Args:
+        results: BuildResult objects carrying a catalog entry
+        site_dir: Site root holding the apps, catalog.json and index.html
+        minify: Minify the generated index.html
+        comparisons: Summaries returned by compare_models
+
+    Returns:
+        The catalog entries, sorted by path
+    """
+    catalog_file = site_dir / CATALOG_NAME
+    entries, pages = read_catalog(site_dir)
+    for comparison in comparisons or []:
+        pages[comparison["page"]] = comparison
+
+    for result in results:
+        if result.catalog:
+            path = Path(os.path.relpath(result.path, site_dir)).as_posix() + "/"
+            entries[path] = {"path": path, **result.catalog}
+
+    apps = [entries[path] for path in sorted(entries)]
+    catalog = {"apps": apps, "comparisons": [pages[page] for page in sorted(pages)]}
+    catalog_file.write_text(json.dumps(catalog, separators=(',', ':')))
+
+    index_file = site_dir / "index.html"
+    others = {path: text for path, text in linked_apps(index_file).items() if path not in entries}
+    html = generate_root_index_html(apps, others)
+    index_file.write_text(minify_html(html) if minify else html)
+    print(f"\nUpdated {CATALOG_NAME} and index.html")
+    if others:
+        print(f"  Warning: kept links to apps not in the catalog: {', '.join(sorted(others))}")
+    return apps
+
+
+ROOT_INDEX_HTML = '''\
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Topic Temporal Graph - {method_upper}</title>
-    <script src="https://cdn.jsdelivr.net/npm/echarts@5.4.3/dist/echarts.min.js"></script>
+    <title>Topic Analysis Dashboards</title>
+    <link rel="preload" href="__CATALOG__" as="fetch" crossorigin>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        :root {
+            --primary-color: #2563eb;
+            --primary-dark: #1d4ed8;
+            --secondary-color: #7c3aed;
+            --background: #f8fafc;
+            --card-bg: #ffffff;
+            --text-primary: #1e293b;
+            --text-secondary: #64748b;
+            --border-color: #e2e8f0;
+            --shadow: 0 4px 6px -1px rgba(0,0,0,0.1), 0 2px 4px -1px rgba(0,0,0,0.06);
+            --shadow-lg: 0 10px 15px -3px rgba(0,0,0,0.1), 0 4px 6px -2px rgba(0,0,0,0.05);
+            --radius: 12px;
+        }
 
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f8fafc;
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            background: var(--background);
+            color: var(--text-primary);
+            line-height: 1.6;
             min-height: 100vh;
-            color: #1e293b;
-        }}
+        }
 
-        .header {{
-            background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
+        .header {
+            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
             color: white;
-            padding: 1rem 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
+            padding: 3rem 2rem;
+            text-align: center;
+        }
 
-        .header h1 {{ font-size: 1.5rem; font-weight: 600; }}
-        .header p {{ opacity: 0.9; font-size: 0.9rem; }}
+        .header h1 { font-size: 2.25rem; font-weight: 700; margin-bottom: 0.5rem; }
+        .header .subtitle { font-size: 1.1rem; opacity: 0.9; }
 
-        .controls {{
-            background: #ffffff;
-            padding: 1rem 2rem;
-            border-bottom: 1px solid #e2e8f0;
-            display: flex;
-            align-items: center;
-            gap: 1.5rem;
-            flex-wrap: wrap;
-        }}
+        .main-content {
+            max-width: 1100px;
+            margin: 0 auto;
+            padding: 2.5rem 1.5rem;
+        }
 
-        .control-group {{
+        .sort-controls {
             display: flex;
+            justify-content: flex-end;
             align-items: center;
             gap: 0.5rem;
-        }}
-
-        .control-group label {{
-            font-weight: 500;
-            color: #64748b;
+            margin-bottom: 1.5rem;
+            color: var(--text-secondary);
             font-size: 0.9rem;
-        }}
-
-        .topic-dropdown {{
-            position: relative;
-        }}
+        }
 
-        .topic-dropdown-btn {{
-            padding: 0.5rem 1rem;
-            background: #f1f5f9;
-            border: 1px solid #e2e8f0;
+        .sort-controls select {
+            padding: 0.35rem 0.75rem;
+            border: 1px solid var(--border-color);
             border-radius: 8px;
-            color: #1e293b;
+            background: var(--card-bg);
+            color: var(--text-primary);
             font-size: 0.9rem;
-            min-width: 200px;
-            cursor: pointer;
-            text-align: left;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 0.5rem;
-        }}
+        }
 
-        .topic-dropdown-btn:hover {{ background: #e2e8f0; }}
+        .section-title {
+            font-size: 1.35rem;
+            font-weight: 700;
+            color: var(--text-primary);
+            margin-bottom: 1.25rem;
+            padding-bottom: 0.5rem;
+            border-bottom: 2px solid var(--border-color);
+        }
 
-        .topic-dropdown-panel {{
-            display: none;
-            position: absolute;
-            top: calc(100% + 4px);
-            left: 0;
-            background: white;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            z-index: 100;
-            max-height: 280px;
-            overflow-y: auto;
-            min-width: 220px;
-        }}
+        .section { margin-bottom: 2.5rem; }
 
-        .topic-dropdown-panel.open {{ display: block; }}
+        .cards-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+            gap: 1.25rem;
+        }
 
-        .topic-checkbox-item {{
+        .card {
+            background: var(--card-bg);
+            border-radius: var(--radius);
+            border: 1px solid var(--border-color);
+            box-shadow: var(--shadow);
+            padding: 1.5rem;
+            text-decoration: none;
+            color: inherit;
             display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            padding: 0.4rem 0.75rem;
-            cursor: pointer;
-            font-size: 0.875rem;
-            color: #1e293b;
-            user-select: none;
-        }}
-
-        .topic-checkbox-item:hover {{ background: #f1f5f9; }}
-
-        .topic-checkbox-item input[type="checkbox"] {{
-            cursor: pointer;
-            width: 14px;
-            height: 14px;
-        }}
-
-        .quick-btn {{
-            padding: 0.5rem 1rem;
-            background: #2563eb;
-            border: none;
-            border-radius: 6px;
-            color: #fff;
-            cursor: pointer;
-            font-size: 0.85rem;
-            font-weight: 500;
-            transition: all 0.2s;
-        }}
-
-        .quick-btn:hover {{ background: #1d4ed8; }}
-
-        .quick-btn.secondary {{
-            background: #f1f5f9;
-            color: #64748b;
-            border: 1px solid #e2e8f0;
-        }}
-
-        .quick-btn.secondary:hover {{
-            background: #e2e8f0;
-            color: #1e293b;
-        }}
+            flex-direction: column;
+            gap: 0.75rem;
+            transition: transform 0.15s ease, box-shadow 0.15s ease;
+        }
 
-        .selected-topics {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-            flex: 1;
-        }}
+        .card:hover {
+            transform: translateY(-3px);
+            box-shadow: var(--shadow-lg);
+        }
 
-        .topic-tag {{
-            background: #e0e7ff;
-            color: #3730a3;
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.8rem;
+        .card-header {
             display: flex;
             align-items: center;
-            gap: 0.5rem;
-        }}
-
-        .topic-tag .remove {{
-            cursor: pointer;
-            opacity: 0.7;
-            font-weight: bold;
-        }}
-
-        .topic-tag .remove:hover {{ opacity: 1; }}
-
-        .chart-container {{
-            width: 100%;
-            height: calc(100vh - 140px);
-            padding: 1rem;
-        }}
-
-        #chart {{
-            width: 100%;
-            height: 100%;
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        }}
-
-        .no-selection {{
-            color: #64748b;
-            font-size: 0.85rem;
-        }}
-
-        @media (max-width: 768px) {{
-            .controls {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-            .topic-dropdown-btn {{
-                width: 100%;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <div>
-            <h1>Topic Temporal Distribution</h1>
-            <p>{method_upper} Analysis - {topic_count} Topics</p>
-        </div>
-    </div>
-
-    <div class="controls">
-        <div class="control-group">
-            <label>Topics:</label>
-            <div class="topic-dropdown" id="topicDropdown">
-                <button class="topic-dropdown-btn" id="dropdownBtn" onclick="toggleDropdown()">
-                    <span id="dropdownLabel">All Topics</span>
-                    <span>▾</span>
-                </button>
-                <div class="topic-dropdown-panel" id="dropdownPanel">
-                    <div id="topicCheckboxList"></div>
-                </div>
-            </div>
-        </div>
+            gap: 0.75rem;
+        }
 
-        <div class="control-group">
-            <button class="quick-btn" onclick="selectAll()">Select All</button>
-            <button class="quick-btn secondary" onclick="clearAll()">Clear All</button>
-        </div>
+        .card-badge {
+            font-size: 0.7rem;
+            font-weight: 700;
+            letter-spacing: 0.05em;
+            padding: 0.25rem 0.6rem;
+            border-radius: 9999px;
+            text-transform: uppercase;
+            white-space: nowrap;
+        }
 
-        <div class="selected-topics" id="selectedTopics">
-        </div>
-    </div>
+        .badge-nmtf {
+            background: #dbeafe;
+            color: #1d4ed8;
+        }
 
-    <div class="chart-container">
-        <div id="chart"></div>
-    </div>
+        .badge-pnmf {
+            background: #ede9fe;
+            color: #6d28d9;
+        }
 
-    <script>
-    // Embedded CSV data
-    const csvData = {csv_json};
+        .card-title {
+            font-size: 1.05rem;
+            font-weight: 600;
+            color: var(--text-primary);
+        }
 
-    // Get all topic columns
-    const allTopics = Object.keys(csvData[0]).filter(key => key.startsWith('Topic'));
+        .card-meta {
+            font-size: 0.875rem;
+            color: var(--text-secondary);
+        }
 
-    // Initialize
-    let selectedTopics = [];
-    let chart = null;
+        .card-stats {
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 0.25rem 1rem;
+            font-size: 0.8rem;
+            color: var(--text-secondary);
+        }
 
-    // Color palette (extended for more topics)
-    const colors = [
-        '#2563eb', '#7c3aed', '#db2777', '#dc2626', '#ea580c',
-        '#d97706', '#ca8a04', '#65a30d', '#16a34a', '#059669',
-        '#0d9488', '#0891b2', '#0284c7', '#4f46e5', '#9333ea',
-        '#c026d3', '#e11d48', '#ef4444', '#f97316', '#eab308',
-        '#84cc16', '#22c55e', '#14b8a6', '#06b6d4', '#0ea5e9',
-        '#3b82f6', '#6366f1', '#8b5cf6', '#a855f7', '#d946ef',
-        '#ec4899', '#f43f5e', '#fb7185', '#f472b6', '#e879f9',
-        '#c084fc', '#a78bfa', '#818cf8', '#60a5fa', '#38bdf8',
-        '#22d3ee', '#2dd4bf', '#34d399', '#4ade80', '#a3e635'
-    ];
+        .card-stats b { color: var(--text-primary); font-weight: 600; }
 
-    // Initialize the chart
-    document.addEventListener('DOMContentLoaded', function() {{
-        chart = echarts.init(document.getElementById('chart'));
+        .card-arrow {
+            margin-top: auto;
+            color: var(--primary-color);
+            font-size: 0.875rem;
+            font-weight: 500;
+        }
 
-        // Populate topic checkboxes
-        const checkboxList = document.getElementById('topicCheckboxList');
-        allTopics.forEach(topic => {{
-            const item = document.createElement('label');
-            item.className = 'topic-checkbox-item';
-            const cb = document.createElement('input');
-            cb.type = 'checkbox';
-            cb.value = topic;
-            cb.id = 'cb_' + topic.replace(/\s/g, '_');
-            cb.checked = true;
-            cb.addEventListener('change', function() {{
-                if (this.checked) {{
-                    if (!selectedTopics.includes(topic)) selectedTopics.push(topic);
-                }} else {{
-                    selectedTopics = selectedTopics.filter(t => t !== topic);
-                }}
-                updateDropdownLabel();
-                updateSelectedTopicTags();
-                updateChart();
-            }});
-            const span = document.createElement('span');
-            span.textContent = topic;
-            item.appendChild(cb);
-            item.appendChild(span);
-            checkboxList.appendChild(item);
-        }});
+        .comparison-list { list-style: none; display: flex; flex-direction: column; gap: 0.5rem; }
+        .comparison-list a { color: var(--primary-color); text-decoration: none; font-weight: 500; }
+        .comparison-list span { color: var(--text-secondary); font-size: 0.875rem; }
 
-        // Select all topics by default
-        selectedTopics = [...allTopics];
+        .footer {
+            text-align: center;
+            padding: 2rem;
+            color: var(--text-secondary);
+            border-top: 1px solid var(--border-color);
+            margin-top: 1rem;
+            font-size: 0.9rem;
+        }
 
-        updateDropdownLabel();
-        updateSelectedTopicTags();
-        updateChart();
+        @media (max-width: 640px) {
+            .header h1 { font-size: 1.6rem; }
+            .cards-grid { grid-template-columns: 1fr; }
+        }
+    </style>
+</head>
+<body>
 
-        window.addEventListener('resize', () => chart.resize());
-    }});
+<header class="header">
+    <h1>Topic Analysis Dashboards</h1>
+    <p class="subtitle">Interactive NMF &amp; PNMF Topic Modeling Results</p>
+</header>
+
+<main class="main-content">
+    <div class="sort-controls">
+        <label for="sort-select">Sort by</label>
+        <select id="sort-select">
+            <option value="dataset">Dataset</option>
+            <option value="topic_count">Topics</option>
+            <option value="c_v">Avg C_V coherence</option>
+            <option value="u_mass">Avg u_mass coherence</option>
+            <option value="diversity">Diversity</option>
+            <option value="top_documents">Top documents</option>
+            <option value="built">Build date</option>
+            <option value="bytes">Size</option>
+        </select>
+    </div>
+    <div id="catalog">
+        <noscript>
+__NOSCRIPT_LINKS__
+        </noscript>
+    </div>
+__OTHER_LINKS__
+</main>
 
-    // Update the chart
-    function updateChart() {{
-        if (!chart || !csvData) return;
+<footer class="footer">
+    Topic Modeling Visualization Dashboard — NMF &amp; PNMF Analysis
+</footer>
 
-        const periods = csvData.map(row => row.period);
+<script>
+    let apps = [];
+    let comparisons = [];
+    const prefetched = new Set();
 
-        const series = selectedTopics.map((topic, index) => ({{
-            name: topic,
-            type: 'line',
-            data: csvData.map(row => parseFloat(row[topic]) || 0),
-            smooth: true,
-            lineStyle: {{ width: 2 }},
-            itemStyle: {{ color: colors[index % colors.length] }},
-            emphasis: {{
-                focus: 'series',
-                lineStyle: {{ width: 3 }}
-            }},
-            blur: {{
-                lineStyle: {{ opacity: 0.2 }},
-                itemStyle: {{ opacity: 0.2 }}
-            }}
-        }}));
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+    }
 
-        const option = {{
-            title: {{
-                text: selectedTopics.length === 0 ? 'Select topics to display' : 'Topic Distribution Over Time',
-                left: 'center',
-                top: selectedTopics.length === 0 ? 'center' : 10,
-                textStyle: {{ color: '#1e293b' }}
-            }},
-            tooltip: {{
-                trigger: 'item',
-                backgroundColor: 'rgba(255, 255, 255, 0.95)',
-                borderColor: '#e2e8f0',
-                borderWidth: 1,
-                textStyle: {{ color: '#1e293b' }},
-                formatter: function(param) {{
-                    return `${{param.name}}<br/><span style="color:${{param.color}}">●</span> ${{param.seriesName}}: ${{parseFloat(param.value).toFixed(2)}}`;
-                }}
-            }},
-            legend: {{
-                data: selectedTopics,
-                top: 40,
-                type: 'scroll',
-                textStyle: {{ color: '#64748b' }}
-            }},
-            grid: {{
-                left: '3%',
-                right: '4%',
-                bottom: '3%',
-                top: selectedTopics.length === 0 ? '50%' : 100,
-                containLabel: true
-            }},
-            xAxis: {{
-                type: 'category',
-                data: periods,
-                axisLabel: {{ rotate: 45, color: '#64748b' }},
-                axisLine: {{ lineStyle: {{ color: '#e2e8f0' }} }},
-                splitLine: {{ lineStyle: {{ color: '#f1f5f9' }} }}
-            }},
-            yAxis: {{
-                type: 'value',
-                name: 'Topic Weight',
-                nameTextStyle: {{ color: '#64748b' }},
-                axisLabel: {{ color: '#64748b' }},
-                axisLine: {{ lineStyle: {{ color: '#e2e8f0' }} }},
-                splitLine: {{ lineStyle: {{ color: '#f1f5f9' }} }}
-            }},
-            series: series
-        }};
+    function formatNumber(value, digits) {
+        return value === null || value === undefined ? '-' : value.toFixed(digits);
+    }
 
-        chart.setOption(option, true);
-    }}
+    function formatBytes(size) {
+        const units = ['B', 'KB', 'MB', 'GB'];
+        let unit = 0;
+        while (size >= 1024 && unit < units.length - 1) {
+            size /= 1024;
+            unit++;
+        }
+        return (unit ? size.toFixed(1) : size) + ' ' + units[unit];
+    }
 
-    // Update selected topic tags display
-    function updateSelectedTopicTags() {{
-        const container = document.getElementById('selectedTopics');
-        if (selectedTopics.length === 0) {{
-            container.innerHTML = '<span class="no-selection">No topics selected</span>';
-            return;
-        }}
+    // Larger first, missing values last; datasets alphabetically
+    function compareApps(key) {
+        if (key === 'dataset') {
+            return (a, b) => a.dataset_title.localeCompare(b.dataset_title)
+                || a.method.localeCompare(b.method) || a.topic_count - b.topic_count;
+        }
+        return (a, b) => {
+            const x = a[key], y = b[key];
+            if (x === y) return 0;
+            if (x === null || x === undefined) return 1;
+            if (y === null || y === undefined) return -1;
+            return x < y ? 1 : -1;
+        };
+    }
 
-        container.innerHTML = selectedTopics.map(topic => `
-            <div class="topic-tag">
-                <span>${{topic}}</span>
-                <span class="remove" onclick="removeTopic('${{topic}}')">×</span>
+    function renderCard(app) {
+        return `
+            <a class="card" href="${escapeHtml(app.path)}" data-path="${escapeHtml(app.path)}">
+                <div class="card-header">
+                    <span class="card-badge badge-${escapeHtml(app.method.toLowerCase())}">${escapeHtml(app.method)}</span>
+                    <span class="card-title">${escapeHtml(app.dataset_title)}</span>
+                </div>
+                <div class="card-meta">${app.topic_count} Topics</div>
+                <div class="card-stats">
+                    <span>C_V <b>${formatNumber(app.c_v, 3)}</b></span>
+                    <span>u_mass <b>${formatNumber(app.u_mass, 3)}</b></span>
+                    <span>Diversity <b>${app.diversity === null ? '-' : (app.diversity * 100).toFixed(1) + '%'}</b></span>
+                    <span>Top docs <b>${app.top_documents == null ? '-' : app.top_documents.toLocaleString()}</b></span>
+                    <span>Built <b>${escapeHtml(app.built)}</b></span>
+                    <span>Size <b>${formatBytes(app.bytes)}</b></span>
+                </div>
+                <div class="card-arrow">View Dashboard →</div>
+            </a>`;
+    }
+
+    function renderSection(title, list) {
+        return `
+        <section class="section">
+            <h2 class="section-title">${escapeHtml(title)}</h2>
+            <div class="cards-grid">${list.map(renderCard).join('')}
             </div>
-        `).join('');
-    }}
+        </section>`;
+    }
 
-    // Remove topic from selection
-    function removeTopic(topic) {{
-        selectedTopics = selectedTopics.filter(t => t !== topic);
-        const cb = document.getElementById('cb_' + topic.replace(/\s/g, '_'));
-        if (cb) cb.checked = false;
-        updateDropdownLabel();
-        updateSelectedTopicTags();
-        updateChart();
-    }}
+    function renderComparisons() {
+        if (!comparisons.length) return '';
+        const label = path => escapeHtml(path.replace(/\\/$/, ''));
+        return `
+        <section class="section">
+            <h2 class="section-title">Model Comparisons</h2>
+            <ul class="comparison-list">${comparisons.map(c => `
+                <li><a href="${escapeHtml(c.page)}">${label(c.a)} vs ${label(c.b)}</a>
+                    <span>mean ${escapeHtml(c.metric)} similarity ${c.mean_similarity.toFixed(3)}</span></li>`).join('')}
+            </ul>
+        </section>`;
+    }
 
-    // Dropdown toggle
-    function toggleDropdown() {{
-        document.getElementById('dropdownPanel').classList.toggle('open');
-    }}
+    function render(key) {
+        const sorted = [...apps].sort(compareApps(key));
+        const container = document.getElementById('catalog');
+        if (key !== 'dataset') {
+            container.innerHTML = renderSection('All Models', sorted) + renderComparisons();
+            return;
+        }
+        const groups = new Map();
+        sorted.forEach(app => {
+            if (!groups.has(app.dataset_title)) groups.set(app.dataset_title, []);
+            groups.get(app.dataset_title).push(app);
+        });
+        container.innerHTML = [...groups].map(([title, list]) => renderSection(title, list)).join('')
+            + renderComparisons();
+    }
 
-    // Close dropdown on outside click
-    document.addEventListener('click', function(e) {{
-        const dropdown = document.getElementById('topicDropdown');
-        if (dropdown && !dropdown.contains(e.target)) {{
-            document.getElementById('dropdownPanel').classList.remove('open');
-        }}
-    }});
+    // Warm the HTTP cache with an app's first-render files when its card is hovered
+    function prefetchApp(event) {
+        const card = event.target.closest('.card');
+        if (!card || prefetched.has(card.dataset.path)) return;
+        prefetched.add(card.dataset.path);
+        const app = apps.find(a => a.path === card.dataset.path);
+        (app?.critical || []).forEach(file => {
+            const link = document.createElement('link');
+            link.rel = 'prefetch';
+            link.href = app.path + file;
+            document.head.appendChild(link);
+        });
+    }
 
-    // Update dropdown button label
-    function updateDropdownLabel() {{
-        const label = document.getElementById('dropdownLabel');
-        if (selectedTopics.length === 0) {{
-            label.textContent = 'No topics selected';
-        }} else if (selectedTopics.length === allTopics.length) {{
-            label.textContent = 'All Topics';
-        }} else {{
-            label.textContent = selectedTopics.length + ' topic' + (selectedTopics.length > 1 ? 's' : '') + ' selected';
-        }}
-    }}
+    async function init() {
+        const response = await fetch('__CATALOG__');
+        const catalog = await response.json();
+        apps = catalog.apps;
+        comparisons = catalog.comparisons || [];
+        const select = document.getElementById('sort-select');
+        select.addEventListener('change', () => render(select.value));
+        render(select.value);
+
+        const container = document.getElementById('catalog');
+        container.addEventListener('mouseover', prefetchApp);
+        container.addEventListener('focusin', prefetchApp);
+    }
 
-    // Select all topics
-    function selectAll() {{
-        selectedTopics = [...allTopics];
-        document.querySelectorAll('#topicCheckboxList input[type="checkbox"]').forEach(cb => cb.checked = true);
-        updateDropdownLabel();
-        updateSelectedTopicTags();
-        updateChart();
-    }}
+    init();
+</script>
 
-    // Clear all topics
-    function clearAll() {{
-        selectedTopics = [];
-        document.querySelectorAll('#topicCheckboxList input[type="checkbox"]').forEach(cb => cb.checked = false);
-        updateDropdownLabel();
-        updateSelectedTopicTags();
-        updateChart();
-    }}
-    </script>
 </body>
 </html>
 '''
 
 
+def generate_root_index_html(apps: list, others: dict = None) -> str:
+    """
+    Generate the site's landing page from catalog entries.
+
+    The cards are rendered client-side from catalog.json (one small request),
+    so sorting needs no further data; a <noscript> list links every app.
+
+    Args:
+        apps: Catalog entries (see write_catalog)
+        others: {app path: link text} of apps outside the catalog, listed
+            as plain links under "Other dashboards"
+
+    Returns:
+        index.html content
+    """
+    links = "\n".join(
+        f'            <p><a href="{quote(app["path"])}">{app["dataset_title"]} - {app["method"]} '
+        f'({app["topic_count"]} Topics)</a></p>'
+        for app in apps
+    )
+    other_links = ""
+    if others:
+        items = "\n".join(f'            <li><a href="{quote(path)}">{text}</a></li>'
+                          for path, text in sorted(others.items()))
+        other_links = (f'    <section class="section">\n        <h2 class="section-title">Other dashboards</h2>\n'
+                       f'        <ul class="comparison-list">\n{items}\n        </ul>\n    </section>')
+    return (ROOT_INDEX_HTML.replace('__CATALOG__', CATALOG_NAME)
+            .replace('__NOSCRIPT_LINKS__', links)
+            .replace('__OTHER_LINKS__', other_links))
+
+
 def generate_app(source_folder: str, output_dir: str = None,
                  prefix: str = None, method: str = None,
-                 dataset: str = None) -> str:
+                 dataset: str = None, force: bool = False,
+                 asset_mode: str = "copy", optimize_images: bool = False,
+                 precompress: bool = False, violin_summary: bool = False,
+                 shared_assets: str = None, vendor_dir: str = None,
+                 minify: bool = True, service_worker: bool = False,
+                 wordcloud_atlas: bool = True, wordcloud_format: str = "auto",
+                 workers: int = None) -> BuildResult:
     """
     Generate a visualization app from a source folder.
 
+    Outputs whose inputs are unchanged since the last build (as recorded in the
+    app's build manifest) are left untouched.
+
     Args:
         source_folder: Path to folder (e.g., "to_generate_from/heart_failure_with_pagerank_nmtf_bpe_34")
         output_dir: Optional output directory (auto-generated if not provided)
+        force: Rewrite every output even if the build manifest says it is current
+        asset_mode: How images and data files are placed in the app: 'copy',
+            'hardlink', 'reflink' or 'symlink' (falls back to copy when not possible)
+        optimize_images: Also emit downscaled WebP/AVIF variants of the images and
+            reference them through srcset (requires Pillow)
+        precompress: Write .gz (and .br, if brotli is installed) siblings of
+            every text output, for servers that serve precompressed files
+        violin_summary: Store the violin plot samples as per-value counts
+        shared_assets: Optional site-level directory for the CSS/JS files; they
+            are written there once under content-hashed names and index.html
+            references them, so apps with identical assets share one cached copy
+        vendor_dir: Optional directory with local copies of Chart.js, ECharts and
+            plotly.js (named as in VENDOR_BUNDLES); they are copied into the shared
+            asset directory under hashed names and replace the CDN script tags.
+            Nothing is downloaded: a missing bundle raises FileNotFoundError
+        minify: Minify the generated HTML/CSS/JS and drop stylesheet rules for
+            sections the app does not have (False keeps the readable templates)
+        service_worker: Emit sw.js and register it from index.html; the app shell
+            is precached, wordclouds and document shards are cached on first use,
+            and the cache is versioned by the build manifest
+        wordcloud_atlas: Pack wordcloud thumbnails into a few sprite atlases for
+            the topics grid, so the full-size wordclouds only load in the topic
+            modal (requires Pillow; without it the grid loads the full images)
+        wordcloud_format: 'png' copies the source wordclouds, 'svg' lays out SVG
+            wordclouds from the relevance scores instead, and 'auto' uses the
+            PNGs when the source folder has them and SVGs otherwise. SVG
+            wordclouds are not packed into atlases; each card loads its own
+        workers: Process pool size for the SVG wordcloud layout (None uses the
+            CPU count; generate_all_apps passes 1 to builds in its own pool)
 
     Returns:
-        Path to generated app directory
+        BuildResult for the generated app directory (str() gives its path),
+        with per-stage wall time and I/O counters
     """
     source_path = Path(source_folder)
     if not source_path.is_absolute():
@@ -1861,6 +5613,7 @@ def generate_app(source_folder: str, output_dir: str = None,
 
     # Parse folder name for metadata
     folder_name = source_path.name
+    result = BuildResult(folder_name)
 
     if prefix and method and dataset:
         metadata = {"dataset": dataset, "method": method, "topic_count": 0}
@@ -1870,17 +5623,27 @@ def generate_app(source_folder: str, output_dir: str = None,
             raise ValueError(f"Invalid folder name format: {folder_name}")
         prefix = folder_name
 
-    data_file = find_data_file(source_path, prefix)
+    with result.stage("load data") as stage:
+        data_file = find_data_file(source_path, prefix)
 
-    if not data_file:
-        raise FileNotFoundError(f"No data file found in {source_path}")
+        if not data_file:
+            raise FileNotFoundError(f"No data file found in {source_path}")
 
-    topic_data = load_topic_data(data_file)
-    topic_count = get_topic_count(topic_data)
+        topic_data = load_topic_data(data_file)
+        topic_count = get_topic_count(topic_data)
+        stage["bytes_read"] += data_file.stat().st_size
 
     if topic_count == 0:
         raise ValueError(f"Could not determine topic count from data")
 
+    if wordcloud_format not in WORDCLOUD_FORMATS:
+        raise ValueError(f"Unknown wordcloud format: {wordcloud_format} "
+                         f"(expected one of {', '.join(WORDCLOUD_FORMATS)})")
+    wordclouds_src = source_path / "wordclouds"
+    source_wordclouds = sorted(wordclouds_src.glob("Topic *.png")) if wordclouds_src.exists() else []
+    svg_wordclouds = bool(topic_data.get("relevance")) and (
+        wordcloud_format == "svg" or (wordcloud_format == "auto" and not source_wordclouds))
+
     # Update metadata with actual topic count from data
     metadata['topic_count'] = topic_count
 
@@ -1891,6 +5654,7 @@ def generate_app(source_folder: str, output_dir: str = None,
             output_path = BASE_DIR / output_dir
     else:
         output_path = BASE_DIR / generate_output_dir_name(metadata)
+    result.path = str(output_path)
 
     method_upper = metadata['method'].upper()
     dataset_title = metadata['dataset'].replace('_', ' ').title()
@@ -1905,137 +5669,378 @@ def generate_app(source_folder: str, output_dir: str = None,
     (output_path / "data").mkdir(parents=True, exist_ok=True)
     (output_path / "images" / "wordclouds").mkdir(parents=True, exist_ok=True)
 
+    manifest = BuildManifest(output_path, force=force, asset_mode=asset_mode)
+
     # Detect md file early (needed for JS and HTML generation)
     md_filename = None
     md_patterns = list(source_path.glob("*.md"))
     if md_patterns:
         md_filename = md_patterns[0].name
 
-    # Write CSS
-    print("  Writing CSS...")
-    (output_path / "css" / "styles.css").write_text(CSS_CONTENT)
-
-    # Write JavaScript files
-    print("  Writing JavaScript files...")
-    (output_path / "js" / "topics.js").write_text(TOPICS_JS)
-    (output_path / "js" / "charts.js").write_text(generate_charts_js(topic_count))
-    (output_path / "js" / "app.js").write_text(generate_app_js(md_filename))
-
-    # Copy data files
-    print("  Copying data files...")
-
-    # Main coherence/relevance data file
-    shutil.copy(data_file, output_path / "data" / "coherence_scores.json")
-
-    # Diversity scores (optional)
-    diversity_src = source_path / f"{prefix}_diversity_scores.json"
-    if diversity_src.exists():
-        shutil.copy(diversity_src, output_path / "data" / "diversity_scores.json")
-
-    # Top docs
-    topdocs_src = source_path / f"{prefix}_top_docs.json"
-    if topdocs_src.exists():
-        shutil.copy(topdocs_src, output_path / "data" / "top_docs.json")
-
-    # Copy images
-    print("  Copying images...")
-
-    # Document distribution
-    doc_dist_src = source_path / f"{prefix}_document_dist.png"
-    if doc_dist_src.exists():
-        shutil.copy(doc_dist_src, output_path / "images" / "document_dist.png")
-
-    # Temporal line
-    temporal_line_src = source_path / f"{prefix}_temporal_topic_dist_quarter_line.png"
-    if temporal_line_src.exists():
-        shutil.copy(temporal_line_src, output_path / "images" / "temporal_line.png")
-
-    # Temporal area
-    temporal_area_src = source_path / f"{prefix}_temporal_topic_dist_quarter_stacked_area.png"
-    if temporal_area_src.exists():
-        shutil.copy(temporal_area_src, output_path / "images" / "temporal_area.png")
-
-    # Yearly distribution
-    yearly_src = source_path / f"{prefix}_topic_distribution_by_year.png"
-    if yearly_src.exists():
-        shutil.copy(yearly_src, output_path / "images" / "yearly_dist.png")
-
-    # t-SNE visualization (try different naming patterns)
-    tsne_patterns = [
-        f"{prefix}_tsne_visualization.png",
-        f"{prefix}_tsne.png",
-        "tsne.png",
-    ]
-    tsne_copied = False
-    for tsne_name in tsne_patterns:
-        tsne_src = source_path / tsne_name
-        if tsne_src.exists():
-            shutil.copy(tsne_src, output_path / "images" / "tsne.png")
-            tsne_copied = True
-            break
-
-    if not tsne_copied:
-        print("  Note: t-SNE image not found in source folder")
-
-    # UMAP visualization (try different naming patterns)
-    umap_patterns = list(source_path.glob("*umap*visualization*.png")) + list(source_path.glob("*umap*.png"))
-    has_umap = False
-    if umap_patterns:
-        shutil.copy(umap_patterns[0], output_path / "images" / "umap.png")
-        has_umap = True
-        print(f"  Copied UMAP visualization: {umap_patterns[0].name}")
+    shared_dir = None
+    if shared_assets:
+        shared_dir = Path(shared_assets)
+        if not shared_dir.is_absolute():
+            shared_dir = BASE_DIR / shared_assets
+    vendor_path = None
+    if vendor_dir:
+        vendor_path = Path(vendor_dir)
+        if not vendor_path.is_absolute():
+            vendor_path = BASE_DIR / vendor_dir
+    asset_urls = {}
+    unused_css_classes = () if md_filename else DESCRIPTION_CSS_CLASSES
+
+    def prepare(rel_path, content):
+        return minify_text(rel_path, content, unused_css_classes) if minify else content
+
+    def shared_url(shared, name):
+        return Path(os.path.relpath(shared / name, output_path)).as_posix()
+
+    def write_asset(rel_path, content, stage):
+        # CSS/JS go into the app, or under a hashed name into the shared directory
+        content = prepare(rel_path, content)
+        if shared_dir is None:
+            manifest.write_text(rel_path, content)
+            return
+        name, written = write_shared_asset(shared_dir, rel_path, content, precompress)
+        stage["bytes_written"] += written
+        manifest.discard(rel_path)
+        asset_urls[rel_path] = shared_url(shared_dir, name)
+
+    def library_url(url, stage):
+        # CDN URL, or the hashed copy of the vendored bundle in the shared directory
+        if vendor_path is None:
+            return url
+        check_vendor_dir(vendor_path, [url])
+        bundle = vendor_path / VENDOR_BUNDLES[url]
+        target_dir = shared_dir or SHARED_ASSETS_DIR
+        name, written = write_shared_asset(target_dir, f"js/{bundle.name}",
+                                           bundle.read_text(encoding="utf-8"), precompress)
+        stage["bytes_read"] += bundle.stat().st_size
+        stage["bytes_written"] += written
+        asset_urls[url] = shared_url(target_dir, name)
+        return asset_urls[url]
+
+    with result.stage("css/js", manifest) as stage:
+        # Write CSS
+        print("  Writing CSS...")
+        write_asset("css/styles.css", CSS_CONTENT, stage)
+
+        # Write JavaScript files
+        print("  Writing JavaScript files...")
+        write_asset("js/topics.js", generate_topics_js("svg" if svg_wordclouds else "png"), stage)
+        write_asset("js/charts.js", generate_charts_js(topic_count), stage)
+
+    with result.stage("data files", manifest):
+        # Copy data files
+        print("  Copying data files...")
+
+        # Main coherence/relevance data file
+        manifest.copy_file(data_file, "data/coherence_scores.json")
+
+        # Reverse word-to-topic index for the term search
+        if topic_data.get("relevance"):
+            manifest.generate(
+                "data/term_index.json",
+                inputs=[data_file],
+                params={},
+                render=lambda: render_term_index(topic_data["relevance"])
+            )
+
+        # Diversity scores (optional)
+        diversity_src = source_path / f"{prefix}_diversity_scores.json"
+        if diversity_src.exists():
+            manifest.copy_file(diversity_src, "data/diversity_scores.json")
+
+        # Small summary the Overview and topics grid render from
+        summary_inputs = {"diversity_src": diversity_src if diversity_src.exists() else None,
+                          "md_src": source_path / md_filename if md_filename else None}
+        manifest.generate(
+            "data/summary.json",
+            inputs=[data_file] + [path for path in summary_inputs.values() if path],
+            params={"words": SUMMARY_TOP_WORDS},
+            render=lambda: render_summary(topic_data, **summary_inputs)
+        )
 
-    # Copy wordclouds
-    wordclouds_src = source_path / "wordclouds"
-    if wordclouds_src.exists():
-        for wc in wordclouds_src.glob("Topic *.png"):
-            shutil.copy(wc, output_path / "images" / "wordclouds" / wc.name)
+        # Top docs, sharded per topic
+        topdocs_src = source_path / f"{prefix}_top_docs.json"
+        if topdocs_src.exists():
+            manifest.generate_group(
+                "top_docs",
+                inputs=[topdocs_src],
+                params={},
+                render=lambda: render_top_docs_shards(topdocs_src)
+            )
+            manifest.generate_group(
+                "search_index",
+                inputs=[topdocs_src],
+                params={"shard_bytes": SEARCH_SHARD_BYTES, "stopwords": sorted(SEARCH_STOPWORDS)},
+                render=lambda: render_search_index(topdocs_src)
+            )
+
+    with result.stage("images", manifest):
+        # Copy images (remember each one's source for the optimization stage)
+        print("  Copying images...")
+        images = {}
+
+        # Document distribution
+        doc_dist_src = source_path / f"{prefix}_document_dist.png"
+        if doc_dist_src.exists():
+            manifest.copy_file(doc_dist_src, "images/document_dist.png")
+            images["images/document_dist.png"] = doc_dist_src
+
+        # Temporal line
+        temporal_line_src = source_path / f"{prefix}_temporal_topic_dist_quarter_line.png"
+        if temporal_line_src.exists():
+            manifest.copy_file(temporal_line_src, "images/temporal_line.png")
+            images["images/temporal_line.png"] = temporal_line_src
+
+        # Temporal area
+        temporal_area_src = source_path / f"{prefix}_temporal_topic_dist_quarter_stacked_area.png"
+        if temporal_area_src.exists():
+            manifest.copy_file(temporal_area_src, "images/temporal_area.png")
+            images["images/temporal_area.png"] = temporal_area_src
+
+        # Yearly distribution
+        yearly_src = source_path / f"{prefix}_topic_distribution_by_year.png"
+        if yearly_src.exists():
+            manifest.copy_file(yearly_src, "images/yearly_dist.png")
+            images["images/yearly_dist.png"] = yearly_src
+
+        # t-SNE visualization (try different naming patterns)
+        tsne_patterns = [
+            f"{prefix}_tsne_visualization.png",
+            f"{prefix}_tsne.png",
+            "tsne.png",
+        ]
+        tsne_copied = False
+        for tsne_name in tsne_patterns:
+            tsne_src = source_path / tsne_name
+            if tsne_src.exists():
+                manifest.copy_file(tsne_src, "images/tsne.png")
+                images["images/tsne.png"] = tsne_src
+                tsne_copied = True
+                break
+
+        if not tsne_copied:
+            print("  Note: t-SNE image not found in source folder")
+
+        # UMAP visualization (try different naming patterns)
+        umap_patterns = list(source_path.glob("*umap*visualization*.png")) + list(source_path.glob("*umap*.png"))
+        has_umap = False
+        if umap_patterns:
+            if manifest.copy_file(umap_patterns[0], "images/umap.png"):
+                print(f"  Copied UMAP visualization: {umap_patterns[0].name}")
+            images["images/umap.png"] = umap_patterns[0]
+            has_umap = True
+
+        # Copy wordclouds (unless they are generated as SVGs below)
+        wordclouds = {}
+        for wc in source_wordclouds if not svg_wordclouds else ():
+            manifest.copy_file(wc, f"images/wordclouds/{wc.name}")
+            wordclouds[f"images/wordclouds/{wc.name}"] = wc
+
+    # SVG wordclouds laid out from the relevance scores
+    if svg_wordclouds:
+        with result.stage("wordcloud svgs", manifest):
+            if manifest.generate_group(
+                "wordcloud_svg",
+                inputs=[data_file],
+                params={"version": WORDCLOUD_LAYOUT_VERSION, "size": list(WORDCLOUD_SVG_SIZE),
+                        "words": WORDCLOUD_SVG_WORDS, "fonts": list(WORDCLOUD_FONT_SIZES),
+                        "colors": list(WORDCLOUD_COLORS)},
+                render=lambda: render_wordcloud_svgs(topic_data["relevance"], workers)
+            ):
+                print(f"  Laid out {topic_count} SVG wordclouds")
+        for rel_path in manifest.previous:
+            if rel_path.startswith("images/wordclouds/Topic ") and rel_path.endswith(".png"):
+                manifest.discard(rel_path)
+    else:
+        for rel_path in manifest.previous_groups.get("wordcloud_svg", {}).get("files", []):
+            manifest.discard(rel_path)
+
+    # The topics grid shows wordclouds from sprite atlases when Pillow is available
+    use_atlas = bool(wordcloud_atlas and wordclouds and Image is not None)
+
+    # Optional image optimization stage: resized modern-format variants
+    image_variants = {}
+    wordcloud_variants = {}
+    if optimize_images:
+        if Image is None:
+            print("  Warning: Pillow is not installed, skipping image optimization")
+        else:
+            print("  Optimizing images...")
+            with result.stage("optimize images", manifest):
+                for rel_path, src in images.items():
+                    image_variants[rel_path] = optimize_image(manifest, src, rel_path, IMAGE_VARIANT_WIDTHS)
+                for rel_path, src in wordclouds.items() if not use_atlas else ():
+                    wordcloud_variants[rel_path] = optimize_image(manifest, src, rel_path, WORDCLOUD_THUMB_WIDTHS)
+
+    # Wordcloud thumbnails packed into sprite atlases for the topics grid
+    atlas_map = None
+    if use_atlas:
+        with result.stage("wordcloud atlas", manifest):
+            if manifest.generate_group(
+                "wordcloud_atlas",
+                inputs=list(wordclouds.values()),
+                params={"tile": list(WORDCLOUD_TILE_SIZE), "columns": WORDCLOUD_ATLAS_COLUMNS,
+                        "tiles": WORDCLOUD_ATLAS_TILES, "formats": available_image_formats(),
+                        "quality": IMAGE_FORMATS["webp"]["quality"]},
+                render=lambda: render_wordcloud_atlas(
+                    {topic_number(Path(rel).stem): src for rel, src in wordclouds.items()})
+            ):
+                print(f"  Packed {len(wordclouds)} wordcloud thumbnails into sprite atlases")
+            atlas_map = json.loads((output_path / WORDCLOUD_ATLAS_MAP).read_text())
+    else:
+        if wordcloud_atlas and wordclouds:
+            print("  Note: Pillow is not installed, the topics grid loads the full-size wordclouds")
+        for rel_path in manifest.previous_groups.get("wordcloud_atlas", {}).get("files", []):
+            manifest.discard(rel_path)
 
-    # Copy violin plot if exists (search for various naming patterns)
+    # Slim the violin plot if exists (search for various naming patterns)
     has_violin_plot = False
     violin_patterns = list(source_path.glob("*violin*interactive*.html"))
     if violin_patterns:
         violin_src = violin_patterns[0]
-        shutil.copy(violin_src, output_path / "violin-plot.html")
+        with result.stage("violin plot", manifest) as stage:
+            plotly_url = library_url(PLOTLY_SRC, stage)
+            if manifest.generate_group(
+                "violin",
+                inputs=[violin_src],
+                params={"summary": violin_summary, "precision": VIOLIN_PRECISION, "plotly": plotly_url},
+                render=lambda: render_violin_plot(violin_src, violin_summary, plotly_url)
+            ):
+                print(f"  Slimmed violin plot: {violin_src.name}")
         has_violin_plot = True
-        print(f"  Copied violin plot: {violin_src.name}")
 
     # Copy md file if present (topic descriptions)
     if md_filename:
         md_src = source_path / md_filename
-        shutil.copy(md_src, output_path / md_filename)
-        print(f"  Copied topic descriptions: {md_filename}")
-
-    # Generate index.html
-    print("  Generating index.html...")
-    (output_path / "index.html").write_text(
-        generate_index_html(method_upper, topic_count, dataset_title, has_violin_plot, has_umap, md_filename)
-    )
-
-    # Generate topic-graph.html
-    print("  Generating topic-graph.html...")
-    csv_path = source_path / f"{prefix}_temporal_topic_dist_quarter.csv"
-    if csv_path.exists():
-        (output_path / "topic-graph.html").write_text(
-            generate_topic_graph_html(csv_path, method_upper, topic_count)
+        with result.stage("descriptions", manifest):
+            if manifest.copy_file(md_src, md_filename):
+                print(f"  Copied topic descriptions: {md_filename}")
+
+    with result.stage("pages", manifest) as stage:
+        # app.js depends on the wordcloud variants, so it is written after the images
+        write_asset("js/app.js", generate_app_js(md_filename, wordcloud_variants, atlas_map), stage)
+        library_url(CHARTJS_SRC, stage)
+
+        # Generate index.html
+        print("  Generating index.html...")
+        manifest.write_text(
+            "index.html",
+            prepare("index.html", generate_index_html(method_upper, topic_count, dataset_title, has_violin_plot,
+                                                      has_umap, md_filename, image_variants, asset_urls,
+                                                      service_worker))
         )
+
+    with result.stage("topic graph", manifest) as stage:
+        # Generate topic-graph.html and its columnar data file
+        print("  Generating topic-graph.html...")
+        csv_path = source_path / f"{prefix}_temporal_topic_dist_quarter.csv"
+        if csv_path.exists():
+            manifest.generate(
+                "data/temporal_topics.json",
+                inputs=[csv_path],
+                params={"precision": TEMPORAL_PRECISION},
+                render=lambda: render_temporal_data(csv_path)
+            )
+            echarts_url = library_url(ECHARTS_SRC, stage)
+            manifest.write_text("topic-graph.html", prepare(
+                "topic-graph.html", generate_topic_graph_html(method_upper, topic_count, echarts_src=echarts_url)))
+        else:
+            print(f"  Warning: CSV file not found: {csv_path}")
+
+    # Files the first render needs: precached by the service worker, prefetched from the catalog
+    shell = ["index.html", "css/styles.css", "js/topics.js", "js/charts.js", "js/app.js", "data/summary.json",
+             "data/coherence_scores.json", "data/diversity_scores.json", "data/top_docs/index.json"]
+    shell_urls = [asset_urls.get(rel, rel) for rel in shell if rel in asset_urls or rel in manifest.outputs]
+    if CHARTJS_SRC in asset_urls:
+        shell_urls.append(asset_urls[CHARTJS_SRC])
+
+    if service_worker:
+        # Written last so its cache version covers every other output
+        print("  Generating service worker...")
+        with result.stage("service worker", manifest):
+            precache = shell_urls + ([md_filename] if md_filename else [])
+            # The graph and violin libraries (and Chart.js from a CDN) are cached on first use
+            libraries = [ECHARTS_SRC] if csv_path.exists() else []
+            libraries += [PLOTLY_SRC] if has_violin_plot else []
+            if CHARTJS_SRC not in asset_urls:
+                libraries.append(CHARTJS_SRC)
+            manifest.write_text("sw.js", prepare("sw.js", generate_service_worker_js(
+                output_path.name, manifest.version(), precache, [asset_urls.get(url, url) for url in libraries])))
     else:
-        print(f"  Warning: CSV file not found: {csv_path}")
+        manifest.discard("sw.js")
+
+    if precompress:
+        print("  Precompressing text outputs...")
+        if brotli is None:
+            print("  Note: brotli is not installed, writing .gz files only")
+        with result.stage("precompress", manifest):
+            manifest.precompress()
+
+    with result.stage("manifest"):
+        manifest.discard_stale_siblings()
+        manifest.save()
+    with result.stage("catalog"):
+        result.catalog = app_catalog_entry(output_path, metadata, topic_data, shell_urls)
+    result.shared_assets = sorted(Path(url).name for url in asset_urls.values())
+    if manifest.fallbacks:
+        print(f"  Note: {asset_mode} not possible for {manifest.fallbacks} assets, copied instead")
+    if manifest.skipped:
+        print(f"  Up to date: {manifest.skipped} outputs unchanged, {manifest.written} written")
+
+    result.finish()
+    print(f"  Done creating {method_upper} app with {topic_count} topics in {result.wall_time:.2f}s!")
+
+    return result
+
 
-    print(f"  Done creating {method_upper} app with {topic_count} topics!")
+def _generate_app_logged(source_folder: str, **options) -> tuple:
+    """
+    Run generate_app with its console output captured.
 
-    return str(output_path)
+    Used by the process pool in generate_all_apps so that the log of each app
+    can be printed as one block, in folder order, once the app is done.
 
+    Args:
+        source_folder: Path to the source folder
+        **options: Keyword arguments forwarded to generate_app
 
-def generate_all_apps(source_dir: str = "to_generate_from") -> list:
+    Returns:
+        Tuple of (BuildResult or None, captured log text, error message or None)
+    """
+    buffer = io.StringIO()
+    output, error = None, None
+    with contextlib.redirect_stdout(buffer):
+        try:
+            output = generate_app(source_folder, **options)
+        except Exception as e:
+            error = str(e)
+    return output, buffer.getvalue(), error
+
+
+def generate_all_apps(source_dir: str = "to_generate_from", workers: int = 1,
+                      trace_path: str = None, catalog: bool = True, compare: bool = True,
+                      **options) -> list:
     """
     Generate apps for all valid folders in source_dir.
 
     Args:
         source_dir: Directory containing source folders
+        workers: Number of apps to build concurrently in a process pool
+            (1 builds sequentially in the current process)
+        trace_path: Optional file to write a Chrome trace-event JSON of all
+            builds to (one track per app, one span per stage)
+        catalog: Update the site catalog.json with per-app summary stats and
+            regenerate the root index.html from it
+        compare: Align the topics of apps built from the same dataset and write
+            comparison pages to compare/ (requires numpy)
+        **options: Keyword arguments forwarded to generate_app (e.g. force=True)
 
     Returns:
-        List of paths to generated app directories
+        List of BuildResult objects, one per generated app (str() gives the path)
     """
     source_path = Path(source_dir)
     if not source_path.is_absolute():
@@ -2044,38 +6049,273 @@ def generate_all_apps(source_dir: str = "to_generate_from") -> list:
     if not source_path.exists():
         raise FileNotFoundError(f"Source directory not found: {source_path}")
 
-    generated = []
-
     # Find all valid folders
-    for folder in sorted(source_path.iterdir()):
-        if not folder.is_dir():
-            continue
+    folders = [
+        folder for folder in sorted(source_path.iterdir())
+        if folder.is_dir() and parse_folder_name(folder.name)
+    ]
+
+    if options.get("vendor_dir"):
+        # Fail before building anything rather than once per app
+        vendor_path = Path(options["vendor_dir"])
+        check_vendor_dir(vendor_path if vendor_path.is_absolute() else BASE_DIR / vendor_path)
+
+    generated = []
 
-        metadata = parse_folder_name(folder.name)
-        if metadata:
+    if workers <= 1:
+        for folder in folders:
             try:
-                output = generate_app(str(folder))
+                output = generate_app(str(folder), **options)
                 generated.append(output)
             except Exception as e:
                 print(f"Error processing {folder.name}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # One process per app already; nested pools would start workers x CPU processes
+            futures = [executor.submit(_generate_app_logged, str(folder), **options, workers=1)
+                       for folder in folders]
+
+            # Collect in submission order so the log reads the same as a sequential run
+            for folder, future in zip(folders, futures):
+                output, log, error = future.result()
+                print(log, end='')
+                if error is not None:
+                    print(f"Error processing {folder.name}: {error}")
+                else:
+                    generated.append(output)
+
+    update_site(generated, catalog=catalog, compare=compare, **options)
+
+    if trace_path:
+        write_trace(generated, trace_path)
+        print(f"\nWrote build trace: {trace_path}")
 
     return generated
 
 
-def main():
+def update_site(generated: list, catalog: bool = True, compare: bool = True, **options):
+    """
+    Refresh the site-level files after a set of apps was built.
+
+    Deletes superseded shared assets and writes the shared cache headers, the comparison pages of the rebuilt apps
+    and the catalog with the root index.html. Used after a full build and
+    after every rebuild of watch_apps.
+
+    Args:
+        generated: BuildResult objects of the apps built in this run
+        catalog: Update catalog.json and the root index.html
+        compare: Refresh the comparison pages (requires numpy)
+        **options: The generate_app options of the build (shared_assets,
+            vendor_dir, force, minify are used)
+    """
+    if options.get("shared_assets") or options.get("vendor_dir"):
+        shared_dir = Path(options.get("shared_assets") or SHARED_ASSETS_DIR)
+        if not shared_dir.is_absolute():
+            shared_dir = BASE_DIR / shared_dir
+        removed = prune_shared_assets(shared_dir, generated)
+        if removed:
+            print(f"\nRemoved {removed} superseded files from {shared_dir.name}/")
+        write_cache_headers(shared_dir)
+
+    comparisons = []
+    if compare and generated:
+        if np is None:
+            print("\nNote: numpy is not installed, skipping cross-model topic alignment")
+        else:
+            print("\nAligning topics across models of the same dataset...")
+            comparisons = compare_models(generated, force=options.get("force", False),
+                                         minify=options.get("minify", True))
+
+    if catalog and generated:
+        write_catalog(generated, minify=options.get("minify", True), comparisons=comparisons)
+
+
+def snapshot_sources(source_path: Path) -> dict:
+    """
+    Stat every file in the app source folders under source_path.
+
+    Args:
+        source_path: Directory containing source folders
+
+    Returns:
+        {folder_name: {relative_file_path: (size, mtime_ns)}} for every folder
+        whose name parse_folder_name accepts
+    """
+    snapshot = {}
+    for folder in sorted(source_path.iterdir()):
+        if not folder.is_dir() or not parse_folder_name(folder.name):
+            continue
+        files = {}
+        for root, _, names in os.walk(folder):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # removed between listing and stat
+                    continue
+                files[os.path.relpath(path, folder)] = (stat.st_size, stat.st_mtime_ns)
+        snapshot[folder.name] = files
+    return snapshot
+
+
+def changed_apps(before: dict, after: dict) -> set:
+    """
+    Source folders whose files were added, removed or modified between two snapshots.
+
+    Args:
+        before: Earlier snapshot_sources result
+        after: Later snapshot_sources result
+
+    Returns:
+        Set of folder names
+    """
+    return {name for name in before.keys() | after.keys() if before.get(name) != after.get(name)}
+
+
+def watch_apps(source_dir: str = "to_generate_from", interval: float = 1.0,
+               debounce: float = 0.5, catalog: bool = True, compare: bool = True, **options):
+    """
+    Rebuild apps whenever their source folder changes, until interrupted.
+
+    The source tree is polled (standard library only). A change starts a
+    quiet period: the rebuild waits until no file has changed for `debounce`
+    seconds, so a model run or editor save that writes many files triggers one
+    build. Changed files are mapped to their app through the source folder
+    name, only those apps are rebuilt, and each app's build manifest limits the
+    work to the outputs that depend on the changed files. After each rebuild
+    the site-level files are refreshed as in generate_all_apps.
+
+    Args:
+        source_dir: Directory containing source folders
+        interval: Seconds between polls
+        debounce: Seconds the tree must stay unchanged before rebuilding
+        catalog: Update catalog.json and the root index.html after a rebuild
+        compare: Refresh the comparison pages of the rebuilt apps
+        **options: Keyword arguments forwarded to generate_app
+    """
+    source_path = Path(source_dir)
+    if not source_path.is_absolute():
+        source_path = BASE_DIR / source_dir
+
+    if not source_path.exists():
+        raise FileNotFoundError(f"Source directory not found: {source_path}")
+
+    current = snapshot_sources(source_path)
+    print(f"\nWatching {source_path} for changes (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            latest = snapshot_sources(source_path)
+            pending = changed_apps(current, latest)
+            if not pending:
+                continue
+
+            # Debounce: keep collecting until the tree is quiet
+            while True:
+                time.sleep(debounce)
+                settled = snapshot_sources(source_path)
+                if settled == latest:
+                    break
+                pending |= changed_apps(latest, settled)
+                latest = settled
+            current = latest
+
+            rebuilt = []
+            for name in sorted(pending):
+                if name not in current:
+                    print(f"\nSource folder removed: {name} (its app is left in place)")
+                    continue
+                try:
+                    result = generate_app(str(source_path / name), **options)
+                    print(f"  Rebuilt {result.path} ({result.summary()})")
+                    rebuilt.append(result)
+                except Exception as e:
+                    print(f"Error processing {name}: {e}")
+            update_site(rebuilt, catalog=catalog, compare=compare, **options)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def main(argv: list = None):
     """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description="Dynamic Topic Analysis App Generator")
+    parser.add_argument("--source-dir", default="to_generate_from",
+                        help="Directory containing source folders (default: to_generate_from)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Number of apps to build in parallel (default: 1)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rewrite every output, ignoring the incremental build manifest")
+    parser.add_argument("--asset-mode", choices=ASSET_MODES, default="copy",
+                        help="How images and data files are placed in each app (default: copy). "
+                             "symlink output is for local preview only: the links point at "
+                             "to_generate_from/ and break once the site is deployed")
+    parser.add_argument("--optimize-images", action="store_true",
+                        help="Emit downscaled WebP/AVIF image variants with srcset markup (requires Pillow)")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Write .gz/.br siblings of every text output (.br requires brotli)")
+    parser.add_argument("--violin-summary", action="store_true",
+                        help="Store violin plot samples as per-value counts instead of raw samples")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Write per-stage build timings as Chrome trace-event JSON")
+    parser.add_argument("--shared-assets", nargs="?", const=SHARED_ASSETS_DIR.name, metavar="DIR",
+                        help="Write CSS/JS once under content-hashed names into a site-level directory "
+                             f"shared by all apps, plus immutable cache headers (default DIR: {SHARED_ASSETS_DIR.name})")
+    parser.add_argument("--vendor-dir", metavar="DIR",
+                        help="Serve Chart.js/ECharts/plotly.js from local copies in DIR (named as in "
+                             "VENDOR_BUNDLES) via the shared asset directory instead of CDNs; never downloads")
+    parser.add_argument("--service-worker", action="store_true",
+                        help="Emit a service worker that caches each app for instant repeat and offline visits")
+    parser.add_argument("--wordclouds", choices=WORDCLOUD_FORMATS, default="auto",
+                        help="Copy the source wordcloud PNGs (png), lay out SVG wordclouds from the relevance "
+                             "scores (svg), or use the PNGs when present and SVGs otherwise (default: auto); "
+                             "SVG wordclouds load one file per topic card instead of a sprite atlas")
+    parser.add_argument("--no-wordcloud-atlas", action="store_true",
+                        help="Load full-size wordclouds in the topics grid instead of thumbnail sprite atlases")
+    parser.add_argument("--no-compare", action="store_true",
+                        help="Skip the cross-model topic alignment pages")
+    parser.add_argument("--no-catalog", action="store_true",
+                        help="Do not update catalog.json and the root index.html")
+    parser.add_argument("--debug", action="store_true",
+                        help="Keep the generated HTML/CSS/JS readable (no minification or CSS pruning)")
+    parser.add_argument("--watch", action="store_true",
+                        help="After building, keep polling the source tree and rebuild apps whose sources change")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Seconds between source polls in --watch mode (default: 1.0)")
+    args = parser.parse_args(argv)
+
     print("="*60)
     print("Dynamic Topic Analysis App Generator")
     print("="*60)
 
-    generated = generate_all_apps()
+    try:
+        generated = generate_all_apps(args.source_dir, workers=args.workers, trace_path=args.trace,
+                                      catalog=not args.no_catalog, compare=not args.no_compare,
+                                      force=args.force, asset_mode=args.asset_mode,
+                                      optimize_images=args.optimize_images, precompress=args.precompress,
+                                      violin_summary=args.violin_summary, shared_assets=args.shared_assets,
+                                      vendor_dir=args.vendor_dir, minify=not args.debug,
+                                      service_worker=args.service_worker,
+                                      wordcloud_atlas=not args.no_wordcloud_atlas,
+                                      wordcloud_format=args.wordclouds)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
 
     print("\n" + "="*60)
     print("Generation complete!")
     print("="*60)
     print("\nGenerated:")
-    for path in generated:
-        print(f"  - {path}")
+    for result in generated:
+        print(f"  - {result.path} ({result.summary()})")
+
+    if args.watch:
+        watch_apps(args.source_dir, interval=args.interval, catalog=not args.no_catalog,
+                   compare=not args.no_compare, force=False, asset_mode=args.asset_mode,
+                   optimize_images=args.optimize_images, precompress=args.precompress,
+                   violin_summary=args.violin_summary, shared_assets=args.shared_assets,
+                   vendor_dir=args.vendor_dir, minify=not args.debug, service_worker=args.service_worker,
+                   wordcloud_atlas=not args.no_wordcloud_atlas, wordcloud_format=args.wordclouds)
 
     return 0
 
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# generate_apps.py is a single script in the repository root, not an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+import generate_apps as ga
+
+np = pytest.importorskip("numpy")
+
+
+def brute_force_cost(cost):
+    """Lowest total cost over every assignment of rows to distinct columns."""
+    n, m = cost.shape
+    return min(sum(cost[row, col] for row, col in zip(range(n), cols))
+               for cols in itertools.permutations(range(m), n))
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (1, 4), (3, 3), (4, 6), (6, 6), (5, 7)])
+def test_hungarian_matches_brute_force(shape):
+    rng = np.random.default_rng(sum(shape))
+    for _ in range(20):
+        cost = rng.random(shape)
+        rows, cols = ga._hungarian(cost)
+        assert sorted(rows.tolist()) == list(range(shape[0]))
+        assert len(set(cols.tolist())) == shape[0]
+        assert cost[rows, cols].sum() == pytest.approx(brute_force_cost(cost))
+
+
+def test_hungarian_with_ties():
+    cost = np.ones((4, 4))
+    rows, cols = ga._hungarian(cost)
+    assert sorted(cols.tolist()) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("shape", [(4, 4), (3, 5), (5, 3)])
+def test_match_topics_maximizes_similarity(shape):
+    rng = np.random.default_rng(7)
+    similarity = rng.random(shape)
+    matches = ga.match_topics(similarity)
+
+    assert len(matches) == min(shape)
+    assert len({row for row, _ in matches}) == len({col for _, col in matches}) == min(shape)
+    best = -brute_force_cost(-similarity if shape[0] <= shape[1] else -similarity.T)
+    assert sum(similarity[pair] for pair in matches) == pytest.approx(best)
+
+
+def test_topic_similarity_of_identical_models():
+    relevance = {
+        "topic_01": {"heart": 1.0, "failure": 0.5},
+        "topic_02": {"diet": 1.0, "salt": 0.8},
+    }
+    keys_a, keys_b, similarity = ga.topic_similarity(relevance, relevance)
+    assert keys_a == keys_b == ["topic_01", "topic_02"]
+    assert np.diag(similarity) == pytest.approx([1.0, 1.0])
+    assert ga.match_topics(similarity) == [(0, 0), (1, 1)]
@@ -0,0 +1,76 @@
+import generate_apps as ga
+
+
+def test_unchanged_outputs_are_skipped(tmp_path):
+    manifest = ga.BuildManifest(tmp_path)
+    assert manifest.write_text("index.html", "<p>one</p>")
+    manifest.save()
+
+    manifest = ga.BuildManifest(tmp_path)
+    assert not manifest.write_text("index.html", "<p>one</p>")
+    assert manifest.write_text("other.html", "<p>two</p>")
+    assert (manifest.written, manifest.skipped) == (1, 1)
+
+
+def test_changed_content_or_modified_output_is_rewritten(tmp_path):
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("index.html", "<p>one</p>")
+    manifest.save()
+
+    manifest = ga.BuildManifest(tmp_path)
+    assert manifest.write_text("index.html", "<p>changed</p>")
+    manifest.save()
+
+    (tmp_path / "index.html").write_text("edited by hand")
+    manifest = ga.BuildManifest(tmp_path)
+    assert manifest.write_text("index.html", "<p>changed</p>")
+    assert (tmp_path / "index.html").read_text() == "<p>changed</p>"
+
+
+def test_generate_renders_only_when_inputs_change(tmp_path):
+    source = tmp_path / "source.json"
+    source.write_text("{}")
+    out = tmp_path / "app"
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "data"
+
+    for _ in range(2):
+        manifest = ga.BuildManifest(out)
+        manifest.generate("data/x.json", inputs=[source], params={"n": 1}, render=render)
+        manifest.save()
+    assert len(calls) == 1
+
+    manifest = ga.BuildManifest(out)
+    manifest.generate("data/x.json", inputs=[source], params={"n": 2}, render=render)
+    assert len(calls) == 2
+
+
+def test_force_ignores_the_manifest(tmp_path):
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("index.html", "x")
+    manifest.save()
+
+    manifest = ga.BuildManifest(tmp_path, force=True)
+    assert manifest.write_text("index.html", "x")
+
+
+def test_group_removes_files_it_no_longer_produces(tmp_path):
+    source = tmp_path / "source.json"
+    source.write_text("{}")
+    out = tmp_path / "app"
+
+    manifest = ga.BuildManifest(out)
+    manifest.generate_group("shards", [source], {"n": 2}, lambda: {"a.json": "1", "b.json": "2"})
+    manifest.save()
+
+    manifest = ga.BuildManifest(out)
+    assert not manifest.generate_group("shards", [source], {"n": 2}, lambda: {})
+    manifest.save()
+
+    manifest = ga.BuildManifest(out)
+    assert manifest.generate_group("shards", [source], {"n": 1}, lambda: {"a.json": "1"})
+    assert (out / "a.json").exists()
+    assert not (out / "b.json").exists()
@@ -0,0 +1,67 @@
+import json
+import os
+
+import generate_apps as ga
+
+
+def write_app(site, name, topics=3):
+    app = site / name
+    (app / "data").mkdir(parents=True)
+    (app / "index.html").write_text("<html></html>")
+    relevance = {f"topic_{n:02d}": {"w": 1.0} for n in range(1, topics + 1)}
+    (app / "data" / "coherence_scores.json").write_text(json.dumps({"relevance": relevance}))
+
+
+def test_catalog_is_seeded_from_existing_apps(tmp_path):
+    write_app(tmp_path, "heart-failure-nmtf-3")
+    write_app(tmp_path, "nutrition-data-pnmf-4", topics=4)
+    (tmp_path / "notes").mkdir()
+
+    entries, pages = ga.read_catalog(tmp_path)
+    assert sorted(entries) == ["heart-failure-nmtf-3/", "nutrition-data-pnmf-4/"]
+    assert entries["nutrition-data-pnmf-4/"]["dataset"] == "nutrition_data"
+    assert entries["nutrition-data-pnmf-4/"]["topic_count"] == 4
+    assert pages == {}
+
+
+def test_links_to_apps_outside_the_catalog_are_kept(tmp_path):
+    write_app(tmp_path, "heart-failure-nmtf-3")
+    (tmp_path / "index.html").write_text(
+        '<a href="heart-failure-nmtf-3/">a</a> <a href="heart-failure-pnmf-43/"><b>Heart</b> PNMF</a> '
+        '<a href="https://x.org/">c</a>')
+
+    for _ in range(2):
+        ga.write_catalog([], site_dir=tmp_path)
+        index = tmp_path / "index.html"
+        assert ga.CATALOG_NAME in index.read_text()
+        links = ga.linked_apps(index)
+        assert sorted(links) == ["heart-failure-nmtf-3/", "heart-failure-pnmf-43/"]
+        assert links["heart-failure-pnmf-43/"] == "Heart PNMF"
+
+    write_app(tmp_path, "heart-failure-pnmf-43")
+    (tmp_path / ga.CATALOG_NAME).unlink()
+    ga.write_catalog([], site_dir=tmp_path)
+    assert "Other dashboards" not in (tmp_path / "index.html").read_text()
+
+
+def test_build_date_comes_from_the_manifest(tmp_path):
+    write_app(tmp_path, "heart-failure-nmtf-3")
+    app = tmp_path / "heart-failure-nmtf-3"
+    os.utime(app / "index.html", (0, 0))
+    os.utime(app / "data" / "coherence_scores.json", (0, 0))
+    entry = ga.scan_apps(tmp_path)["heart-failure-nmtf-3/"]
+    assert entry["built"] == "1970-01-01"
+
+    manifest = ga.BuildManifest(app)
+    manifest.write_text("js/app.js", "x")
+    manifest.save()
+    built = json.loads((app / ga.MANIFEST_NAME).read_text())["built"]
+    assert built[:10] != "1970-01-01"
+
+    # A rebuild that writes nothing keeps the timestamp, whatever the mtimes say
+    manifest = ga.BuildManifest(app)
+    manifest.built = "2020-01-01T00:00:00Z"
+    manifest.write_text("js/app.js", "x")
+    manifest.save()
+    os.utime(app / "js" / "app.js", None)
+    assert ga.scan_apps(tmp_path)["heart-failure-nmtf-3/"]["built"] == "2020-01-01"
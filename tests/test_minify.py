@@ -0,0 +1,51 @@
+import shutil
+import subprocess
+
+import pytest
+
+import generate_apps as ga
+
+SCRIPTS = {
+    "topics.js": ga.generate_topics_js(),
+    "app.js": ga.generate_app_js("topics.md"),
+    "charts.js": ga.generate_charts_js(12),
+}
+
+
+@pytest.mark.parametrize("name", sorted(SCRIPTS))
+def test_minify_js_is_idempotent(name):
+    once = ga.minify_js(SCRIPTS[name])
+    assert len(once) < len(SCRIPTS[name])
+    assert ga.minify_js(once) == once
+
+
+def test_minify_js_keeps_literals():
+    js = (
+        "const a = 'x  //  y';  // comment\n"
+        "const b = `a  ${ 1 +  2 }  b`;\n"
+        "/* block */ const c = /\\/\\*  x/g;\n"
+        "const d = a\n"
+        "+ b\n"
+    )
+    minified = ga.minify_js(js)
+    assert "'x  //  y'" in minified
+    assert "`a  ${1+2}  b`" in minified
+    assert "/\\/\\*  x/g" in minified
+    assert "comment" not in minified and "block" not in minified
+    # Line breaks survive, so automatic semicolon insertion is unchanged
+    assert "const d=a\n+b" in minified
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize("name", sorted(SCRIPTS))
+def test_minified_js_still_parses(name, tmp_path):
+    script = tmp_path / name
+    script.write_text(ga.minify_js(SCRIPTS[name]))
+    subprocess.run(["node", "--check", str(script)], check=True)
+
+
+def test_minify_css_drops_unused_classes():
+    css = ".keep { color: red; }\n/* note */\n.topic-label { margin: 0; }\n"
+    minified = ga.minify_css(css, ("topic-label",))
+    assert minified == ".keep{color:red}"
+    assert ga.minify_css(minified) == minified
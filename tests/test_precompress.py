@@ -0,0 +1,38 @@
+import generate_apps as ga
+
+
+def test_discard_removes_output_and_siblings(tmp_path):
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("sw.js", "self")
+    manifest.precompress()
+    manifest.save()
+    assert (tmp_path / "sw.js.gz").exists()
+
+    manifest = ga.BuildManifest(tmp_path)
+    assert manifest.discard("sw.js")
+    assert not (tmp_path / "sw.js").exists()
+    assert not (tmp_path / "sw.js.gz").exists()
+    assert not manifest.discard("never-built.js")
+
+
+def test_stale_siblings_are_removed(tmp_path):
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("index.html", "old")
+    manifest.write_text("app.js", "same")
+    manifest.precompress()
+    manifest.save()
+
+    # Rebuilt without precompression: no sibling may outlive its output's content
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("index.html", "new")
+    manifest.write_text("app.js", "same")
+    manifest.discard_stale_siblings()
+    manifest.save()
+    assert not (tmp_path / "index.html.gz").exists()
+    assert not (tmp_path / "app.js.gz").exists()
+
+    manifest = ga.BuildManifest(tmp_path)
+    manifest.write_text("index.html", "new")
+    manifest.precompress()
+    assert manifest.discard_stale_siblings() == 0
+    assert (tmp_path / "index.html.gz").exists()
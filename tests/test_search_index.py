@@ -0,0 +1,77 @@
+import bisect
+import json
+
+import generate_apps as ga
+
+WORDS = ["heart", "failure", "sodium", "diet", "potassium", "ejection", "fraction", "trial",
+         "cohort", "mortality", "hospital", "readmission", "café", "naïve", "intake", "fiber"]
+
+
+def make_top_docs(path, topics=6, docs=25):
+    top_docs = {}
+    for topic in range(1, topics + 1):
+        entries = {}
+        for doc in range(docs):
+            words = [WORDS[(topic * 7 + doc * (k + 3)) % len(WORDS)] for k in range(12)]
+            entries[f"doc-{topic}-{doc}"] = f"{' '.join(words)} ratio {topic}:{doc}:{(doc + 1) / docs:.3f}"
+        top_docs[f"Topic {topic}"] = entries
+    path.write_text(json.dumps(top_docs))
+    return top_docs
+
+
+def load_index(files):
+    index = json.loads(files["data/search/index.json"])
+    shards = [json.loads(files[f"data/search/{i:03d}.json"]) for i in range(len(index["shards"]))]
+    return index, shards
+
+
+def document_texts(top_docs):
+    """Document texts in global id order: topics by number, documents by score."""
+    texts = []
+    for key in sorted(top_docs, key=ga.topic_number):
+        docs = [ga.parse_document(doc_id, content) for doc_id, content in top_docs[key].items()]
+        texts += [doc["text"] for doc in sorted(docs, key=lambda doc: doc["score"], reverse=True)]
+    return texts
+
+
+def test_each_term_lives_in_the_shard_its_range_points_to(tmp_path, monkeypatch):
+    monkeypatch.setattr(ga, "SEARCH_SHARD_BYTES", 400)
+    make_top_docs(tmp_path / "top_docs.json")
+    index, shards = load_index(ga.render_search_index(tmp_path / "top_docs.json"))
+
+    assert len(shards) > 1
+    assert index["shards"] == sorted(index["shards"])
+    for number, shard in enumerate(shards):
+        assert min(shard) == index["shards"][number]
+        for term in shard:
+            assert bisect.bisect_right(index["shards"], term) - 1 == number
+
+
+def test_postings_decode_to_the_documents_containing_the_term(tmp_path):
+    top_docs = make_top_docs(tmp_path / "top_docs.json")
+    index, shards = load_index(ga.render_search_index(tmp_path / "top_docs.json"))
+    texts = document_texts(top_docs)
+
+    assert index["documents"] == len(texts) == sum(count for _, count in index["topics"])
+    assert [topic for topic, _ in index["topics"]] == list(range(1, 7))
+
+    for shard in shards:
+        for term, deltas in shard.items():
+            ids, total = [], 0
+            for delta in deltas:
+                total += delta
+                ids.append(total)
+            expected = [doc_id for doc_id, text in enumerate(texts) if term in ga.search_tokens(text)]
+            assert ids == expected, term
+
+
+def test_accented_terms_are_indexed_without_accents(tmp_path):
+    make_top_docs(tmp_path / "top_docs.json")
+    _, shards = load_index(ga.render_search_index(tmp_path / "top_docs.json"))
+    terms = {term for shard in shards for term in shard}
+    assert {"cafe", "naive"} <= terms
+    assert not {"café", "naïve", "the", "a"} & terms
+
+
+def test_search_tokens():
+    assert ga.search_tokens("Café-naïve HFpEF, 3.5mg") == ["cafe", "naive", "hfpef", "3", "5mg"]
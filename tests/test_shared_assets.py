@@ -0,0 +1,45 @@
+import json
+
+import generate_apps as ga
+
+
+class FakeResult:
+    def __init__(self, path, shared_assets):
+        self.path = str(path)
+        self.shared_assets = shared_assets
+
+
+def test_prune_shared_assets_keeps_files_of_every_app(tmp_path):
+    shared = tmp_path / "assets"
+    shared.mkdir()
+    for name in ("app.aaaaaaaaaaaa.js", "app.bbbbbbbbbbbb.js", "app.bbbbbbbbbbbb.js.gz",
+                 "app.cccccccccccc.js", "styles.dddddddddddd.css"):
+        (shared / name).write_text("x")
+    for app, used in (("one", "app.aaaaaaaaaaaa.js"), ("two", "app.cccccccccccc.js")):
+        (tmp_path / app).mkdir()
+        (tmp_path / app / "index.html").write_text(f'<script src="../assets/{used}"></script>')
+
+    # No ledger yet: app "two" is not rebuilt but keeps its file
+    removed = ga.prune_shared_assets(shared, [FakeResult(tmp_path / "one", ["app.aaaaaaaaaaaa.js"])])
+    assert removed == 3
+    assert sorted(p.name for p in shared.iterdir()) == [
+        ga.SHARED_ASSETS_LEDGER, "app.aaaaaaaaaaaa.js", "app.cccccccccccc.js"]
+
+    # Once the app is gone its files go too
+    (tmp_path / "two" / "index.html").unlink()
+    ga.prune_shared_assets(shared, [])
+    assert not (shared / "app.cccccccccccc.js").exists()
+    assert json.loads((shared / ga.SHARED_ASSETS_LEDGER).read_text()) == {"one": ["app.aaaaaaaaaaaa.js"]}
+
+
+def test_cache_headers_keep_other_rules(tmp_path):
+    shared = tmp_path / "assets"
+    shared.mkdir()
+    (tmp_path / "_headers").write_text("/*\n  X-Frame-Options: DENY\n\n/assets/*\n  Cache-Control: no-cache\n")
+
+    ga.write_cache_headers(shared)
+    ga.write_cache_headers(shared)
+    assert (tmp_path / "_headers").read_text() == (
+        "/*\n  X-Frame-Options: DENY\n\n"
+        f"/assets/*\n  Cache-Control: {ga.IMMUTABLE_CACHE_CONTROL}\n"
+    )
@@ -0,0 +1,11 @@
+import json
+
+import generate_apps as ga
+
+
+def test_term_index_lists_a_topic_once_per_term():
+    index = json.loads(ga.render_term_index({
+        "topic_01": {"HFpEF": 0.9, "hfpef": 0.5, "salt": 0.7},
+        "topic_02": {"hfpef": 0.3},
+    }))
+    assert index == {"hfpef": [[1, 1, 0.9], [2, 1, 0.3]], "salt": [[1, 2, 0.7]]}
@@ -0,0 +1,64 @@
+import math
+import random
+
+import generate_apps as ga
+
+
+def make_words(seed, count=40):
+    rng = random.Random(seed)
+    vocabulary = ["heart", "failure", "sodium", "ejection_fraction", "diet", "mortality", "trial",
+                  "hospitalization", "potassium", "cohort", "risk", "intake", "fiber", "age", "bmi"]
+    words = {}
+    while len(words) < count:
+        word = rng.choice(vocabulary) + str(len(words)) * rng.randint(0, 1)
+        words[word] = math.log(rng.uniform(0.001, 0.2))
+    return words
+
+
+def boxes(layout):
+    """Word boxes recomputed as wordcloud_layout sizes them."""
+    for word, x, y, size, vertical in layout:
+        text_w = sum(ga.HELVETICA_WIDTHS.get(ch, 667) for ch in word) / 1000 * size + 2
+        text_h = size * 1.05 + 2
+        box_w, box_h = (text_h, text_w) if vertical else (text_w, text_h)
+        yield x - box_w / 2, y - box_h / 2, x + box_w / 2, y + box_h / 2
+
+
+def test_layout_is_deterministic():
+    words = make_words(1)
+    assert ga.wordcloud_layout(words) == ga.wordcloud_layout(dict(reversed(list(words.items()))))
+
+
+def test_words_stay_inside_the_canvas_without_overlapping():
+    width, height = ga.WORDCLOUD_SVG_SIZE
+    tolerance = 0.5  # font sizes are rounded to 0.1 in the layout
+    for seed in range(5):
+        layout = ga.wordcloud_layout(make_words(seed))
+        assert layout
+        placed = list(boxes(layout))
+        for left, top, right, bottom in placed:
+            assert left >= -tolerance and top >= -tolerance
+            assert right <= width + tolerance and bottom <= height + tolerance
+        for i, a in enumerate(placed):
+            for b in placed[i + 1:]:
+                overlap_w = min(a[2], b[2]) - max(a[0], b[0])
+                overlap_h = min(a[3], b[3]) - max(a[1], b[1])
+                assert overlap_w <= tolerance or overlap_h <= tolerance
+
+
+def test_largest_word_comes_first_at_the_largest_size():
+    words = {"small": -5.0, "large": -1.0, "medium": -2.0}
+    layout = ga.wordcloud_layout(words)
+    assert layout[0][0] == "large"
+    assert layout[0][3] == ga.WORDCLOUD_FONT_SIZES[1]
+    assert [size for _, _, _, size, _ in layout] == sorted((size for _, _, _, size, _ in layout), reverse=True)
+
+
+def test_empty_topic_has_no_words():
+    assert ga.wordcloud_layout({}) == []
+
+
+def test_svg_escapes_words():
+    svg = ga.render_wordcloud_svg({"a<b": -1.0, "x&y": -2.0})
+    assert svg.startswith("<svg")
+    assert "a&lt;b" in svg and "x&amp;y" in svg